@@ -0,0 +1,85 @@
+# benchmarks/__main__.py
+"""
+Run the benchmark suite and check it against a baseline.
+
+Usage, from the repository root:
+
+    python -m benchmarks                     run and compare with the baseline
+    python -m benchmarks --save-baseline     run and record a new baseline
+    python -m benchmarks -k next_bytes       run only matching benchmarks
+    python -m benchmarks --quick -o run.json shorter runs, results to a file
+
+The exit status is 1 when a benchmark regressed beyond the threshold.
+"""
+import argparse
+import os
+import sys
+
+from .suite import DEFAULT_THRESHOLD, compare, load_results, run, save_results
+
+
+# Baseline compared against by default
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+
+def _format_rate(rate, unit):
+    """Format a rate with an SI prefix."""
+    for factor, prefix in [(1e9, 'G'), (1e6, 'M'), (1e3, 'k')]:
+        if rate >= factor:
+            return f"{rate / factor:8.2f} {prefix}{unit}"
+    return f"{rate:8.2f} {unit}"
+
+
+def _print_result(result):
+    """Print one finished benchmark."""
+    print(f"{result.name:<34} {_format_rate(result.rate, result.unit):>18} "
+          f"{result.peak_bytes / 1024:10.1f} KiB peak", flush=True)
+
+
+def main(argv=None):
+    """
+    Run the suite from the command line.
+
+    Parameters:
+        argv (list, optional): Arguments; defaults to sys.argv[1:].
+
+    Returns:
+        int: Exit status, 1 on regressions.
+    """
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__.split('\n')[1])
+    parser.add_argument('-k', dest='pattern', help="only run benchmarks whose name contains this")
+    parser.add_argument('-o', '--output', help="write the results to this JSON file")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="store the results as the new baseline instead of comparing")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="tolerated relative slowdown or memory growth")
+    parser.add_argument('--repeat', type=int, default=5, help="timed batches per benchmark")
+    parser.add_argument('--quick', action='store_true', help="short batches, for smoke tests")
+    args = parser.parse_args(argv)
+
+    min_time = 0.02 if args.quick else 0.2
+    repeat = 1 if args.quick else args.repeat
+    results = run(args.pattern, repeat=repeat, min_time=min_time, report=_print_result)
+    if args.output:
+        save_results(args.output, results)
+
+    if args.save_baseline:
+        save_results(args.baseline, results)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; record one with --save-baseline")
+        return 0
+
+    regressions = compare(load_results(args.baseline), results, args.threshold)
+    for name, metric, before, after in regressions:
+        print(f"REGRESSION {name}: {metric} {before:.4g} -> {after:.4g} "
+              f"({after / before - 1:+.1%})")
+    if not regressions:
+        print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
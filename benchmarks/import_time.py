@@ -0,0 +1,99 @@
+# benchmarks/import_time.py
+"""
+Import-time benchmark: cost of importing the package in a fresh interpreter.
+
+Runs `python -X importtime -c "import src"` several times and reports the
+best total import time and the time spent in the package's own modules,
+then checks that the own time stays within a budget and that none of the
+heavy optional dependencies were loaded. The total also counts standard
+library modules such as collections and functools, which most programs
+have imported already.
+
+Run from the repository root with:
+
+    python -m benchmarks.import_time [runs]
+
+The exit status is 1 when the budget is exceeded or a heavy module loads.
+"""
+import os
+import subprocess
+import sys
+from collections import namedtuple
+
+
+# Package measured and the repository root it is imported from
+PACKAGE = 'src'
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Largest accepted time spent in the package's own modules, in seconds
+IMPORT_BUDGET = 0.003
+
+# Modules that importing the package must not load
+HEAVY_MODULES = ['numpy', 'concurrent.futures', 'multiprocessing', 'asyncio']
+
+# Best total and package-own import time in seconds, and the loaded modules
+ImportTime = namedtuple('ImportTime', ['total', 'own', 'modules'])
+
+
+def measure_import(package=PACKAGE, runs=5):
+    """
+    Measure the import of a package in fresh interpreters.
+
+    Parameters:
+        package (str): The package to import.
+        runs (int): Number of interpreters started; the fastest counts.
+
+    Returns:
+        ImportTime: The measurement.
+    """
+    best = None
+    for _ in range(runs):
+        code = f"import sys, {package}; print('\\n'.join(sys.modules))"
+        process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                                 cwd=ROOT, capture_output=True, text=True, check=True)
+        total = own = 0
+        for line in process.stderr.splitlines():
+            if not line.startswith('import time:') or 'self [us]' in line:
+                continue
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+            name = name.strip()
+            if name == package:
+                total = int(cumulative_us)
+            if name == package or name.startswith(package + '.'):
+                own += int(self_us)
+        result = ImportTime(total / 1e6, own / 1e6, set(process.stdout.split()))
+        if best is None or result.own < best.own:
+            best = result
+    return best
+
+
+def main(argv=None):
+    """
+    Measure the package import and check it against the budget.
+
+    Parameters:
+        argv (list, optional): Arguments; defaults to sys.argv[1:].
+
+    Returns:
+        int: Exit status, 1 when the budget is exceeded or a heavy module
+             was imported.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    runs = int(argv[0]) if argv else 5
+    result = measure_import(runs=runs)
+    print(f"import {PACKAGE}: {result.total * 1e3:.2f} ms total, "
+          f"{result.own * 1e3:.2f} ms in the package (budget {IMPORT_BUDGET * 1e3:.1f} ms)")
+
+    status = 0
+    if result.own > IMPORT_BUDGET:
+        print("Import time exceeds the budget")
+        status = 1
+    for module in HEAVY_MODULES:
+        if module in result.modules:
+            print(f"Importing {PACKAGE} loads {module}")
+            status = 1
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,85 @@
+# benchmarks/memory.py
+"""
+Memory benchmark: bytes per live register.
+
+Builds a large population of registers and reports the traced memory per
+instance, comparing the former dictionary-based GeneralLFSR layout with
+the __slots__ layout and clones of one register.
+
+Run from the repository root with:
+
+    python -m benchmarks.memory [count]
+"""
+import sys
+import tracemalloc
+
+from src.basic_lfsr import BasicLFSR
+from src.general_lfsr import GeneralLFSR
+
+
+class _DictLFSR:
+    """The per-instance attributes GeneralLFSR used to keep in __dict__."""
+
+    def __init__(self, size=4, taps=None, seed=0b0110):
+        self.size = size
+        self.max_value = (1 << size) - 1
+        self.state = seed
+        self.taps = list(taps) if taps else [size-1, 0]
+
+
+def bytes_per_instance(factory, count):
+    """
+    Measure the memory one instance takes in a population.
+
+    Parameters:
+        factory (callable): Called with the instance index, returns an instance.
+        count (int): Number of instances to keep alive.
+
+    Returns:
+        float: Traced bytes per instance, excluding the list holding them.
+    """
+    population = [None] * count
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    for i in range(count):
+        population[i] = factory(i)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (current - start) / count
+
+
+def run(count=200_000, size=32, taps=(31, 21, 1, 0)):
+    """
+    Measure bytes per instance for every register layout.
+
+    Parameters:
+        count (int): Population size.
+        size (int): Register size for the GeneralLFSR layouts.
+        taps (tuple): Feedback taps for the GeneralLFSR layouts.
+
+    Returns:
+        dict: Bytes per instance keyed by layout name.
+    """
+    seed = (1 << size) - 3
+    prototype = GeneralLFSR(size=size, taps=list(taps), seed=seed)
+    return {
+        'GeneralLFSR (dict, before)': bytes_per_instance(
+            lambda i: _DictLFSR(size=size, taps=taps, seed=seed ^ i), count),
+        'GeneralLFSR (__slots__)': bytes_per_instance(
+            lambda i: GeneralLFSR(size=size, taps=list(taps), seed=seed ^ i), count),
+        'GeneralLFSR.clone()': bytes_per_instance(lambda i: prototype.clone(), count),
+        'BasicLFSR (__slots__)': bytes_per_instance(lambda i: BasicLFSR(), count),
+    }
+
+
+def main(argv=None):
+    """Print the bytes per instance of every layout."""
+    argv = sys.argv[1:] if argv is None else argv
+    count = int(argv[0]) if argv else 200_000
+    print(f"Bytes per live register, {count} registers")
+    for name, value in run(count).items():
+        print(f"  {name:<28} {value:8.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,303 @@
+# benchmarks/suite.py
+"""
+Throughput and memory benchmarks for the LFSR hot paths.
+
+Every benchmark measures a rate (bits, bytes or operations per second,
+best of several repeats) and the peak traced memory of one call, and
+results are kept as JSON so runs can be compared against a baseline.
+"""
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+
+from src import gf2
+from src.catalogue import catalogue_sizes, primitive_taps
+from src.cipher import StreamCipher
+from src.general_lfsr import GeneralLFSR
+from src.large_lfsr import LargeLFSR
+from src.table_lfsr import TableLFSR
+from src.utils import (bits_to_bytes, compute_period, find_cycle, is_maximum_length,
+                       pack_bits, unpack_bits)
+
+
+# Version of the results file layout
+FORMAT_VERSION = 1
+
+# Relative slowdown (or memory growth) reported as a regression
+DEFAULT_THRESHOLD = 0.25
+
+# A benchmark: name, unit of the rate and a factory returning
+# (function, units of work per call)
+Benchmark = namedtuple('Benchmark', ['name', 'unit', 'factory'])
+
+# Measured rate and peak traced memory of one benchmark
+Result = namedtuple('Result', ['name', 'unit', 'rate', 'peak_bytes'])
+
+# Register sizes covered by the per-bit and bulk benchmarks
+SIZES = [4, 64, 1024, 4096]
+
+# Register sizes covered by the per-bit benchmarks of LargeLFSR
+LARGE_SIZES = [1024, 4096, 1 << 16]
+
+
+def _register(size, taps=None, cls=GeneralLFSR):
+    """
+    Return a register of a given size with the given taps, else catalogued
+    ones, else low pentanomial-shaped taps (throughput does not depend on
+    primitivity).
+    """
+    if taps is None:
+        taps = primitive_taps(size) if size in catalogue_sizes() else [5, 3, 2, 0]
+    return cls(size=size, taps=taps, seed=(1 << size) - 3)
+
+
+def _per_bit(size, cls=GeneralLFSR):
+    lfsr = _register(size, cls=cls)
+
+    def run():
+        next_bit = lfsr.next_bit
+        for _ in range(1000):
+            next_bit()
+    return run, 1000
+
+
+def _bulk(size, nbytes=1 << 16, taps=None):
+    lfsr = _register(size, taps)
+    return (lambda: lfsr.next_bytes(nbytes)), nbytes
+
+
+def _table(size, nbytes=1 << 12):
+    lfsr = TableLFSR(size=size, taps=primitive_taps(size), seed=1)
+    return (lambda: lfsr.next_bytes(nbytes)), nbytes
+
+
+def _skip(size):
+    lfsr = _register(size)
+    return (lambda: lfsr.skip((1 << 40) + 1)), 1
+
+
+def _bits_to_bytes():
+    bits = _register(64).next_bits(1 << 16)
+    return (lambda: bits_to_bytes(bits)), len(bits) // 8
+
+
+def _pack_bits():
+    bits = bytes(_register(64).next_bits(1 << 20))
+    return (lambda: pack_bits(bits)), len(bits) // 8
+
+
+def _unpack_bits():
+    data = _register(64).next_bytes(1 << 17)
+    return (lambda: unpack_bits(data)), len(data)
+
+
+def _is_maximum_length(size):
+    lfsr = _register(size)
+
+    def run():
+        # Measure the full algebraic check, not the per-polynomial caches
+        gf2._doubling_powers.cache_clear()
+        is_maximum_length(lfsr)
+    return run, 1
+
+
+def _compute_period(size):
+    lfsr = _register(size)
+
+    def run():
+        gf2._doubling_powers.cache_clear()
+        compute_period(lfsr)
+    return run, 1
+
+
+def _find_cycle(size):
+    lfsr = _register(size)
+    return (lambda: find_cycle(lfsr)), 1
+
+
+def _cipher(nbytes=1 << 20):
+    cipher = StreamCipher(0xACE1, size=64)
+    data = bytes(nbytes)
+    return (lambda: cipher.encrypt(data)), nbytes
+
+
+def all_benchmarks():
+    """
+    List every benchmark of the suite.
+
+    Returns:
+        list: Benchmark tuples.
+    """
+    benchmarks = []
+    for size in SIZES:
+        benchmarks.append(Benchmark(f'next_bit/size={size}', 'bits/s',
+                                    lambda size=size: _per_bit(size)))
+    for size in LARGE_SIZES:
+        benchmarks.append(Benchmark(f'large_next_bit/size={size}', 'bits/s',
+                                    lambda size=size: _per_bit(size, LargeLFSR)))
+    for size in SIZES:
+        benchmarks.append(Benchmark(f'next_bytes/size={size}', 'bytes/s',
+                                    lambda size=size: _bulk(size)))
+    for count in [2, 4, 8, 16]:
+        taps = list(range(63, 63 - count + 1, -1)) + [0]
+        benchmarks.append(Benchmark(f'next_bytes/size=64/taps={count}', 'bytes/s',
+                                    lambda taps=taps: _bulk(64, taps=taps)))
+    for size, count in [(256, 128), (1024, 64), (4096, 200)]:
+        # Dense taps including size - 1, the short span worst case of the
+        # doubling steps, on a short request
+        taps = list(range(size - 1, 0, -(size // count))) + [0]
+        benchmarks.append(Benchmark(f'next_bytes/size={size}/dense', 'bytes/s',
+                                    lambda size=size, taps=taps: _bulk(size, 2500, taps)))
+    benchmarks += [
+        Benchmark('table_next_bytes/size=64', 'bytes/s', lambda: _table(64)),
+        Benchmark('skip/size=1024', 'ops/s', lambda: _skip(1024)),
+        Benchmark('bits_to_bytes', 'bytes/s', _bits_to_bytes),
+        Benchmark('pack_bits', 'bytes/s', _pack_bits),
+        Benchmark('unpack_bits', 'bytes/s', _unpack_bits),
+        Benchmark('is_maximum_length/size=1279', 'ops/s', lambda: _is_maximum_length(1279)),
+        Benchmark('compute_period/size=64', 'ops/s', lambda: _compute_period(64)),
+        Benchmark('find_cycle/size=12', 'ops/s', lambda: _find_cycle(12)),
+        Benchmark('cipher_encrypt/size=64', 'bytes/s', _cipher),
+    ]
+    return benchmarks
+
+
+def measure(benchmark, repeat=5, min_time=0.2):
+    """
+    Measure the rate and peak memory of one benchmark.
+
+    The function is called in batches that last at least min_time, and the
+    fastest of `repeat` batches gives the rate. The peak memory is traced
+    in a separate call, so tracing does not slow down the timing.
+
+    Parameters:
+        benchmark (Benchmark): The benchmark.
+        repeat (int): Number of timed batches.
+        min_time (float): Minimum duration of a batch in seconds.
+
+    Returns:
+        Result: The measurement.
+    """
+    function, units = benchmark.factory()
+
+    # Warm up lazy imports and caches, then calibrate the calls per batch
+    function()
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        calls *= 2 if elapsed <= 0 else max(2, int(min_time / elapsed) + 1)
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return Result(benchmark.name, benchmark.unit, units * calls / best, peak)
+
+
+def run(pattern=None, repeat=5, min_time=0.2, report=None):
+    """
+    Run the benchmarks whose name contains a pattern.
+
+    Parameters:
+        pattern (str, optional): Substring selecting benchmarks; all if None.
+        repeat (int): Timed batches per benchmark.
+        min_time (float): Minimum duration of a batch in seconds.
+        report (callable, optional): Called with each Result as it finishes.
+
+    Returns:
+        dict: Results file contents, with the Result fields per benchmark name.
+    """
+    results = {}
+    for benchmark in all_benchmarks():
+        if pattern is not None and pattern not in benchmark.name:
+            continue
+        result = measure(benchmark, repeat, min_time)
+        if report is not None:
+            report(result)
+        results[result.name] = {'unit': result.unit, 'rate': result.rate,
+                                'peak_bytes': result.peak_bytes}
+    return {
+        'version': FORMAT_VERSION,
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results,
+    }
+
+
+def load_results(path):
+    """
+    Read a results file.
+
+    Parameters:
+        path (str): The JSON file.
+
+    Returns:
+        dict: The results file contents.
+
+    Raises:
+        ValueError: If the file has an unknown format version.
+    """
+    with open(path) as handle:
+        data = json.load(handle)
+    if data.get('version') != FORMAT_VERSION:
+        raise ValueError(f"Unsupported benchmark results version in {path}")
+    return data
+
+
+def save_results(path, data):
+    """
+    Write a results file.
+
+    Parameters:
+        path (str): The JSON file.
+        data (dict): Results as returned by run().
+    """
+    with open(path, 'w') as handle:
+        json.dump(data, handle, indent=2, sort_keys=True)
+        handle.write('\n')
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare two runs benchmark by benchmark.
+
+    A benchmark regresses when its rate drops below (1 - threshold) times
+    the baseline or its peak memory grows beyond (1 + threshold) times the
+    baseline. Benchmarks missing from either run are skipped.
+
+    Parameters:
+        baseline (dict): Results of the reference run.
+        current (dict): Results of the new run.
+        threshold (float): Tolerated relative change.
+
+    Returns:
+        list: (name, metric, baseline value, current value) for every
+              regression.
+    """
+    regressions = []
+    for name, result in current['results'].items():
+        reference = baseline['results'].get(name)
+        if reference is None:
+            continue
+        if result['rate'] < reference['rate'] * (1 - threshold):
+            regressions.append((name, 'rate', reference['rate'], result['rate']))
+        if result['peak_bytes'] > reference['peak_bytes'] * (1 + threshold):
+            regressions.append((name, 'peak_bytes', reference['peak_bytes'],
+                                result['peak_bytes']))
+    return regressions
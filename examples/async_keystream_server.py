@@ -0,0 +1,124 @@
+# examples/async_keystream_server.py
+"""
+Example asyncio keystream server.
+
+Every TCP session gets its own random seed for a maximum-length LFSR. The
+client sends the number of bytes it wants on one line; the server answers
+with a "SEED <hex>" line followed by the raw keystream, streamed through
+AsyncLFSRStream so generation runs off the event loop and follows the
+client's reading speed.
+
+Run without arguments for a loopback demo with several concurrent
+clients, or with --serve [port] to keep the server running.
+"""
+import asyncio
+import secrets
+import sys
+import time
+from pathlib import Path
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.general_lfsr import GeneralLFSR
+from src.stream import AsyncLFSRStream
+
+
+# Register size used for every session
+SIZE = 64
+
+# Largest keystream a client may request
+MAX_REQUEST = 1 << 30
+
+
+async def handle_session(reader, writer):
+    """
+    Serve one client: read the request, send the seed and the keystream.
+
+    Parameters:
+        reader (asyncio.StreamReader): The client connection, read side.
+        writer (asyncio.StreamWriter): The client connection, write side.
+    """
+    try:
+        line = await reader.readline()
+        nbytes = int(line)
+        if not 0 <= nbytes <= MAX_REQUEST:
+            raise ValueError(f"Request must be between 0 and {MAX_REQUEST} bytes")
+    except ValueError as error:
+        writer.write(f"ERROR {error}\n".encode('ascii'))
+        writer.close()
+        return
+
+    seed = secrets.randbits(SIZE) or 1
+    writer.write(f"SEED {seed:x}\n".encode('ascii'))
+    async with AsyncLFSRStream(GeneralLFSR.maximal(SIZE, seed=seed), length=nbytes) as stream:
+        try:
+            await stream.copy_to(writer)
+        except ConnectionError:
+            pass
+    writer.close()
+    await writer.wait_closed()
+
+
+async def fetch(host, port, nbytes):
+    """
+    Request keystream from the server and check it against a local LFSR.
+
+    Parameters:
+        host (str): Server address.
+        port (int): Server port.
+        nbytes (int): Number of bytes to request.
+
+    Returns:
+        tuple: (seed, whether the keystream matched).
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"{nbytes}\n".encode('ascii'))
+    await writer.drain()
+    header = await reader.readline()
+    seed = int(header.split()[1], 16)
+    keystream = await reader.readexactly(nbytes)
+    writer.close()
+    await writer.wait_closed()
+    expected = GeneralLFSR.maximal(SIZE, seed=seed).next_bytes(nbytes)
+    return seed, keystream == expected
+
+
+async def demo(clients=8, nbytes=1 << 20):
+    """Serve several concurrent loopback clients and verify their keystreams."""
+    server = await asyncio.start_server(handle_session, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    print(f"Keystream server listening on 127.0.0.1:{port}")
+    async with server:
+        start = time.perf_counter()
+        results = await asyncio.gather(*(fetch('127.0.0.1', port, nbytes) for _ in range(clients)))
+        elapsed = time.perf_counter() - start
+    for seed, matched in results:
+        print(f"  session seed {seed:016x}: {'OK' if matched else 'MISMATCH'}")
+    total = clients * nbytes
+    print(f"Served {total} bytes to {clients} clients in {elapsed:.2f} s "
+          f"({total / elapsed / 1e6:.1f} MB/s)")
+
+
+async def serve(port=8765):
+    """Run the keystream server until interrupted."""
+    server = await asyncio.start_server(handle_session, '127.0.0.1', port)
+    print(f"Keystream server listening on 127.0.0.1:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    """Run the loopback demo, or the server with --serve [port]."""
+    if len(sys.argv) > 1 and sys.argv[1] == '--serve':
+        port = int(sys.argv[2]) if len(sys.argv) > 2 else 8765
+        try:
+            asyncio.run(serve(port))
+        except KeyboardInterrupt:
+            pass
+    else:
+        asyncio.run(demo())
+
+
+if __name__ == "__main__":
+    main()
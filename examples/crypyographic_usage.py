@@ -4,13 +4,13 @@ Example demonstrating a simple cryptographic application of LFSRs.
 """
 import sys
 from pathlib import Path
-import time
 
 # Add the src directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.general_lfsr import GeneralLFSR
-from src.utils import bits_to_bytes
+from src.catalogue import primitive_taps
+from src.cipher import StreamCipher
+from src.utils import unpack_bits
 
 
 class SimpleStreamCipher:
@@ -19,6 +19,11 @@ class SimpleStreamCipher:
     
     WARNING: This is for educational purposes only and should NOT be used
     for actual encryption, as simple LFSRs are not cryptographically secure.
+    
+    The keystream position runs on across messages, so no two messages
+    are XORed with the same keystream. Sender and receiver each hold a
+    cipher with the same key and stay in step by handling the messages in
+    order, or the receiver seeks to the offset the sender reports.
     """
     
     def __init__(self, key, size=16):
@@ -29,31 +34,35 @@ class SimpleStreamCipher:
             key (int): The key to use for the cipher (used as seed).
             size (int): The size of the LFSR in bits.
         """
-        # Create LFSR with key as seed
-        # Using a common primitive polynomial for the given size
-        if size == 8:
-            taps = [7, 5, 3, 0]  # x^8 + x^6 + x^4 + x + 1
-        elif size == 16:
-            taps = [15, 14, 12, 3]  # x^16 + x^15 + x^13 + x^4 + 1
-        elif size == 32:
-            taps = [31, 30, 28, 1]  # x^32 + x^31 + x^29 + x^2 + 1
-        else:
-            # Default to x^n + x + 1
-            taps = [size-1, 0]
-            
-        self.lfsr = GeneralLFSR(size=size, taps=taps, seed=key)
+        # Create LFSR with key as seed, using a catalogued primitive
+        # polynomial so the keystream has the maximum period for the size
+        self.cipher = StreamCipher(key, size=size, taps=primitive_taps(size))
+        self.lfsr = self.cipher.lfsr
     
     def generate_keystream(self, length):
         """
         Generate a keystream of the specified length.
         
+        The keystream is taken from the cipher in whole bytes, so it is
+        never handed out again for a later message.
+        
         Parameters:
             length (int): The number of bits to generate.
             
         Returns:
             list: A list of bits.
         """
-        return [self.lfsr.next_bit() for _ in range(length)]
+        keystream = self.cipher.keystream((length + 7) // 8)
+        return list(unpack_bits(keystream, count=length))
+    
+    def tell(self):
+        """
+        Return the keystream offset the next message will start at.
+        
+        Returns:
+            int: The byte offset.
+        """
+        return self.cipher.tell()
     
     def encrypt(self, plaintext):
         """
@@ -65,20 +74,52 @@ class SimpleStreamCipher:
         Returns:
             bytes: The encrypted data.
         """
-        # Convert plaintext to bytes
-        plaintext_bytes = plaintext.encode('utf-8')
-        
-        # Generate keystream of sufficient length (8 bits per byte)
-        keystream = self.generate_keystream(len(plaintext_bytes) * 8)
-        
-        # Convert keystream to bytes
-        keystream_bytes = bits_to_bytes(keystream)
-        
-        # XOR plaintext with keystream
-        ciphertext = bytes(p ^ k for p, k in zip(plaintext_bytes, keystream_bytes))
+        # Each message continues the keystream where the last one ended
+        return self.cipher.encrypt(plaintext.encode('utf-8'))
+    
+    def decrypt(self, ciphertext, offset=None):
+        """
+        Decrypt data produced by encrypt().
         
-        return ciphertext
+        Parameters:
+            ciphertext (bytes): The encrypted data.
+            offset (int, optional): Keystream offset the message was
+                                    encrypted at, as reported by the
+                                    sender's tell(). If None, continues
+                                    from the previous message.
+            
+        Returns:
+            str: The decrypted text.
+        """
+        # XOR with the same keystream restores the plaintext
+        if offset is not None:
+            self.cipher.seek(offset)
+        return self.cipher.decrypt(ciphertext).decode('utf-8')
+
+
+def main():
+    """Demonstrate encrypting and decrypting a message."""
+    print("LFSR Stream Cipher Example")
+    print("--------------------------")
+    
+    sender = SimpleStreamCipher(key=0xACE1, size=16)
+    receiver = SimpleStreamCipher(key=0xACE1, size=16)
+    message = "Linear feedback shift registers are not secure ciphers."
+    
+    # The same message twice gives different ciphertexts, as the second
+    # one uses the next stretch of keystream
+    for _ in range(2):
+        offset = sender.tell()
+        ciphertext = sender.encrypt(message)
+        print(f"Offset:     {offset}")
+        print(f"Plaintext:  {message}")
+        print(f"Ciphertext: {ciphertext.hex()}")
+        print(f"Decrypted:  {receiver.decrypt(ciphertext)}")
     
-    def decrypt(self, cipherte):
-        '''
-        '''
\ No newline at end of file
+    # A receiver that missed messages seeks to the reported offset
+    late = SimpleStreamCipher(key=0xACE1, size=16)
+    print(f"Decrypted at offset {offset}: {late.decrypt(ciphertext, offset)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,55 @@ Linear Feedback Shift Register (LFSR) Implementation Package
 
 This package provides implementations of Linear Feedback Shift Registers
 for use in cryptography, random number generation, and digital signal processing.
-"""
 
+Only the core registers are imported with the package. The heavier
+subsystems (the NumPy bank, the randomness analysis, the primitive
+polynomial catalogue and multi-process generation) load on first access,
+so importing the package does not import NumPy.
+"""
 from .basic_lfsr import BasicLFSR
 from .general_lfsr import GeneralLFSR
 
-__all__ = ['BasicLFSR', 'GeneralLFSR']
\ No newline at end of file
+# Lazily loaded submodules, and names exported from them
+_LAZY_MODULES = {'bank', 'analysis', 'catalogue', 'parallel'}
+_LAZY_ATTRIBUTES = {
+    'LFSRBank': 'bank',
+    'analyze': 'analysis',
+    'primitive_taps': 'catalogue',
+    'parallel_generate': 'parallel',
+}
+
+__all__ = ['BasicLFSR', 'GeneralLFSR'] + sorted(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    """
+    Import a lazily loaded submodule or attribute on first access.
+
+    Parameters:
+        name (str): The attribute name.
+
+    Returns:
+        The submodule or the attribute it defines.
+
+    Raises:
+        AttributeError: If the package has no such attribute.
+    """
+    import importlib
+    if name in _LAZY_MODULES:
+        return importlib.import_module(f'.{name}', __name__)
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(f'.{_LAZY_ATTRIBUTES[name]}', __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """
+    List the package attributes, including the lazily loaded ones.
+
+    Returns:
+        list: Attribute names.
+    """
+    return sorted(set(globals()) | _LAZY_MODULES | set(_LAZY_ATTRIBUTES))
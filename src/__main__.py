@@ -0,0 +1,190 @@
+# src/__main__.py
+"""
+Command-line keystream generator.
+
+Writes the keystream of a Fibonacci LFSR to stdout or a file, in large
+buffered writes so it can feed dd, test harnesses or compressors:
+
+    python -m src --size 64 --seed 0xACE1 --bytes 1G | dd of=keystream.bin
+    python -m src --size 16 --taps 14,13,11,0 --bytes 32 --format hex
+    python -m src --size 127 --skip 1000000 --workers 4 -o keystream.bin
+
+Without --taps the register uses the catalogued primitive polynomial of its
+size; without --bytes output continues until the reader closes the pipe.
+--period and --check-primitive print facts about the register instead,
+computed algebraically rather than by walking its states. Both need prime
+factors of numbers 2^d - 1, and when those are out of reach they print
+"unknown" and exit with status 2.
+"""
+import argparse
+import os
+import sys
+
+from .general_lfsr import GeneralLFSR
+from .utils import FACTOR_STEPS
+
+
+# Bytes generated per write
+CHUNK_SIZE = 1 << 20
+
+# Bytes generated per worker and write when generating in parallel
+WORKER_CHUNK_SIZE = 1 << 23
+
+# Multipliers of the size suffixes accepted by --bytes and --skip
+_SUFFIXES = {'k': 1 << 10, 'm': 1 << 20, 'g': 1 << 30, 't': 1 << 40}
+
+
+def _count(text):
+    """Parse a non-negative count with an optional k/M/G/T suffix."""
+    multiplier = _SUFFIXES.get(text[-1:].lower(), 1)
+    digits = text[:-1] if multiplier > 1 else text
+    try:
+        value = int(digits, 0) * multiplier
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid count: {text!r}")
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"count must be non-negative: {text!r}")
+    return value
+
+
+def _taps(text):
+    """Parse comma-separated tap positions."""
+    try:
+        return [int(tap) for tap in text.split(',')]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid taps: {text!r}")
+
+
+def _format_chunk(data, output_format):
+    """Render generated bytes in the output format."""
+    if output_format == 'hex':
+        return data.hex().encode('ascii')
+    if output_format == 'bits':
+        # Most significant bit of every byte first, like bits_to_bytes()
+        return format(int.from_bytes(data, 'big'), f'0{8 * len(data)}b').encode('ascii')
+    return data
+
+
+def _generate(lfsr, out, nbytes, workers, output_format):
+    """Write nbytes of keystream (endless if None) to a binary stream."""
+    if workers > 1:
+        from .parallel import parallel_generate
+        chunk = workers * WORKER_CHUNK_SIZE
+
+        def produce(n):
+            return parallel_generate(lfsr, n, workers)
+    else:
+        chunk = CHUNK_SIZE
+        produce = lfsr.next_bytes
+
+    remaining = nbytes
+    while remaining is None or remaining > 0:
+        n = chunk if remaining is None else min(chunk, remaining)
+        out.write(_format_chunk(produce(n), output_format))
+        if remaining is not None:
+            remaining -= n
+    if output_format != 'raw':
+        out.write(b'\n')
+    out.flush()
+
+
+def build_parser():
+    """
+    Build the argument parser of the command line.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+    parser = argparse.ArgumentParser(prog='python -m src', description=__doc__.split('\n')[1],
+                                     epilog="Counts accept k, M, G and T suffixes.")
+    parser.add_argument('--size', type=int, default=64, help="register size in bits (default 64)")
+    parser.add_argument('--taps', type=_taps,
+                        help="comma-separated tap positions; default: catalogued primitive taps")
+    parser.add_argument('--seed', type=lambda text: int(text, 0), default=1,
+                        help="initial state, decimal or 0x-prefixed hex (default 1)")
+    parser.add_argument('--skip', type=_count, default=0, metavar='N',
+                        help="jump ahead N steps before generating")
+    parser.add_argument('--bytes', type=_count, dest='nbytes', metavar='N',
+                        help="number of bytes to generate; endless if omitted")
+    parser.add_argument('--workers', type=int, default=1, metavar='K',
+                        help="generate with K processes (default 1)")
+    parser.add_argument('--format', choices=['raw', 'hex', 'bits'], default='raw',
+                        help="output format (default raw)")
+    parser.add_argument('-o', '--output', help="output file; default stdout")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--period', action='store_true',
+                      help="print the period of the output sequence and exit; "
+                           "exit status 2 if it cannot be determined")
+    mode.add_argument('--check-primitive', action='store_true',
+                      help="report whether the feedback polynomial is primitive; "
+                           "exit status 1 if not, 2 if it cannot be determined")
+    parser.add_argument('--factor-steps', type=_count, default=FACTOR_STEPS, metavar='N',
+                        help="rho iterations allowed per factor of 2^d - 1 for --period "
+                             f"and --check-primitive (default {FACTOR_STEPS})")
+    return parser
+
+
+def main(argv=None):
+    """
+    Run the command line.
+
+    Parameters:
+        argv (list, optional): Arguments; defaults to sys.argv[1:].
+
+    Returns:
+        int: Exit status.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.size < 1:
+        parser.error("size must be at least 1")
+    if args.workers < 1:
+        parser.error("workers must be at least 1")
+    if args.seed < 0:
+        parser.error("seed must be non-negative")
+
+    try:
+        if args.taps is None:
+            lfsr = GeneralLFSR.maximal(args.size, seed=args.seed)
+        else:
+            lfsr = GeneralLFSR(size=args.size, taps=args.taps, seed=args.seed)
+    except ValueError as error:
+        parser.error(str(error))
+
+    if args.period:
+        from .utils import compute_period
+        try:
+            print(compute_period(lfsr, args.factor_steps))
+        except ArithmeticError:
+            print("unknown: the period needs a factorization out of reach")
+            return 2
+        return 0
+    if args.check_primitive:
+        from .gf2 import feedback_polynomial, is_primitive
+        description = f"size {lfsr.size}, taps {','.join(map(str, lfsr.taps))}"
+        try:
+            primitive = is_primitive(feedback_polynomial(lfsr.size, lfsr.taps), args.factor_steps)
+        except ArithmeticError:
+            print(f"unknown: {description}; factoring 2^{lfsr.size} - 1 is out of reach")
+            return 2
+        print(f"{'primitive' if primitive else 'not primitive'}: {description}")
+        return 0 if primitive else 1
+
+    lfsr.skip(args.skip)
+    if args.output:
+        with open(args.output, 'wb') as out:
+            _generate(lfsr, out, args.nbytes, args.workers, args.format)
+        return 0
+
+    try:
+        _generate(lfsr, sys.stdout.buffer, args.nbytes, args.workers, args.format)
+    except BrokenPipeError:
+        # The reader went away, which is how endless output normally ends;
+        # send the remaining buffered output to devnull so exit stays quiet
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
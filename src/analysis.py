@@ -0,0 +1,479 @@
+# src/analysis.py
+"""
+Statistical randomness tests over LFSR output.
+
+Frequency, runs, serial, autocorrelation, linear complexity and spectral
+tests in the style of NIST SP 800-22, computed with NumPy kernels over
+packed byte streams. Input is consumed chunk by chunk, so memory stays
+bounded however many bits are tested.
+"""
+import math
+from collections import namedtuple
+
+import numpy as np
+
+from .stream import iter_bytes
+from .synthesis import linear_complexity
+
+
+# Bytes requested from an LFSR per chunk
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Names of the tests run by default, in report order
+DEFAULT_TESTS = ('frequency', 'runs', 'serial', 'autocorrelation',
+                 'linear_complexity', 'spectral')
+
+# Number of set bits in every byte value
+_BYTE_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+# Probabilities of the seven linear complexity classes (NIST SP 800-22 2.10)
+_COMPLEXITY_CLASSES = (0.010417, 0.03125, 0.125, 0.5, 0.25, 0.0625, 0.020833)
+
+
+RandomnessResult = namedtuple('RandomnessResult', ['name', 'statistic', 'p_value'])
+RandomnessResult.__doc__ = "The statistic and p-value of one randomness test."
+
+
+def _popcount(data):
+    """Count the set bits in a uint8 array."""
+    if not hasattr(np, 'bitwise_count'):
+        return int(_BYTE_POPCOUNT[data].sum(dtype=np.int64))
+    # NumPy 2 counts whole 64-bit words at a time
+    whole = len(data) & ~7
+    return (int(np.bitwise_count(data[:whole].view(np.uint64)).sum(dtype=np.int64))
+            + int(np.bitwise_count(data[whole:]).sum(dtype=np.int64)))
+
+
+def igamc(a, x):
+    """
+    Compute the regularized upper incomplete gamma function Q(a, x).
+
+    Uses the power series of P(a, x) below x = a + 1 and Lentz's continued
+    fraction above it. Chi-square p-values are igamc(df / 2, chi2 / 2).
+
+    Parameters:
+        a (float): Shape parameter, positive.
+        x (float): Lower limit of integration.
+
+    Returns:
+        float: Q(a, x), between 0 and 1.
+    """
+    if x <= 0:
+        return 1.0
+    scale = math.exp(a * math.log(x) - x - math.lgamma(a))
+    if x < a + 1:
+        term = total = 1.0 / a
+        k = a
+        while abs(term) > abs(total) * 1e-15:
+            k += 1
+            term *= x / k
+            total += term
+        return max(0.0, 1.0 - total * scale)
+
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 10000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = 1 / (d if abs(d) > tiny else tiny)
+        c = b + an / c
+        c = c if abs(c) > tiny else tiny
+        h *= d * c
+        if abs(d * c - 1) < 1e-15:
+            break
+    return h * scale
+
+
+def _normal_p_value(z):
+    """Two-sided p-value of a standard normal statistic."""
+    return math.erfc(abs(z) / math.sqrt(2))
+
+
+class _Autocorrelation:
+    """Streaming count of positions where s[i] != s[i+d]."""
+
+    def __init__(self, shift):
+        self.shift = shift
+        self.count = 0
+        self._pending = np.zeros(0, dtype=np.uint8)
+
+    def update(self, chunk):
+        data = np.concatenate((self._pending, chunk))
+        whole, bits = divmod(self.shift, 8)
+        # Byte j of the shifted stream needs bytes j+whole and j+whole+1
+        usable = len(data) - whole - (1 if bits else 0)
+        if usable > 0:
+            shifted = data[whole:whole + usable] << bits
+            if bits:
+                shifted |= data[whole + 1:whole + 1 + usable] >> (8 - bits)
+            self.count += _popcount(data[:usable] ^ shifted)
+            data = data[usable:]
+        self._pending = data
+
+    def finish(self):
+        # Pairs starting in the last bytes, up to the end of the sequence
+        nbits = 8 * len(self._pending)
+        if nbits > self.shift:
+            value = int.from_bytes(self._pending.tobytes(), 'big')
+            differences = ((value ^ (value << self.shift)) >> self.shift) & ((1 << (nbits - self.shift)) - 1)
+            self.count += differences.bit_count()
+        self._pending = np.zeros(0, dtype=np.uint8)
+        return self.count
+
+
+class _PatternCounter:
+    """Streaming counts of overlapping m-bit patterns with wrap-around."""
+
+    def __init__(self, length):
+        self.length = length
+        self.counts = np.zeros(1 << length, dtype=np.int64)
+        self._head = None
+        self._pending = np.zeros(0, dtype=np.uint8)
+
+    def update(self, chunk):
+        if self._head is None or len(self._head) < 2:
+            head = self._head if self._head is not None else np.zeros(0, dtype=np.uint8)
+            self._head = np.concatenate((head, chunk[:2 - len(head)]))
+        data = np.concatenate((self._pending, chunk))
+        self._count(data)
+        self._pending = data[max(len(data) - 2, 0):]
+
+    def _count(self, data):
+        # Every pattern starting in byte j lies within bytes j..j+2
+        starts = len(data) - 2
+        if starts <= 0:
+            return
+        words = ((data[:starts].astype(np.uint32) << 16)
+                 | (data[1:starts + 1].astype(np.uint32) << 8)
+                 | data[2:starts + 2])
+        mask = (1 << self.length) - 1
+        for offset in range(8):
+            patterns = (words >> (24 - offset - self.length)) & mask
+            self.counts += np.bincount(patterns, minlength=mask + 1)
+
+    def finish(self):
+        self._count(np.concatenate((self._pending, self._head)))
+        self._pending = np.zeros(0, dtype=np.uint8)
+        return self.counts
+
+
+class _Spectral:
+    """Discrete Fourier transform test accumulated over fixed-size blocks."""
+
+    def __init__(self, block_bytes):
+        self.block_bytes = block_bytes
+        self.below = 0
+        self.expected = 0.0
+        self.variance = 0.0
+        self._buffer = bytearray()
+
+    def update(self, chunk):
+        self._buffer += chunk.tobytes()
+        while len(self._buffer) >= self.block_bytes:
+            self._block(np.frombuffer(bytes(self._buffer[:self.block_bytes]), dtype=np.uint8))
+            del self._buffer[:self.block_bytes]
+
+    def _block(self, block):
+        n = 8 * len(block)
+        signs = np.unpackbits(block).astype(np.float64) * 2 - 1
+        modulus = np.abs(np.fft.rfft(signs)[:n // 2])
+        threshold = math.sqrt(math.log(1 / 0.05) * n)
+        self.below += int(np.count_nonzero(modulus < threshold))
+        self.expected += 0.95 * n / 2
+        self.variance += n * 0.95 * 0.05 / 4
+
+    def finish(self):
+        # A short final block is still a valid sample
+        if len(self._buffer) >= 16:
+            self._block(np.frombuffer(bytes(self._buffer), dtype=np.uint8))
+        self._buffer = bytearray()
+        if not self.variance:
+            return None
+        return (self.below - self.expected) / math.sqrt(self.variance)
+
+
+class _LinearComplexity:
+    """Linear complexity of the first max_blocks blocks of M bits."""
+
+    def __init__(self, block_bits, max_blocks):
+        self.block_bits = block_bits
+        self.max_blocks = max_blocks
+        self.counts = [0] * 7
+        self.blocks = 0
+        self._bits = bytearray()
+        m = block_bits
+        self._mean = m / 2 + (9 + (-1) ** (m + 1)) / 36 - (m / 3 + 2 / 9) / 2 ** m
+
+    def update(self, chunk):
+        needed = self.block_bits * (self.max_blocks - self.blocks) - len(self._bits)
+        if needed <= 0:
+            return
+        self._bits += np.unpackbits(chunk[:(needed + 7) >> 3]).tobytes()
+        while len(self._bits) >= self.block_bits and self.blocks < self.max_blocks:
+            complexity = linear_complexity(self._bits[:self.block_bits])
+            del self._bits[:self.block_bits]
+            t = (-1) ** self.block_bits * (complexity - self._mean) + 2 / 9
+            self.counts[min(max(math.ceil(t + 2.5), 0), 6)] += 1
+            self.blocks += 1
+
+    def finish(self):
+        if not self.blocks:
+            return None
+        return sum((count - self.blocks * p) ** 2 / (self.blocks * p)
+                   for count, p in zip(self.counts, _COMPLEXITY_CLASSES))
+
+
+class RandomnessReport:
+    """
+    The results of a randomness test run.
+
+    Results are RandomnessResult tuples in the order the tests ran; tests that
+    give two p-values (serial) contribute two results.
+    """
+
+    def __init__(self, nbits, results):
+        """
+        Initialize a report.
+
+        Parameters:
+            nbits (int): Number of bits tested.
+            results (list): RandomnessResult tuples.
+        """
+        self.nbits = nbits
+        self.results = results
+
+    def __getitem__(self, name):
+        """
+        Look up a result by test name.
+
+        Parameters:
+            name (str): The test name, e.g. 'frequency'.
+
+        Returns:
+            RandomnessResult: The result.
+
+        Raises:
+            KeyError: If no test of that name ran.
+        """
+        for result in self.results:
+            if result.name == name:
+                return result
+        raise KeyError(name)
+
+    def failures(self, alpha=0.01):
+        """
+        Return the results whose p-value falls below the significance level.
+
+        Parameters:
+            alpha (float): Significance level.
+
+        Returns:
+            list: The failing RandomnessResult tuples.
+        """
+        return [result for result in self.results if result.p_value < alpha]
+
+    def passed(self, alpha=0.01):
+        """
+        Check whether every test passed.
+
+        Parameters:
+            alpha (float): Significance level.
+
+        Returns:
+            bool: True if no p-value falls below alpha.
+        """
+        return not self.failures(alpha)
+
+    def as_dict(self):
+        """
+        Convert the report to plain data, e.g. for JSON output.
+
+        Returns:
+            dict: The bit count and a mapping of test name to statistic
+                  and p-value.
+        """
+        return {
+            'nbits': self.nbits,
+            'results': {result.name: {'statistic': result.statistic,
+                                      'p_value': result.p_value}
+                        for result in self.results},
+        }
+
+    def __str__(self):
+        """
+        Human-readable table of the results.
+
+        Returns:
+            str: One line per test with its statistic and p-value.
+        """
+        lines = [f"Randomness report over {self.nbits} bits"]
+        for result in self.results:
+            verdict = 'PASS' if result.p_value >= 0.01 else 'FAIL'
+            lines.append(f"  {result.name:<24} statistic={result.statistic:<12.6g} "
+                         f"p={result.p_value:.6f}  {verdict}")
+        return '\n'.join(lines)
+
+
+def _chunks(source, nbytes, chunk_size):
+    """Yield uint8 chunks from an LFSR, a buffer or an iterable of buffers."""
+    if hasattr(source, 'next_bit'):
+        if nbytes is None:
+            raise ValueError("nbytes is required when testing an LFSR")
+        for chunk in iter_bytes(source, chunk_size, nbytes):
+            yield np.frombuffer(chunk, dtype=np.uint8)
+        return
+
+    try:
+        view = memoryview(source).cast('B')
+    except TypeError:
+        view = None
+    if view is not None:
+        end = len(view) if nbytes is None else min(nbytes, len(view))
+        for start in range(0, end, chunk_size):
+            yield np.frombuffer(view[start:min(start + chunk_size, end)], dtype=np.uint8)
+        return
+
+    remaining = nbytes
+    for chunk in source:
+        chunk = np.frombuffer(chunk, dtype=np.uint8)
+        if remaining is not None:
+            chunk = chunk[:remaining]
+            remaining -= len(chunk)
+        if len(chunk):
+            yield chunk
+        if remaining is not None and remaining <= 0:
+            return
+
+
+def analyze(source, nbytes=None, tests=DEFAULT_TESTS, chunk_size=DEFAULT_CHUNK_SIZE,
+            serial_length=5, shifts=(1, 2, 8, 16), complexity_block=500,
+            complexity_blocks=1000, spectral_block=1 << 17):
+    """
+    Run randomness tests over a bit stream.
+
+    Bits are read most significant bit first from each byte, the packing of
+    next_bytes() and bits_to_bytes().
+
+    Tests:
+        frequency: Balance of ones and zeros (monobit).
+        runs: Number of runs of identical bits.
+        serial: Frequencies of overlapping serial_length-bit patterns,
+                giving two p-values ('serial_1' and 'serial_2').
+        autocorrelation: Agreement between the sequence and itself shifted
+                         by each of `shifts` bits ('autocorrelation_<d>').
+        linear_complexity: Berlekamp-Massey complexity of the first
+                           complexity_blocks blocks of complexity_block bits.
+        spectral: Peaks of the discrete Fourier transform, computed over
+                  blocks of spectral_block bytes and combined.
+
+    An LFSR is only linear-complexity-random up to its size, so a register
+    shorter than complexity_block bits is expected to fail that test.
+
+    Parameters:
+        source: An LFSR, a bytes-like object, or an iterable of bytes-like
+                chunks.
+        nbytes (int, optional): Number of bytes to test. Required for an
+                                LFSR; otherwise defaults to all input.
+        tests (iterable): Names of the tests to run.
+        chunk_size (int): Bytes processed per step, bounding memory use.
+        serial_length (int): Pattern length of the serial test, 2 to 16.
+        shifts (iterable): Shifts tested for autocorrelation.
+        complexity_block (int): Bits per linear complexity block.
+        complexity_blocks (int): Maximum number of linear complexity blocks.
+        spectral_block (int): Bytes per spectral test block.
+
+    Returns:
+        RandomnessReport: The results with p-values.
+
+    Raises:
+        ValueError: If a test name or parameter is invalid, or the input is
+                    too short.
+    """
+    tests = list(tests)
+    unknown = set(tests) - set(DEFAULT_TESTS)
+    if unknown:
+        raise ValueError(f"Unknown tests: {', '.join(sorted(unknown))}")
+    if not 2 <= serial_length <= 16:
+        raise ValueError("Serial pattern length must be between 2 and 16")
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+
+    shifts = sorted(set(shifts)) if 'autocorrelation' in tests else []
+    runs = _Autocorrelation(1) if 'runs' in tests else None
+    correlations = [_Autocorrelation(shift) for shift in shifts]
+    patterns = _PatternCounter(serial_length) if 'serial' in tests else None
+    spectral = _Spectral(spectral_block) if 'spectral' in tests else None
+    complexity = (_LinearComplexity(complexity_block, complexity_blocks)
+                  if 'linear_complexity' in tests else None)
+    accumulators = [acc for acc in [runs, patterns, spectral, complexity] + correlations
+                    if acc is not None]
+
+    total = 0
+    ones = 0
+    for chunk in _chunks(source, nbytes, chunk_size):
+        total += len(chunk)
+        ones += _popcount(chunk)
+        for accumulator in accumulators:
+            accumulator.update(chunk)
+
+    n = 8 * total
+    if total < 2:
+        raise ValueError("At least two bytes are needed")
+
+    results = []
+    for name in tests:
+        if name == 'frequency':
+            statistic = (2 * ones - n) / math.sqrt(n)
+            results.append(RandomnessResult(name, statistic, _normal_p_value(statistic)))
+
+        elif name == 'runs':
+            runs_count = runs.finish() + 1
+            proportion = ones / n
+            if abs(proportion - 0.5) >= 2 / math.sqrt(n):
+                # The frequency prerequisite failed, so runs are meaningless
+                results.append(RandomnessResult(name, float(runs_count), 0.0))
+                continue
+            spread = proportion * (1 - proportion)
+            statistic = (runs_count - 2 * n * spread) / (2 * math.sqrt(n) * spread)
+            results.append(RandomnessResult(name, statistic, _normal_p_value(statistic)))
+
+        elif name == 'serial':
+            counts = patterns.finish()
+            psi = []
+            for length in (serial_length, serial_length - 1, serial_length - 2):
+                if length <= 0:
+                    psi.append(0.0)
+                    continue
+                folded = counts.reshape(1 << length, -1).sum(axis=1)
+                psi.append(float((folded.astype(np.float64) ** 2).sum()) * (1 << length) / n - n)
+            first = psi[0] - psi[1]
+            second = psi[0] - 2 * psi[1] + psi[2]
+            results.append(RandomnessResult('serial_1', first,
+                                      igamc(2 ** (serial_length - 2), first / 2)))
+            results.append(RandomnessResult('serial_2', second,
+                                      igamc(2 ** (serial_length - 3), second / 2)))
+
+        elif name == 'autocorrelation':
+            for shift, accumulator in zip(shifts, correlations):
+                pairs = n - shift
+                statistic = 2 * (accumulator.finish() - pairs / 2) / math.sqrt(pairs)
+                results.append(RandomnessResult(f'autocorrelation_{shift}', statistic,
+                                          _normal_p_value(statistic)))
+
+        elif name == 'linear_complexity':
+            statistic = complexity.finish()
+            if statistic is None:
+                raise ValueError("Too few bits for one linear complexity block")
+            results.append(RandomnessResult(name, statistic, igamc(3, statistic / 2)))
+
+        elif name == 'spectral':
+            statistic = spectral.finish()
+            if statistic is None:
+                raise ValueError("Too few bits for the spectral test")
+            results.append(RandomnessResult(name, statistic, _normal_p_value(statistic)))
+
+    return RandomnessReport(n, results)
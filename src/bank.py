@@ -0,0 +1,316 @@
+# src/bank.py
+"""
+Vectorized LFSR Bank
+
+Runs a large population of independent LFSRs that share the same size and
+taps but start from different seeds, stepping all of them at once with NumPy.
+"""
+import os
+import struct
+
+import numpy as np
+
+
+# Snapshot header: magic, format version, size, head row, register count
+# and position counter; padded so the rows start 8-byte aligned
+SNAPSHOT_MAGIC = b'LFSB'
+SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct('<4sBxxxIIQQ')
+
+
+class LFSRBank:
+    """
+    A bank of N Fibonacci LFSRs with a common configuration.
+
+    Every register behaves exactly like a GeneralLFSR with the same size,
+    taps and seed. The states are stored bit-sliced: row i of a
+    (size, ceil(N/64)) uint64 matrix holds bit i of every register, so one
+    step is a handful of XORs over N/64 words and the memory footprint is
+    N * size bits. Rows are addressed through a rotating head index, so
+    shifting the registers never moves any data.
+    """
+
+    def __init__(self, seeds, size=4, taps=None):
+        """
+        Initialize a bank of LFSRs.
+
+        Parameters:
+            seeds (iterable): Initial state of each register as an integer.
+                              A NumPy integer array is accepted for sizes up
+                              to 64 bits.
+            size (int): Bit length of every LFSR.
+            taps (list): List of bit positions (0-indexed) to use for feedback.
+                         If None, uses [size-1, 0] as default.
+
+        Raises:
+            ValueError: If a seed is too large for the given size or if taps
+                        include positions outside the valid range.
+        """
+        self.size = size
+        self.max_value = (1 << size) - 1
+
+        self.taps = taps if taps else [size-1, 0]
+        if any(tap >= self.size or tap < 0 for tap in self.taps):
+            raise ValueError(f"Taps must be between 0 and {self.size-1}")
+
+        self.count = 0
+        self._rows = None
+        self._head = 0
+        self.reset(seeds)
+
+    def __len__(self):
+        """
+        Return the number of registers in the bank.
+
+        Returns:
+            int: Number of registers.
+        """
+        return self.count
+
+    def set_taps(self, new_taps):
+        """
+        Change the feedback taps shared by all registers.
+
+        Parameters:
+            new_taps (list): New list of tap positions.
+
+        Returns:
+            list: The updated taps list.
+
+        Raises:
+            ValueError: If any tap position is out of range.
+        """
+        if any(tap >= self.size or tap < 0 for tap in new_taps):
+            raise ValueError(f"Taps must be between 0 and {self.size-1}")
+        self.taps = new_taps
+        return self.taps
+
+    def reset(self, new_seeds=None):
+        """
+        Reset every register to a new seed.
+
+        Parameters:
+            new_seeds (iterable, optional): New seed for each register. The
+                                            number of seeds sets the size of
+                                            the bank. If None, keeps the
+                                            current states.
+
+        Returns:
+            The current states, as returned by get_states().
+
+        Raises:
+            ValueError: If a seed is negative or too large for the LFSR size.
+        """
+        if new_seeds is not None:
+            seed_bytes = self._seed_bytes(new_seeds)
+            count = seed_bytes.shape[0]
+            words = (count + 63) // 64
+
+            # Bit-slice the seeds: row i collects bit i of every register
+            rows = np.zeros((self.size, words), dtype=np.uint64)
+            row_bytes = rows.view(np.uint8)
+            for i in range(self.size):
+                column = (seed_bytes[:, i >> 3] >> (i & 7)) & 1
+                packed = np.packbits(column, bitorder='little')
+                row_bytes[i, :packed.size] = packed
+
+            self._rows = rows
+            self._head = 0
+            self.count = count
+        return self.get_states()
+
+    def get_states(self):
+        """
+        Return the current state of every register.
+
+        Returns:
+            numpy.ndarray or list: A uint64 array for sizes up to 64 bits,
+            otherwise a list of Python integers.
+        """
+        nbytes = (self.size + 7) // 8
+        seed_bytes = np.zeros((self.count, max(nbytes, 8)), dtype=np.uint8)
+        for i in range(self.size):
+            row = self._rows[(self._head + i) % self.size].view(np.uint8)
+            column = np.unpackbits(row, bitorder='little')[:self.count]
+            seed_bytes[:, i >> 3] |= column << (i & 7)
+
+        if self.size <= 64:
+            return seed_bytes[:, :8].copy().view('<u8').reshape(self.count).astype(np.uint64)
+        return [int.from_bytes(bytes(state), 'little') for state in seed_bytes[:, :nbytes]]
+
+    def next_bit(self):
+        """
+        Advance every register by one step.
+
+        Returns:
+            numpy.ndarray: uint8 array of shape (N,) with each register's
+            output bit.
+        """
+        return self.next_bits(1)[:, 0]
+
+    def next_bits(self, k):
+        """
+        Advance every register by k steps.
+
+        Parameters:
+            k (int): Number of steps.
+
+        Returns:
+            numpy.ndarray: uint8 array of shape (N, k); row r holds the bits
+            register r would return from k calls to GeneralLFSR.next_bit().
+
+        Raises:
+            ValueError: If k is negative.
+        """
+        if k < 0:
+            raise ValueError("Number of bits must be non-negative")
+
+        size = self.size
+        rows = self._rows
+        taps = sorted(tap for tap in set(self.taps) if self.taps.count(tap) % 2)
+
+        output = np.empty((k, rows.shape[1]), dtype=np.uint64)
+        feedback = np.empty(rows.shape[1], dtype=np.uint64)
+        head = self._head
+        for step in range(k):
+            # The head row is bit 0 of every register, i.e. the output
+            output[step] = rows[head]
+            feedback.fill(0)
+            for tap in taps:
+                np.bitwise_xor(feedback, rows[(head + tap) % size], out=feedback)
+
+            # After the shift the head slot becomes bit size-1
+            rows[head] = feedback
+            head = (head + 1) % size
+        self._head = head
+
+        bits = np.unpackbits(output.view(np.uint8), axis=1, bitorder='little')
+        return np.ascontiguousarray(bits[:, :self.count].T)
+
+    def save(self, path, position=0):
+        """
+        Write a snapshot of the bank to a file.
+
+        The file holds a 32-byte header, the tap mask padded to whole 64-bit
+        words and then the bit-sliced rows exactly as kept in memory, as
+        little-endian uint64. Saving and loading cost one bulk copy each,
+        without a Python object per register. The snapshot is written to a
+        temporary file that then replaces the target, so a failed save
+        leaves the previous snapshot, and any bank mapping it, intact.
+
+        Parameters:
+            path (str or os.PathLike): The output file.
+            position (int): Caller-defined position counter to store.
+
+        Raises:
+            ValueError: If the position is negative or exceeds 64 bits.
+        """
+        if not 0 <= position < 1 << 64:
+            raise ValueError("Position must fit in an unsigned 64-bit integer")
+        tap_mask = 0
+        for tap in self.taps:
+            tap_mask ^= 1 << tap
+        temporary = os.fspath(path) + '.tmp'
+        try:
+            with open(temporary, 'wb') as handle:
+                handle.write(_SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, self.size,
+                                                   self._head, self.count, position))
+                handle.write(tap_mask.to_bytes(8 * ((self.size + 63) // 64), 'little'))
+                handle.write(self._rows.astype('<u8', copy=False).tobytes())
+            os.replace(temporary, path)
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+
+    @classmethod
+    def load(cls, path, mmap=False, with_position=False):
+        """
+        Restore a bank from a snapshot written by save().
+
+        Parameters:
+            path (str or os.PathLike): The snapshot file.
+            mmap (bool): Map the rows copy-on-write instead of reading them,
+                         so pages are only loaded when stepped; the file
+                         itself is never modified.
+            with_position (bool): Also return the stored position counter.
+
+        Returns:
+            LFSRBank, or (LFSRBank, int) if with_position is True.
+
+        Raises:
+            ValueError: If the file is not a bank snapshot, has an
+                        unsupported version or is truncated.
+        """
+        with open(path, 'rb') as handle:
+            header = handle.read(_SNAPSHOT_HEADER.size)
+            if len(header) < _SNAPSHOT_HEADER.size:
+                raise ValueError(f"Truncated bank snapshot {path}")
+            magic, version, size, head, count, position = _SNAPSHOT_HEADER.unpack(header)
+            if magic != SNAPSHOT_MAGIC:
+                raise ValueError(f"Not an LFSR bank snapshot: {path}")
+            if version != SNAPSHOT_VERSION:
+                raise ValueError(f"Unsupported bank snapshot version {version} in {path}")
+            tap_mask = int.from_bytes(handle.read(8 * ((size + 63) // 64)), 'little')
+            offset = handle.tell()
+            shape = (size, (count + 63) // 64)
+            if handle.seek(0, 2) != offset + 8 * shape[0] * shape[1] or head >= size:
+                raise ValueError(f"Truncated bank snapshot {path}")
+            if mmap:
+                rows = np.memmap(path, dtype='<u8', mode='c', offset=offset, shape=shape)
+            else:
+                handle.seek(offset)
+                rows = np.fromfile(handle, dtype='<u8').astype(np.uint64).reshape(shape)
+
+        # Build the bank around the rows instead of bit-slicing seeds again
+        taps = [tap for tap in range(size - 1, -1, -1) if (tap_mask >> tap) & 1]
+        bank = cls([], size=size, taps=taps or None)
+        if not taps:
+            bank.set_taps([])
+        bank._rows = rows
+        bank._head = head
+        bank.count = count
+        return (bank, position) if with_position else bank
+
+    def _seed_bytes(self, seeds):
+        """
+        Convert seeds to a little-endian (N, bytes) uint8 matrix.
+
+        Parameters:
+            seeds (iterable): Seeds as integers or a NumPy integer array.
+
+        Returns:
+            numpy.ndarray: One row of little-endian state bytes per seed.
+
+        Raises:
+            ValueError: If a seed is negative or too large for the LFSR size.
+        """
+        nbytes = max((self.size + 7) // 8, 1)
+        if isinstance(seeds, np.ndarray) and self.size <= 64:
+            if seeds.dtype.kind not in 'iu':
+                raise ValueError("Seeds must be integers")
+            if seeds.size and seeds.min() < 0:
+                raise ValueError("Seed values must be non-negative")
+            values = seeds.reshape(-1).astype('<u8')
+            if self.size < 64 and values.size and values.max() > self.max_value:
+                raise ValueError(f"Seed value too large for {self.size}-bit LFSR")
+            return values.view(np.uint8).reshape(-1, 8)
+
+        data = bytearray()
+        for seed in seeds:
+            seed = int(seed)
+            if seed < 0:
+                raise ValueError("Seed values must be non-negative")
+            if seed > self.max_value:
+                raise ValueError(f"Seed value too large for {self.size}-bit LFSR")
+            data += seed.to_bytes(nbytes, 'little')
+        return np.frombuffer(bytes(data), dtype=np.uint8).reshape(-1, nbytes)
+
+    def __str__(self):
+        """
+        Human-readable representation of the bank.
+
+        Returns:
+            str: String representation of the bank.
+        """
+        return f"LFSRBank(count={self.count}, size={self.size}, taps={self.taps})"
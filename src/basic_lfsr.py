@@ -13,14 +13,34 @@ class BasicLFSR:
     
     This implementation is mainly for educational purposes and serves
     as a simple example of an LFSR with fixed parameters.
+    
+    The fixed configuration lives on the class and instances use __slots__,
+    so each one holds only its state.
     """
     
+    __slots__ = ('state',)
+    
+    size = 4  # 4-bit LFSR, shared by all instances
+    
     def __init__(self):
         """
         Initialize the LFSR with the default seed 0110 (binary) = 6 (decimal).
         """
         self.state = 0b0110
-        self.size = 4  # 4-bit LFSR
+    
+    def clone(self):
+        """
+        Return an independent copy of the LFSR in O(1).
+        Also used by copy.copy().
+        
+        Returns:
+            BasicLFSR: A register in the same state.
+        """
+        clone = object.__new__(type(self))
+        clone.state = self.state
+        return clone
+    
+    __copy__ = clone
     
     def get_state(self):
         """
@@ -0,0 +1,185 @@
+# src/catalogue.py
+"""
+Primitive polynomial catalogue.
+
+A table of low-weight primitive polynomials over GF(2), at most one per
+degree, stored as a packed binary resource and loaded on first use. A
+primitive feedback polynomial gives a maximum-length LFSR.
+"""
+import os
+import sys
+from array import array
+from functools import lru_cache
+
+from .gf2 import _cyclotomic_factors, is_primitive
+
+
+# Packed catalogue shipped with the package
+CATALOGUE_PATH = os.path.join(os.path.dirname(__file__), 'data', 'primitive.bin')
+
+# Largest degree the catalogue covers
+MAX_SIZE = 4096
+
+# Rho iterations spent on the cyclotomic factors of 2^n - 1 when building,
+# for divisors up to 128; larger divisors d get (128 / d)^3 times as many,
+# since their iterations cost more and their cofactors rarely split
+FACTOR_STEPS = 1 << 18
+
+# File header, followed by one record of uint16 values per degree from 0
+_MAGIC = b'LFSRPRIM'
+
+# Record layout: number of terms, then up to three middle exponents
+_RECORD = 4
+
+
+@lru_cache(maxsize=None)
+def _table():
+    """Load the catalogue records as a flat array of uint16 values."""
+    with open(CATALOGUE_PATH, 'rb') as handle:
+        data = handle.read()
+    if not data.startswith(_MAGIC):
+        raise ValueError(f"Not a primitive polynomial catalogue: {CATALOGUE_PATH}")
+    table = array('H')
+    table.frombytes(data[len(_MAGIC):])
+    if sys.byteorder == 'big':
+        table.byteswap()
+    return table
+
+
+def _record(size):
+    """Return (weight, middle exponents) for a degree, weight 0 if absent."""
+    table = _table()
+    start = size * _RECORD
+    if size < 0 or start >= len(table):
+        return 0, ()
+    weight = table[start]
+    return weight, tuple(table[start + 1:start + weight - 1])
+
+
+def catalogue_sizes():
+    """
+    List the degrees with a catalogued primitive polynomial.
+
+    Returns:
+        list: Sizes in increasing order.
+    """
+    table = _table()
+    return [size for size in range(len(table) // _RECORD) if table[size * _RECORD]]
+
+
+def primitive_polynomial(size):
+    """
+    Return the catalogued primitive polynomial of a degree.
+
+    Parameters:
+        size (int): The degree.
+
+    Returns:
+        int: The polynomial, bit k holding the coefficient of x^k.
+
+    Raises:
+        ValueError: If the catalogue has no polynomial of that degree.
+    """
+    weight, middle = _record(size)
+    if not weight:
+        raise ValueError(f"No catalogued primitive polynomial of degree {size}")
+    poly = (1 << size) | 1
+    for exponent in middle:
+        poly |= 1 << exponent
+    return poly
+
+
+def primitive_taps(size, max_weight=5):
+    """
+    Return the taps of a low-weight primitive polynomial of a degree.
+
+    The catalogue holds a trinomial where a primitive one exists and a
+    pentanomial otherwise, with the lowest middle exponents, so feedback
+    needs as few XORs as possible. Lookup is O(1).
+
+    Parameters:
+        size (int): The LFSR size, i.e. the degree of the polynomial.
+        max_weight (int): Maximum number of terms of the polynomial,
+                          including x^size and 1.
+
+    Returns:
+        list: Tap positions for GeneralLFSR, highest first and ending in 0,
+              e.g. [4, 3, 1, 0] for x^64 + x^4 + x^3 + x + 1.
+
+    Raises:
+        ValueError: If the catalogue has no primitive polynomial of that
+                    degree with at most max_weight terms.
+    """
+    weight, middle = _record(size)
+    if not weight:
+        raise ValueError(f"No catalogued primitive polynomial of degree {size}")
+    if weight > max_weight:
+        raise ValueError(f"The catalogued polynomial of degree {size} has "
+                         f"{weight} terms, more than {max_weight}")
+    return list(middle) + [0]
+
+
+def _search_low_weight(size):
+    """Find the lowest-weight primitive polynomial with the lowest exponents."""
+    top = 1 << size
+    # Swan's theorem: no trinomial of degree divisible by 8 is irreducible
+    if size % 8:
+        for k in range(1, size):
+            if is_primitive(top | (1 << k) | 1):
+                return (k,)
+    for a in range(3, size):
+        for b in range(2, a):
+            for c in range(1, b):
+                if is_primitive(top | (1 << a) | (1 << b) | (1 << c) | 1):
+                    return (a, b, c)
+    return ()
+
+
+def build_catalogue(path=CATALOGUE_PATH, max_size=MAX_SIZE, max_steps=FACTOR_STEPS):
+    """
+    Search for and write the catalogue.
+
+    Primitivity needs the prime factors of 2^n - 1, so degrees whose
+    factorization is out of reach are left out: each cyclotomic factor
+    Phi_d(2) gets max_steps rho iterations, scaled down by (d / 128)^3
+    above d = 128. Mersenne exponents are always in, since 2^n - 1 is prime,
+    and so are powers of two, whose cyclotomic factors are the Fermat
+    numbers gf2 knows the factors of. This is a one-off job that takes a
+    long time for large max_size.
+
+    Parameters:
+        path (str): Output file.
+        max_size (int): Largest degree to search.
+        max_steps (int): Rho iterations per small cyclotomic factor.
+
+    Returns:
+        int: Number of degrees catalogued.
+    """
+    table = array('H', bytes(2 * _RECORD * (max_size + 1)))
+    failed = set()
+    found = 0
+    for size in range(2, max_size + 1):
+        divisors = [d for d in range(2, size + 1) if size % d == 0]
+        if failed.intersection(divisors):
+            continue
+        try:
+            for d in divisors:
+                scale = min(128 / d, 1) ** 3
+                _cyclotomic_factors(d, max(int(max_steps * scale), 1 << 6))
+        except ArithmeticError:
+            failed.add(d)
+            continue
+
+        middle = _search_low_weight(size)
+        start = size * _RECORD
+        table[start] = len(middle) + 2
+        table[start + 1:start + 1 + len(middle)] = array('H', middle)
+        found += 1
+
+    if sys.byteorder == 'big':
+        table.byteswap()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as handle:
+        handle.write(_MAGIC + table.tobytes())
+    _table.cache_clear()
+    return found
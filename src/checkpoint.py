@@ -0,0 +1,148 @@
+# src/checkpoint.py
+"""
+Checkpoint files for many LFSRs.
+
+A checkpoint holds any number of registers of one size in a single file
+of fixed-width records, so it can be memory-mapped and any register
+restored without reading the others. Single registers are serialized with
+GeneralLFSR.to_bytes(); whole LFSRBank populations with LFSRBank.save().
+"""
+import mmap
+import os
+import struct
+
+from .general_lfsr import GeneralLFSR
+
+
+# File header: magic, format version, register size and register count
+CHECKPOINT_MAGIC = b'LFSC'
+CHECKPOINT_VERSION = 1
+_HEADER = struct.Struct('<4sBxxxIQ')
+
+# Position counter stored after the tap mask and state of every record
+_POSITION = struct.Struct('<Q')
+
+
+def record_size(size):
+    """
+    Return the width of one register record.
+
+    Parameters:
+        size (int): Bit length of the registers.
+
+    Returns:
+        int: Bytes per record: tap mask, state and position counter.
+    """
+    return 2 * ((size + 7) >> 3) + _POSITION.size
+
+
+def save_registers(path, registers, positions=None):
+    """
+    Write registers of a common size to a checkpoint file.
+
+    Everything is validated before the file is touched, and the records are
+    written to a temporary file that then replaces the target, so a failed
+    save leaves the previous checkpoint intact.
+
+    Parameters:
+        path (str or os.PathLike): The output file.
+        registers (list): GeneralLFSR instances (or subclasses) of one size.
+        positions (list, optional): Position counter of each register;
+                                    zeros if None.
+
+    Returns:
+        int: Number of registers written.
+
+    Raises:
+        ValueError: If the registers differ in size, the list is empty, the
+                    positions do not match the registers or a position is
+                    negative or exceeds 64 bits.
+    """
+    registers = list(registers)
+    if not registers:
+        raise ValueError("No registers to save")
+    positions = [0] * len(registers) if positions is None else list(positions)
+    if len(positions) != len(registers):
+        raise ValueError("Need one position per register")
+    size = registers[0].size
+    if any(lfsr.size != size for lfsr in registers):
+        raise ValueError("All registers must have the same size")
+    if not all(0 <= position < 1 << 64 for position in positions):
+        raise ValueError("Positions must fit in an unsigned 64-bit integer")
+    nbytes = (size + 7) >> 3
+
+    temporary = os.fspath(path) + '.tmp'
+    try:
+        with open(temporary, 'wb') as handle:
+            handle.write(_HEADER.pack(CHECKPOINT_MAGIC, CHECKPOINT_VERSION, size, len(registers)))
+            records = bytearray()
+            for lfsr, position in zip(registers, positions):
+                records += lfsr.config.tap_mask.to_bytes(nbytes, 'little')
+                records += lfsr.state.to_bytes(nbytes, 'little')
+                records += _POSITION.pack(position)
+                if len(records) >= 1 << 20:
+                    handle.write(records)
+                    records.clear()
+            handle.write(records)
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+    return len(registers)
+
+
+def load_registers(path, start=0, stop=None, cls=GeneralLFSR):
+    """
+    Restore registers from a checkpoint file.
+
+    The file is memory-mapped, so restoring a slice only reads its records.
+
+    Parameters:
+        path (str or os.PathLike): The checkpoint file.
+        start (int): Index of the first register to restore.
+        stop (int, optional): Index past the last register; the end if None.
+        cls (type): Register class to build, GeneralLFSR or a subclass.
+
+    Returns:
+        tuple: (list of registers, list of position counters).
+
+    Raises:
+        ValueError: If the file is not a checkpoint, has an unsupported
+                    version or is truncated.
+    """
+    with open(path, 'rb') as handle, \
+            mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        if len(data) < _HEADER.size:
+            raise ValueError(f"Truncated checkpoint {path}")
+        magic, version, size, count = _HEADER.unpack_from(data)
+        if magic != CHECKPOINT_MAGIC:
+            raise ValueError(f"Not an LFSR checkpoint: {path}")
+        if version != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version {version} in {path}")
+        width = record_size(size)
+        if len(data) != _HEADER.size + count * width:
+            raise ValueError(f"Truncated checkpoint {path}")
+
+        nbytes = (size + 7) >> 3
+        registers, positions = [], []
+        masks = {}
+        for index in range(*slice(start, stop).indices(count)):
+            offset = _HEADER.size + index * width
+            tap_mask = int.from_bytes(data[offset:offset + nbytes], 'little')
+            state = int.from_bytes(data[offset + nbytes:offset + 2 * nbytes], 'little')
+            if tap_mask >> size or state >> size:
+                raise ValueError(f"Corrupt record {index} in {path}")
+
+            # Registers sharing taps are built once and cloned after that
+            template = masks.get(tap_mask)
+            if template is None:
+                taps = [tap for tap in range(size - 1, -1, -1) if (tap_mask >> tap) & 1]
+                template = masks[tap_mask] = cls(size=size, taps=taps or None, seed=0)
+                if not taps:
+                    template.set_taps([])
+            lfsr = template.clone()
+            lfsr.state = state
+            registers.append(lfsr)
+            positions.append(_POSITION.unpack_from(data, offset + 2 * nbytes)[0])
+    return registers, positions
@@ -0,0 +1,207 @@
+# src/cipher.py
+"""
+LFSR stream cipher engine.
+
+XORs data with LFSR keystream a whole chunk at a time, encrypts files in
+bounded memory through mmap, and seeks to any byte offset via jump-ahead.
+
+WARNING: A plain LFSR keystream is linear and NOT cryptographically secure;
+this engine is meant for scrambling, testing and education.
+"""
+import mmap
+import os
+import warnings
+
+from .catalogue import primitive_taps
+from .general_lfsr import GeneralLFSR
+from .utils import _numpy
+
+
+# Bytes of keystream generated and XORed per step
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+class StreamCipher:
+    """
+    A stream cipher XORing data with the keystream of a GeneralLFSR.
+
+    The key is the LFSR seed. Keystream is generated in chunks through
+    next_bytes() and XORed as NumPy arrays when NumPy is installed or as
+    big integers otherwise, so no Python code runs per byte. Encryption and
+    decryption are the same operation.
+    """
+
+    def __init__(self, key, size=16, taps=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Initialize the cipher with a key.
+
+        Parameters:
+            key (int): The key, used as the LFSR seed.
+            size (int): The size of the LFSR in bits.
+            taps (list): Feedback taps, as for GeneralLFSR. If None, uses the
+                         catalogued primitive polynomial of that size, or
+                         GeneralLFSR's default taps with a RuntimeWarning
+                         where the catalogue has none.
+            chunk_size (int): Bytes processed per step.
+
+        Raises:
+            ValueError: If the key is zero, which gives an all-zero keystream,
+                        or is invalid for the LFSR, or if chunk_size is not
+                        positive.
+        """
+        if key == 0:
+            raise ValueError("Key must be non-zero")
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+        if not taps:
+            try:
+                taps = primitive_taps(size)
+            except ValueError:
+                warnings.warn(f"No catalogued primitive polynomial of degree {size}; the "
+                              f"default taps do not guarantee a maximum-length keystream",
+                              RuntimeWarning, stacklevel=2)
+                taps = None
+        self.key = key
+        self.lfsr = GeneralLFSR(size=size, taps=taps, seed=key)
+        self.chunk_size = chunk_size
+        self.position = 0
+
+    def keystream(self, n):
+        """
+        Generate the next n keystream bytes.
+
+        Parameters:
+            n (int): Number of bytes.
+
+        Returns:
+            bytes: The keystream.
+        """
+        keystream = self.lfsr.next_bytes(n)
+        self.position += n
+        return keystream
+
+    def seek(self, offset):
+        """
+        Move the keystream to a byte offset from the start.
+
+        Uses GeneralLFSR.skip(), so seeking costs O(size^2 log offset)
+        whatever the distance, which allows random-access decryption.
+
+        Parameters:
+            offset (int): Byte offset from the start of the keystream.
+
+        Returns:
+            int: The new position.
+
+        Raises:
+            ValueError: If the offset is negative.
+        """
+        if offset < 0:
+            raise ValueError("Offset must be non-negative")
+        self.lfsr.reset(self.key)
+        self.lfsr.skip(8 * offset)
+        self.position = offset
+        return self.position
+
+    def tell(self):
+        """
+        Return the current keystream position.
+
+        Returns:
+            int: Number of keystream bytes consumed since the start.
+        """
+        return self.position
+
+    def encrypt_into(self, src, dst):
+        """
+        Encrypt a buffer into another buffer.
+
+        Parameters:
+            src: A buffer-protocol object with the input data.
+            dst: A writable buffer at least as long as src. May be src
+                 itself for in-place encryption.
+
+        Returns:
+            int: Number of bytes processed.
+
+        Raises:
+            ValueError: If dst is shorter than src.
+        """
+        source = memoryview(src).cast('B')
+        target = memoryview(dst).cast('B')
+        if len(target) < len(source):
+            raise ValueError("Destination buffer is shorter than the source")
+
+        np = _numpy()
+        for start in range(0, len(source), self.chunk_size):
+            end = min(start + self.chunk_size, len(source))
+            keystream = self.keystream(end - start)
+            if np is not None:
+                np.bitwise_xor(np.frombuffer(source[start:end], dtype=np.uint8),
+                               np.frombuffer(keystream, dtype=np.uint8),
+                               out=np.frombuffer(target[start:end], dtype=np.uint8))
+            else:
+                value = (int.from_bytes(source[start:end], 'little')
+                         ^ int.from_bytes(keystream, 'little'))
+                target[start:end] = value.to_bytes(end - start, 'little')
+        return len(source)
+
+    def encrypt(self, data):
+        """
+        Encrypt bytes.
+
+        Parameters:
+            data (bytes-like): The plaintext.
+
+        Returns:
+            bytes: The ciphertext.
+        """
+        output = bytearray(len(memoryview(data).cast('B')))
+        self.encrypt_into(data, output)
+        return bytes(output)
+
+    def encrypt_file(self, in_path, out_path):
+        """
+        Encrypt a file into another file in bounded memory.
+
+        Both files are memory-mapped and processed chunk by chunk, so only
+        one chunk of keystream is held at a time. in_path and out_path may
+        name the same file for in-place encryption.
+
+        Parameters:
+            in_path (str): Path of the input file.
+            out_path (str): Path of the output file, created or replaced.
+
+        Returns:
+            int: Number of bytes processed.
+        """
+        if os.path.exists(out_path) and os.path.samefile(in_path, out_path):
+            with open(in_path, 'r+b') as handle:
+                length = os.fstat(handle.fileno()).st_size
+                if length:
+                    with mmap.mmap(handle.fileno(), length) as data:
+                        self.encrypt_into(data, data)
+            return length
+
+        with open(in_path, 'rb') as source, open(out_path, 'w+b') as target:
+            length = os.fstat(source.fileno()).st_size
+            target.truncate(length)
+            if length:
+                with mmap.mmap(source.fileno(), length, access=mmap.ACCESS_READ) as src, \
+                        mmap.mmap(target.fileno(), length) as dst:
+                    self.encrypt_into(src, dst)
+        return length
+
+    # XOR is its own inverse
+    decrypt = encrypt
+    decrypt_into = encrypt_into
+    decrypt_file = encrypt_file
+
+    def __str__(self):
+        """
+        Human-readable representation of the cipher.
+
+        Returns:
+            str: String representation of the cipher.
+        """
+        return f"StreamCipher(size={self.lfsr.size}, taps={self.lfsr.taps}, position={self.position})"
@@ -0,0 +1,417 @@
+# src/combiners.py
+"""
+Combination generators.
+
+Nonlinear keystream generators built from several LFSRs: nonlinear
+combiners such as the Geffe generator, filter generators and the
+clock-controlled shrinking, self-shrinking and alternating-step
+generators. Every generator pulls whole words from its registers through
+next_word() and combines them with word-level boolean operations instead
+of stepping bit by bit, and offers the same next_bit/next_word/next_bits/
+next_bytes interface as the registers, so it works with stream.iter_bytes,
+LFSRStream and StreamCipher-style consumers.
+"""
+from functools import lru_cache
+
+from .utils import _BIT_TO_ASCII, _numpy, reverse_bit_order
+
+
+# Input bits drawn per batch by variable-rate generators, at least
+BATCH_BITS = 1 << 12
+
+# Maps the ASCII digits '0' and '1' to the bit values 0 and 1.
+_ASCII_TO_BIT = bytes.maketrans(b'01', b'\x00\x01')
+
+# Number of 1 bits in every byte
+_POPCOUNT = [bin(byte).count('1') for byte in range(256)]
+
+
+@lru_cache(maxsize=None)
+def _compress_table():
+    """
+    Return the byte compaction table.
+
+    Entry (select << 8) | data holds the bits of data at the positions set
+    in select, packed towards bit 0.
+    """
+    table = []
+    for select in range(256):
+        positions = [i for i in range(8) if (select >> i) & 1]
+        for data in range(256):
+            table.append(sum(((data >> p) & 1) << k for k, p in enumerate(positions)))
+    return table
+
+
+def _to_bits(np, word, n):
+    """Unpack the low n bits of a word into a uint8 array, first bit first."""
+    data = np.frombuffer(word.to_bytes((n + 7) >> 3, 'little'), dtype=np.uint8)
+    return np.unpackbits(data, count=n, bitorder='little')
+
+
+def _from_bits(np, bits):
+    """Pack a uint8 array of bit values into a word, first bit lowest."""
+    return int.from_bytes(np.packbits(bits, bitorder='little').tobytes(), 'little')
+
+
+def compress_bits(data, select, n):
+    """
+    Keep the bits of a word at the positions selected by another word.
+
+    This is the bit compaction at the heart of the shrinking generators.
+    With NumPy it is a boolean mask over unpacked bits; otherwise a table
+    compacts one byte of each word per lookup.
+
+    Parameters:
+        data (int): The data bits, first bit lowest.
+        select (int): Bit i set keeps bit i of data.
+        n (int): Number of bits to consider.
+
+    Returns:
+        tuple: (word, count), the kept bits packed towards bit 0 and how
+               many there are.
+    """
+    mask = (1 << n) - 1
+    nbytes = (n + 7) >> 3
+    data_bytes = (data & mask).to_bytes(nbytes, 'little')
+    select_bytes = (select & mask).to_bytes(nbytes, 'little')
+
+    np = _numpy()
+    if np is not None:
+        bits = np.unpackbits(np.frombuffer(data_bytes, dtype=np.uint8), bitorder='little')
+        keep = np.unpackbits(np.frombuffer(select_bytes, dtype=np.uint8), bitorder='little')
+        kept = bits[keep.view(bool)]
+        return _from_bits(np, kept), len(kept)
+
+    table = _compress_table()
+    out = bytearray()
+    pending = filled = 0
+    for data_byte, select_byte in zip(data_bytes, select_bytes):
+        pending |= table[(select_byte << 8) | data_byte] << filled
+        filled += _POPCOUNT[select_byte]
+        if filled >= 8:
+            out.append(pending & 0xFF)
+            pending >>= 8
+            filled -= 8
+    return int.from_bytes(out, 'little') | (pending << (8 * len(out))), 8 * len(out) + filled
+
+
+class Combiner:
+    """
+    Base class of the combination generators.
+
+    Subclasses implement _produce(n), which returns a word of output bits
+    together with its length. Fixed-rate generators produce exactly n bits;
+    clock-controlled ones produce a varying number, and the surplus is kept
+    for the next request, so the output does not depend on how it is split
+    into calls.
+    """
+
+    def __init__(self, *registers):
+        """
+        Initialize the generator.
+
+        Parameters:
+            *registers: The constituent LFSRs (or other generators), each with
+                        a next_word(n) method.
+        """
+        self.registers = list(registers)
+        self._buffer = 0
+        self._buffered = 0
+
+    def _produce(self, n):
+        """
+        Generate output bits from the registers.
+
+        Parameters:
+            n (int): Number of output bits still needed, at least 1.
+
+        Returns:
+            tuple: (word, count), the output bits first bit lowest and their
+                   number, which may differ from n.
+        """
+        raise NotImplementedError
+
+    def next_word(self, n):
+        """
+        Generate the next n output bits packed into a single integer.
+
+        Parameters:
+            n (int): Number of bits to generate.
+
+        Returns:
+            int: The generated bits, first bit in the lowest position.
+
+        Raises:
+            ValueError: If n is negative.
+        """
+        if n < 0:
+            raise ValueError("Number of bits must be non-negative")
+        word, have = self._buffer, self._buffered
+        while have < n:
+            chunk, count = self._produce(n - have)
+            word |= chunk << have
+            have += count
+        self._buffer = word >> n
+        self._buffered = have - n
+        return word & ((1 << n) - 1)
+
+    def next_bit(self):
+        """
+        Generate the next output bit.
+
+        Returns:
+            int: The output bit (0 or 1).
+        """
+        return self.next_word(1)
+
+    def next_bits(self, n):
+        """
+        Generate the next n output bits.
+
+        Parameters:
+            n (int): Number of bits to generate.
+
+        Returns:
+            list: A list of n bits (0 or 1).
+
+        Raises:
+            ValueError: If n is negative.
+        """
+        word = self.next_word(n)
+        if n == 0:
+            return []
+        digits = format(word, f'0{n}b')[::-1].encode('ascii')
+        return list(digits.translate(_ASCII_TO_BIT))
+
+    def next_bytes(self, n):
+        """
+        Generate the next n bytes of output.
+
+        Bits are packed most significant bit first, the same layout as
+        utils.bits_to_bytes() applied to 8 * n calls to next_bit().
+
+        Parameters:
+            n (int): Number of bytes to generate.
+
+        Returns:
+            bytes: The generated keystream bytes.
+
+        Raises:
+            ValueError: If n is negative.
+        """
+        if n < 0:
+            raise ValueError("Number of bytes must be non-negative")
+        return reverse_bit_order(self.next_word(8 * n).to_bytes(n, 'little'))
+
+    def __str__(self):
+        """
+        Human-readable representation of the generator.
+
+        Returns:
+            str: String representation of the generator.
+        """
+        registers = ', '.join(str(register) for register in self.registers)
+        return f"{type(self).__name__}({registers})"
+
+
+class CombinationGenerator(Combiner):
+    """
+    Nonlinear combination generator.
+
+    Every register is stepped once per output bit and the output is a
+    boolean function of their output bits. The function is applied to whole
+    words at once, so it must be written with the bitwise operators
+    &, |, ^ and ~, e.g. lambda a, b, c: (a & b) ^ c.
+    """
+
+    def __init__(self, registers, function):
+        """
+        Initialize a combination generator.
+
+        Parameters:
+            registers (list): The LFSRs to combine.
+            function (callable): Takes one word per register and returns the
+                                 output word; bits above the requested count
+                                 are ignored, so ~ may be used freely.
+
+        Raises:
+            ValueError: If no registers are given.
+        """
+        if not registers:
+            raise ValueError("At least one register is required")
+        super().__init__(*registers)
+        self.function = function
+
+    def _produce(self, n):
+        words = [register.next_word(n) for register in self.registers]
+        return self.function(*words) & ((1 << n) - 1), n
+
+
+def _geffe(x1, x2, x3):
+    """Geffe function x1*x2 + (1 + x2)*x3: x2 selects x1 or x3."""
+    return x3 ^ (x2 & (x1 ^ x3))
+
+
+class GeffeGenerator(CombinationGenerator):
+    """
+    Geffe generator: the output of x2 selects between those of x1 and x3.
+    """
+
+    def __init__(self, x1, x2, x3):
+        """
+        Initialize a Geffe generator.
+
+        Parameters:
+            x1: Register whose output is used where x2 outputs 1.
+            x2: The selector register.
+            x3: Register whose output is used where x2 outputs 0.
+        """
+        super().__init__([x1, x2, x3], _geffe)
+
+
+class FilterGenerator(Combiner):
+    """
+    Nonlinear filter generator.
+
+    Each output bit is a boolean function of several state bits of one
+    register. In a GeneralLFSR state bit j at time t is output bit t + j,
+    so the function inputs are shifted windows of one stretch of output and
+    whole words are filtered at once.
+    """
+
+    def __init__(self, register, positions, function):
+        """
+        Initialize a filter generator.
+
+        Parameters:
+            register (GeneralLFSR): The register; its state bit j must be the
+                                    output j steps ahead, as in GeneralLFSR.
+            positions (list): State bit positions fed to the function.
+            function (callable): Takes one word per position and returns the
+                                 output word, using bitwise operators.
+
+        Raises:
+            ValueError: If a position is outside the register.
+        """
+        if any(position < 0 or position >= register.size for position in positions):
+            raise ValueError(f"Positions must be between 0 and {register.size-1}")
+        super().__init__(register)
+        self.positions = list(positions)
+        self.function = function
+
+    def _produce(self, n):
+        register = self.registers[0]
+        # The state after n steps holds the output bits following the word
+        sequence = register.next_word(n) | (register.state << n)
+        mask = (1 << n) - 1
+        words = [(sequence >> position) & mask for position in self.positions]
+        return self.function(*words) & mask, n
+
+
+class ShrinkingGenerator(Combiner):
+    """
+    Shrinking generator: outputs the bits of one register at the times the
+    selector register outputs 1, about one bit per two steps.
+    """
+
+    def __init__(self, data, selector):
+        """
+        Initialize a shrinking generator.
+
+        Parameters:
+            data: Register whose bits are output.
+            selector: Register deciding which bits are kept.
+        """
+        super().__init__(data, selector)
+
+    def _produce(self, n):
+        steps = max(2 * n + 64, BATCH_BITS)
+        data, selector = self.registers
+        return compress_bits(data.next_word(steps), selector.next_word(steps), steps)
+
+
+class SelfShrinkingGenerator(Combiner):
+    """
+    Self-shrinking generator: the register's output is read in pairs and
+    the second bit of a pair is output when the first is 1, about one bit
+    per four steps.
+    """
+
+    def __init__(self, register):
+        """
+        Initialize a self-shrinking generator.
+
+        Parameters:
+            register: The LFSR.
+        """
+        super().__init__(register)
+
+    def _produce(self, n):
+        pairs = max(4 * n + 64, BATCH_BITS) // 2
+        steps = 2 * pairs
+        # The first bit of every pair is at an even position
+        even = int('01' * pairs, 2)
+        word = self.registers[0].next_word(steps)
+        selector, _ = compress_bits(word, even, steps)
+        data, _ = compress_bits(word, even << 1, steps)
+        return compress_bits(data, selector, pairs)
+
+
+class AlternatingStepGenerator(Combiner):
+    """
+    Alternating step generator.
+
+    The control register is stepped for every output bit; when it outputs 1
+    the first register is stepped, otherwise the second, and the output is
+    the XOR of the latest bits of the two. A register that has not been
+    stepped yet counts as having output 0.
+    """
+
+    def __init__(self, control, first, second):
+        """
+        Initialize an alternating step generator.
+
+        Parameters:
+            control: Register deciding which register is stepped.
+            first: Register stepped when the control outputs 1.
+            second: Register stepped when the control outputs 0.
+        """
+        super().__init__(control, first, second)
+        self._last = (0, 0)
+
+    def _produce(self, n):
+        control, first, second = self.registers
+        clocks = control.next_word(n)
+        ones = clocks.bit_count()
+        first_word = first.next_word(ones)
+        second_word = second.next_word(n - ones)
+
+        np = _numpy()
+        if np is not None:
+            # Step i reads bit (number of first-register steps so far) of
+            # the first register's output preceded by its previous bit
+            clock_bits = _to_bits(np, clocks, n)
+            taken = np.cumsum(clock_bits, dtype=np.int64)
+            first_bits = np.empty(ones + 1, dtype=np.uint8)
+            first_bits[0] = self._last[0]
+            first_bits[1:] = _to_bits(np, first_word, ones)
+            second_bits = np.empty(n - ones + 1, dtype=np.uint8)
+            second_bits[0] = self._last[1]
+            second_bits[1:] = _to_bits(np, second_word, n - ones)
+            self._last = (int(first_bits[-1]), int(second_bits[-1]))
+            skipped = np.arange(1, n + 1, dtype=np.int64) - taken
+            return _from_bits(np, first_bits[taken] ^ second_bits[skipped]), n
+
+        clock_digits = format(clocks, f'0{n}b')[::-1]
+        first_digits = iter(format(first_word, f'0{ones}b')[::-1] if ones else '')
+        second_digits = iter(format(second_word, f'0{n - ones}b')[::-1] if n > ones else '')
+        a, b = self._last
+        output = bytearray(n)
+        for i, clock in enumerate(clock_digits):
+            if clock == '1':
+                a = int(next(first_digits))
+            else:
+                b = int(next(second_digits))
+            output[i] = a ^ b
+        self._last = (a, b)
+        return int(output[::-1].translate(_BIT_TO_ASCII), 2), n
@@ -0,0 +1,260 @@
+# src/galois_lfsr.py
+"""
+Galois LFSR Implementation
+
+A Galois-form Linear Feedback Shift Register, plus conversions between
+Galois and Fibonacci (GeneralLFSR) configurations that generate the same
+output sequence.
+"""
+from .general_lfsr import GeneralLFSR
+from .gf2 import poly_mul
+
+
+class GaloisLFSR:
+    """
+    A Galois-form Linear Feedback Shift Register.
+
+    On every step the register shifts right by one, and if the bit shifted
+    out is 1 the state is XORed with a constant tap mask. That single
+    conditional XOR replaces the multi-tap parity of the Fibonacci form.
+
+    A GaloisLFSR with tap j corresponds to a GeneralLFSR with tap
+    size-1-j: both have the same feedback polynomial and, with converted
+    states, produce exactly the same output sequence.
+    """
+
+    def __init__(self, size=4, taps=None, seed=0b0110):
+        """
+        Initialize a Galois LFSR.
+
+        Parameters:
+            size (int): Bit length of the LFSR.
+            taps (list): Bit positions (0-indexed) XORed with the output bit
+                         on each step. If None, uses [size-1, 0] as default.
+            seed (int): Initial state as an integer.
+
+        Raises:
+            ValueError: If seed is too large for the given size or if taps
+                        include positions outside the valid range.
+        """
+        self.size = size
+        self.max_value = (1 << size) - 1
+
+        if seed > self.max_value:
+            raise ValueError(f"Seed value too large for {size}-bit LFSR")
+        self.state = seed
+
+        self.set_taps(taps if taps else [size-1, 0])
+
+    def get_state(self):
+        """
+        Return the current state as a binary string.
+
+        Returns:
+            str: Binary representation of the current state.
+        """
+        return format(self.state, f'0{self.size}b')
+
+    def set_taps(self, new_taps):
+        """
+        Change the feedback taps.
+
+        Parameters:
+            new_taps (list): New list of tap positions.
+
+        Returns:
+            list: The updated taps list.
+
+        Raises:
+            ValueError: If any tap position is out of range.
+        """
+        if any(tap >= self.size or tap < 0 for tap in new_taps):
+            raise ValueError(f"Taps must be between 0 and {self.size-1}")
+        self.taps = new_taps
+
+        # Repeated taps cancel out, like in the Fibonacci form
+        self.mask = 0
+        for tap in new_taps:
+            self.mask ^= 1 << tap
+        return self.taps
+
+    def reset(self, new_seed=None):
+        """
+        Reset the LFSR to the initial seed or a new seed.
+
+        Parameters:
+            new_seed (int, optional): New seed value. If None, keeps current state.
+
+        Returns:
+            int: The current state after reset.
+
+        Raises:
+            ValueError: If the new seed is too large for the LFSR size.
+        """
+        if new_seed is not None:
+            if new_seed > self.max_value:
+                raise ValueError(f"Seed value too large for {self.size}-bit LFSR")
+            self.state = new_seed
+        return self.state
+
+    def next_bit(self):
+        """
+        Calculate next bit, update state, and return the output bit.
+
+        Returns:
+            int: The output bit (0 or 1).
+        """
+        output_bit = self.state & 1
+        self.state >>= 1
+        if output_bit:
+            self.state ^= self.mask
+        return output_bit
+
+    def next_word(self, n):
+        """
+        Generate the next n output bits packed into a single integer.
+
+        Long requests run on the equivalent Fibonacci register, which has
+        the word-parallel bulk path, and convert the state back afterwards.
+
+        Parameters:
+            n (int): Number of bits to generate.
+
+        Returns:
+            int: The generated bits, first bit in the lowest position.
+
+        Raises:
+            ValueError: If n is negative.
+        """
+        if n < 0:
+            raise ValueError("Number of bits must be non-negative")
+        if n <= 2 * self.size:
+            word = 0
+            for i in range(n):
+                word |= self.next_bit() << i
+            return word
+
+        fibonacci = galois_to_fibonacci(self)
+        word = fibonacci.next_word(n)
+        self.state = fibonacci_state_to_galois(self.size, self.taps, fibonacci.state)
+        return word
+
+    def next_bits(self, n):
+        """
+        Generate the next n output bits.
+
+        Parameters:
+            n (int): Number of bits to generate.
+
+        Returns:
+            list: A list of n bits (0 or 1).
+        """
+        word = self.next_word(n)
+        return [(word >> i) & 1 for i in range(n)]
+
+    def __str__(self):
+        """
+        Human-readable representation of LFSR state.
+
+        Returns:
+            str: String representation of the LFSR.
+        """
+        return f"GaloisLFSR(size={self.size}, taps={self.taps}, state={self.get_state()})"
+
+
+def mirror_taps(size, taps):
+    """
+    Convert taps between the Fibonacci and Galois forms.
+
+    Fibonacci tap t and Galois tap size-1-t contribute the same term to the
+    feedback polynomial, so the mapping is its own inverse.
+
+    Parameters:
+        size (int): Bit length of the LFSR.
+        taps (list): Tap positions in one form.
+
+    Returns:
+        list: Tap positions in the other form.
+    """
+    return [size - 1 - tap for tap in taps]
+
+
+def fibonacci_state_to_galois(size, galois_taps, state):
+    """
+    Convert a Fibonacci state to the Galois state with the same output.
+
+    The Fibonacci state holds the next output bits s[0..size-1] directly.
+    Galois state bit k equals s[k] XORed with every mask bit j < k times
+    s[k-1-j], i.e. the state is S + x * M * S truncated to size bits for
+    the state polynomial S and mask polynomial M.
+
+    Parameters:
+        size (int): Bit length of the LFSR.
+        galois_taps (list): Tap positions of the Galois register.
+        state (int): Fibonacci state.
+
+    Returns:
+        int: The equivalent Galois state.
+    """
+    mask = 0
+    for tap in galois_taps:
+        mask ^= 1 << tap
+    return (state ^ (poly_mul(mask, state) << 1)) & ((1 << size) - 1)
+
+
+def galois_state_to_fibonacci(size, galois_taps, state):
+    """
+    Convert a Galois state to the Fibonacci state with the same output.
+
+    The Fibonacci state is simply the next size output bits of the Galois
+    register.
+
+    Parameters:
+        size (int): Bit length of the LFSR.
+        galois_taps (list): Tap positions of the Galois register.
+        state (int): Galois state.
+
+    Returns:
+        int: The equivalent Fibonacci state.
+    """
+    mask = 0
+    for tap in galois_taps:
+        mask ^= 1 << tap
+
+    fibonacci = 0
+    for k in range(size):
+        output_bit = state & 1
+        fibonacci |= output_bit << k
+        state >>= 1
+        if output_bit:
+            state ^= mask
+    return fibonacci
+
+
+def fibonacci_to_galois(lfsr):
+    """
+    Build a GaloisLFSR that continues a GeneralLFSR's output sequence.
+
+    Parameters:
+        lfsr (GeneralLFSR): The Fibonacci register.
+
+    Returns:
+        GaloisLFSR: A Galois register producing the same output bits.
+    """
+    taps = mirror_taps(lfsr.size, lfsr.taps)
+    state = fibonacci_state_to_galois(lfsr.size, taps, lfsr.state)
+    return GaloisLFSR(size=lfsr.size, taps=taps, seed=state)
+
+
+def galois_to_fibonacci(lfsr):
+    """
+    Build a GeneralLFSR that continues a GaloisLFSR's output sequence.
+
+    Parameters:
+        lfsr (GaloisLFSR): The Galois register.
+
+    Returns:
+        GeneralLFSR: A Fibonacci register producing the same output bits.
+    """
+    state = galois_state_to_fibonacci(lfsr.size, lfsr.taps, lfsr.state)
+    return GeneralLFSR(size=lfsr.size, taps=mirror_taps(lfsr.size, lfsr.taps), seed=state)
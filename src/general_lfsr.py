@@ -0,0 +1,562 @@
+# src/general_lfsr.py
+"""
+General LFSR Implementation
+
+A configurable Linear Feedback Shift Register implementation
+supporting arbitrary size, tap positions, and seed values.
+"""
+import struct
+from collections import namedtuple
+from functools import lru_cache
+
+from .gf2 import feedback_polynomial, x_power_mod
+from .utils import _numpy, reverse_bit_order
+
+
+# Maps the ASCII digits '0' and '1' to the bit values 0 and 1 and back.
+_ASCII_TO_BIT = bytes.maketrans(b'01', b'\x00\x01')
+_BIT_TO_ASCII = bytes.maketrans(b'\x00\x01', b'01')
+
+# Record header of to_bytes(): magic, format version, size, position counter
+RECORD_MAGIC = b'LFSR'
+RECORD_VERSION = 1
+_RECORD_HEADER = struct.Struct('<4sBxxxIQ')
+
+# Number of distinct (size, taps) configurations kept interned
+CONFIG_CACHE_SIZE = 1024
+
+# Bits produced per step by the tap mask path of _sequence_bytes(), and the
+# number of configurations whose masks are kept
+MASK_STEP_BITS = 64
+MASK_CACHE_SIZE = 64
+
+# The tap mask path runs until the sequence holds DENSE_PREFIX_FACTOR *
+# len(taps) * size / span bits, where span = size - max(taps) is the number
+# of bits each doubling step yields per block unit
+DENSE_PREFIX_FACTOR = 4
+
+# Immutable register configuration: size and taps as given, the taps folded
+# into a bit mask (repeated taps cancel), the surviving taps in increasing
+# order and the all-ones state
+LFSRConfig = namedtuple('LFSRConfig', ['size', 'taps', 'tap_mask', 'feedback_taps', 'max_value'])
+
+
+@lru_cache(maxsize=CONFIG_CACHE_SIZE)
+def lfsr_config(size, taps):
+    """
+    Return the shared configuration for a size and tap positions.
+    
+    Configurations are interned, so registers built with the same size and
+    taps reference one object and the taps are validated only once.
+    
+    Parameters:
+        size (int): Bit length of the LFSR.
+        taps (tuple): Tap positions (0-indexed).
+    
+    Returns:
+        LFSRConfig: The configuration.
+        
+    Raises:
+        ValueError: If any tap position is out of range.
+    """
+    if any(tap >= size or tap < 0 for tap in taps):
+        raise ValueError(f"Taps must be between 0 and {size-1}")
+    tap_mask = 0
+    for tap in taps:
+        tap_mask ^= 1 << tap
+    feedback_taps = tuple(k for k in range(tap_mask.bit_length()) if (tap_mask >> k) & 1)
+    return LFSRConfig(size, tuple(taps), tap_mask, feedback_taps, (1 << size) - 1)
+
+
+@lru_cache(maxsize=MASK_CACHE_SIZE)
+def tap_masks(config):
+    """
+    Return the state masks of the next MASK_STEP_BITS feedback bits.
+    
+    Feedback bit j (the sequence bit size + j) is the parity of the state
+    ANDed with mask j, so a whole word of output follows from one state
+    without stepping bit by bit.
+    
+    Parameters:
+        config (LFSRConfig): The register configuration.
+    
+    Returns:
+        tuple: min(MASK_STEP_BITS, size) masks, bit j first.
+    """
+    size = config.size
+    masks = []
+    for j in range(min(MASK_STEP_BITS, size)):
+        mask = 0
+        for tap in config.feedback_taps:
+            # Bits past the state are earlier feedback bits
+            position = j + tap
+            mask ^= 1 << position if position < size else masks[position - size]
+        masks.append(mask)
+    return tuple(masks)
+
+
+class GeneralLFSR:
+    """
+    A general-purpose Linear Feedback Shift Register implementation
+    supporting arbitrary size, tap positions, and seed values.
+    
+    This implementation allows for experimentation with different LFSR
+    configurations and can be used for various applications from random
+    number generation to cryptographic operations.
+    
+    Instances use __slots__ and hold only their state and a reference to a
+    shared LFSRConfig, so millions of registers stay cheap and clone()
+    copies a register in O(1).
+    """
+    
+    __slots__ = ('config', 'state')
+    
+    def __init__(self, size=4, taps=None, seed=0b0110):
+        """
+        Initialize a general-purpose LFSR.
+        
+        Parameters:
+            size (int): Bit length of the LFSR.
+            taps (list): List of bit positions (0-indexed) to use for feedback.
+                         If None, uses [size-1, 0] as default.
+            seed (int): Initial state as an integer.
+        
+        Raises:
+            ValueError: If seed is too large for the given size or if taps
+                        include positions outside the valid range.
+        """
+        # Default taps for a common LFSR polynomial (x^n + x + 1)
+        self.config = lfsr_config(size, tuple(taps) if taps else (size-1, 0))
+        
+        # Ensure seed is valid for the given size
+        if seed > self.config.max_value:
+            raise ValueError(f"Seed value too large for {size}-bit LFSR")
+        self.state = seed
+    
+    @property
+    def size(self):
+        """int: Bit length of the LFSR."""
+        return self.config.size
+    
+    @property
+    def taps(self):
+        """list: Tap positions used for feedback."""
+        return list(self.config.taps)
+    
+    @property
+    def max_value(self):
+        """int: Largest valid state (all 1s)."""
+        return self.config.max_value
+    
+    @classmethod
+    def maximal(cls, size, seed=1):
+        """
+        Create a maximum-length LFSR from the primitive polynomial catalogue.
+    
+        The taps come from primitive_taps(), a trinomial or pentanomial, so
+        every non-zero seed runs through all 2^size - 1 non-zero states.
+    
+        Parameters:
+            size (int): Bit length of the LFSR.
+            seed (int): Initial state as an integer, non-zero.
+    
+        Returns:
+            GeneralLFSR: The new LFSR.
+    
+        Raises:
+            ValueError: If the catalogue has no primitive polynomial of that
+                        size or the seed is invalid.
+        """
+        # Imported here so that importing the package does not load the catalogue
+        from .catalogue import primitive_taps
+        return cls(size=size, taps=primitive_taps(size), seed=seed)
+    
+    def clone(self):
+        """
+        Return an independent copy of the LFSR.
+        
+        The copy shares the immutable configuration, so cloning is O(1) and
+        does not validate or copy the taps again. Also used by copy.copy().
+        
+        Returns:
+            GeneralLFSR: A register of the same type in the same state.
+        """
+        clone = object.__new__(type(self))
+        clone.config = self.config
+        clone.state = self.state
+        # Subclasses may keep further attributes in an instance dictionary
+        extra = getattr(self, '__dict__', None)
+        if extra:
+            clone.__dict__.update(extra)
+        return clone
+    
+    __copy__ = clone
+    
+    def to_bytes(self, position=0):
+        """
+        Serialize the LFSR into a compact versioned record.
+        
+        The record is a 20-byte header (b'LFSR', format version, size and a
+        position counter, little-endian) followed by the tap mask and the
+        state, each as ceil(size / 8) little-endian bytes. Taps are kept as
+        the mask, so repeated taps that cancel out are not preserved.
+        
+        Parameters:
+            position (int): Caller-defined position counter to store with
+                            the state, for instance the number of bytes
+                            already generated.
+        
+        Returns:
+            bytes: The record.
+            
+        Raises:
+            ValueError: If the position is negative or exceeds 64 bits.
+        """
+        if not 0 <= position < 1 << 64:
+            raise ValueError("Position must fit in an unsigned 64-bit integer")
+        nbytes = (self.size + 7) >> 3
+        return (_RECORD_HEADER.pack(RECORD_MAGIC, RECORD_VERSION, self.size, position)
+                + self.config.tap_mask.to_bytes(nbytes, 'little')
+                + self.state.to_bytes(nbytes, 'little'))
+    
+    @classmethod
+    def from_bytes(cls, data, with_position=False):
+        """
+        Restore an LFSR from a record written by to_bytes().
+        
+        Parameters:
+            data (bytes-like): The record.
+            with_position (bool): Also return the stored position counter.
+        
+        Returns:
+            GeneralLFSR, or (GeneralLFSR, int) if with_position is True.
+            
+        Raises:
+            ValueError: If the record is truncated, is not an LFSR record,
+                        has an unsupported version or holds values that do
+                        not fit the size.
+        """
+        data = memoryview(data).cast('B')
+        if len(data) < _RECORD_HEADER.size:
+            raise ValueError("Truncated LFSR record")
+        magic, version, size, position = _RECORD_HEADER.unpack_from(data)
+        if magic != RECORD_MAGIC:
+            raise ValueError("Not an LFSR record")
+        if version != RECORD_VERSION:
+            raise ValueError(f"Unsupported LFSR record version {version}")
+        nbytes = (size + 7) >> 3
+        if size < 1 or len(data) != _RECORD_HEADER.size + 2 * nbytes:
+            raise ValueError("Truncated LFSR record")
+        
+        start = _RECORD_HEADER.size
+        tap_mask = int.from_bytes(data[start:start + nbytes], 'little')
+        state = int.from_bytes(data[start + nbytes:], 'little')
+        if tap_mask >> size:
+            raise ValueError(f"Taps must be between 0 and {size-1}")
+        taps = [tap for tap in range(size - 1, -1, -1) if (tap_mask >> tap) & 1]
+        lfsr = cls(size=size, taps=taps or None, seed=state)
+        if not taps:
+            lfsr.set_taps([])
+        return (lfsr, position) if with_position else lfsr
+    
+    def __reduce__(self):
+        """
+        Pickle the LFSR as its to_bytes() record.
+        
+        Subclass attributes kept in an instance dictionary are pickled
+        alongside the record.
+        
+        Returns:
+            tuple: Arguments for the pickle protocol.
+        """
+        return type(self).from_bytes, (self.to_bytes(),), getattr(self, '__dict__', None)
+    
+    def get_state(self):
+        """
+        Return the current state as a binary string.
+        
+        Returns:
+            str: Binary representation of the current state.
+        """
+        return format(self.state, f'0{self.size}b')
+    
+    def set_taps(self, new_taps):
+        """
+        Change the feedback taps.
+        
+        Parameters:
+            new_taps (list): New list of tap positions.
+        
+        Returns:
+            list: The updated taps list.
+            
+        Raises:
+            ValueError: If any tap position is out of range.
+        """
+        self.config = lfsr_config(self.size, tuple(new_taps))
+        return self.taps
+    
+    def reset(self, new_seed=None):
+        """
+        Reset the LFSR to the initial seed or a new seed.
+        
+        Parameters:
+            new_seed (int, optional): New seed value. If None, keeps current state.
+        
+        Returns:
+            int: The current state after reset.
+            
+        Raises:
+            ValueError: If the new seed is too large for the LFSR size.
+        """
+        if new_seed is not None:
+            if new_seed > self.config.max_value:
+                raise ValueError(f"Seed value too large for {self.size}-bit LFSR")
+            self.state = new_seed
+        return self.state
+    
+    def next_bit(self):
+        """
+        Calculate next bit, update state, and return the output bit.
+        Uses dynamic feedback calculation based on tap positions.
+        
+        Returns:
+            int: The output bit (0 or 1).
+        """
+        state = self.state
+        config = self.config
+        
+        # Calculate feedback as the parity of the bits at all tap positions
+        feedback = (state & config.tap_mask).bit_count() & 1
+        
+        # Shift right by 1 and place feedback at the leftmost position
+        self.state = (state >> 1) | (feedback << (config.size - 1))
+        
+        # The rightmost bit is the output bit
+        return state & 1
+    
+    def next_word(self, n):
+        """
+        Generate the next n output bits packed into a single integer.
+        
+        Bit i of the result (counting from the least significant bit) is
+        the bit the i-th call to next_bit() would have returned, and the
+        state afterwards is the same as after n calls to next_bit().
+        
+        Parameters:
+            n (int): Number of bits to generate.
+        
+        Returns:
+            int: The generated bits, first bit in the lowest position.
+            
+        Raises:
+            ValueError: If n is negative.
+        """
+        if n < 0:
+            raise ValueError("Number of bits must be non-negative")
+        
+        length = n + self.size
+        sequence = int.from_bytes(self._sequence_bytes(length)[:(length + 7) >> 3], 'little')
+        self.state = (sequence >> n) & self.config.max_value
+        return sequence & ((1 << n) - 1)
+    
+    def next_bits(self, n):
+        """
+        Generate the next n output bits.
+        
+        Equivalent to calling next_bit() n times, but computes whole
+        words of output per step instead of one bit per call.
+        
+        Parameters:
+            n (int): Number of bits to generate.
+        
+        Returns:
+            list: A list of n bits (0 or 1).
+            
+        Raises:
+            ValueError: If n is negative.
+        """
+        word = self.next_word(n)
+        if n == 0:
+            return []
+        
+        # Render the word as binary digits, first bit first, then map the
+        # ASCII digits straight to bit values
+        digits = format(word, f'0{n}b')[::-1].encode('ascii')
+        return list(digits.translate(_ASCII_TO_BIT))
+    
+    def next_bytes(self, n):
+        """
+        Generate the next n bytes of output.
+        
+        Bits are packed most significant bit first, the same layout as
+        utils.bits_to_bytes() applied to 8 * n calls to next_bit().
+        
+        Parameters:
+            n (int): Number of bytes to generate.
+        
+        Returns:
+            bytes: The generated keystream bytes.
+            
+        Raises:
+            ValueError: If n is negative.
+        """
+        if n < 0:
+            raise ValueError("Number of bytes must be non-negative")
+        
+        # The sequence starts at the current output bit, so its first n
+        # bytes are the output and the state starts on byte n
+        sequence = self._sequence_bytes(8 * n + self.size)
+        state_bytes = sequence[n:n + ((self.size + 7) >> 3)]
+        self.state = int.from_bytes(state_bytes, 'little') & self.config.max_value
+        return reverse_bit_order(sequence[:n])
+    
+    def skip(self, n):
+        """
+        Advance the LFSR by n steps without generating the output.
+        
+        If x^n = sum(c[k] * x^k) modulo the feedback polynomial, every
+        sequence bit satisfies s[n + i] = XOR of c[k] * s[k + i], so the new
+        state follows from the next 2 * size - 1 bits in O(size^2 log n)
+        time. The residues x^(2^k) are cached per configuration, so further
+        jumps with the same taps are cheap.
+        
+        Parameters:
+            n (int): Number of steps to skip.
+        
+        Returns:
+            int: The state after skipping.
+            
+        Raises:
+            ValueError: If n is negative.
+        """
+        if n < 0:
+            raise ValueError("Number of steps must be non-negative")
+        if n < 2 * self.size:
+            self.next_word(n)
+            return self.state
+        
+        residue = x_power_mod(n, feedback_polynomial(self.size, self.config.taps))
+        window = int.from_bytes(self._sequence_bytes(2 * self.size - 1), 'little')
+        state = 0
+        for i in range(self.size):
+            if bin(residue & (window >> i)).count('1') & 1:
+                state |= 1 << i
+        self.state = state
+        return self.state
+    
+    def _sequence_bytes(self, length):
+        """
+        Compute the first `length` output bits from the current state.
+        
+        The state holds the next `size` bits of the output sequence, and the
+        sequence satisfies the recurrence given by the feedback polynomial
+        P(x) = x^size + sum(x^tap). Over GF(2), P(x)^d = P(x^d) for any power
+        of two d, so the sequence also satisfies
+        
+            s[i + size*d] = XOR of s[i + tap*d] over all taps
+        
+        which yields (size - max(taps)) * d new bits per step. The block
+        size d doubles as the known prefix grows; once d reaches 8 the
+        taps are byte aligned and the work moves to a byte buffer (a NumPy
+        array when available), so each step costs time proportional to the
+        block rather than the sequence. The state is not modified.
+        
+        With many taps close to size the steps yield few bits for many
+        XORs until d is large, so such registers first compute the prefix
+        a word at a time from the parities of tap_masks().
+        
+        Parameters:
+            length (int): Number of sequence bits to compute.
+        
+        Returns:
+            A bytes-like object holding the sequence with the first bit in
+            the lowest bit of byte 0. Bits past `length` are unspecified.
+        """
+        n = self.size
+        sequence = self.state
+        
+        # Repeated taps cancel out in the XOR, the configuration keeps those
+        # appearing an odd number of times
+        taps = self.config.feedback_taps
+        if length <= n or not taps:
+            return sequence.to_bytes((max(length, n) + 7) >> 3, 'little')
+        span = n - taps[-1]
+        known, d = n, 1
+        
+        # Mask phase: dense taps would make the doubling steps below cost
+        # more per bit than stepping the state by whole words
+        prefix = min(length, DENSE_PREFIX_FACTOR * len(taps) * n // span)
+        if prefix > n:
+            masks = tap_masks(self.config)
+            k = len(masks)
+            shift = n - k
+            state = self.state
+            blocks = []
+            while known < prefix:
+                block = bytes([(state & mask).bit_count() & 1 for mask in masks])
+                blocks.append(block)
+                state = (state >> k) | (int(block.translate(_BIT_TO_ASCII)[::-1], 2) << shift)
+                known += k
+            digits = b''.join(blocks).translate(_BIT_TO_ASCII)[::-1]
+            sequence |= int(digits, 2) << n
+        
+        # Integer phase: work on the sequence as one Python integer
+        while known < length:
+            while d < 8 and 2 * n * d <= known:
+                d *= 2
+            if d == 8:
+                break
+            block = min(span * d, length - known)
+            base = known - n * d
+            feedback = 0
+            for tap in taps:
+                feedback ^= sequence >> (base + tap * d)
+            sequence |= (feedback & ((1 << block) - 1)) << known
+            known += block
+        if known >= length:
+            return sequence.to_bytes((known + 7) >> 3, 'little')
+        
+        # Byte phase: d is a multiple of 8, so every tap offset is a whole
+        # number of bytes and blocks are XORs of earlier slices
+        size = known >> 3
+        target = (length + 7) >> 3
+        head = (sequence & ((1 << (8 * size)) - 1)).to_bytes(size, 'little')
+        np = _numpy()
+        if np is not None:
+            buffer = np.empty(target, dtype=np.uint8)
+            buffer[:size] = np.frombuffer(head, dtype=np.uint8)
+        else:
+            buffer = bytearray(head)
+        
+        d = 1
+        while size < target:
+            while 2 * n * d <= size:
+                d *= 2
+            block = min(span * d, target - size)
+            base = size - n * d
+            if np is not None:
+                out = buffer[size:size + block]
+                start = base + taps[0] * d
+                out[:] = buffer[start:start + block]
+                for tap in taps[1:]:
+                    start = base + tap * d
+                    np.bitwise_xor(out, buffer[start:start + block], out=out)
+            else:
+                feedback = 0
+                for tap in taps:
+                    start = base + tap * d
+                    feedback ^= int.from_bytes(buffer[start:start + block], 'little')
+                buffer += feedback.to_bytes(block, 'little')
+            size += block
+        return buffer
+    
+    def __str__(self):
+        """
+        Human-readable representation of LFSR state.
+        
+        Returns:
+            str: String representation of the LFSR.
+        """
+        return f"LFSR(size={self.size}, taps={self.taps}, state={self.get_state()})"
+
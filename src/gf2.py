@@ -0,0 +1,732 @@
+# src/gf2.py
+"""
+Polynomial arithmetic over GF(2).
+
+Polynomials are represented as Python integers, bit k holding the
+coefficient of x^k, so x^4 + x^3 + 1 is 0b11001. Besides the arithmetic,
+this module provides irreducibility and primitivity tests, factorization
+and multiplicative orders, together with the integer factorization of
+2^n - 1 these need.
+"""
+from functools import lru_cache
+from math import gcd
+
+
+# Maps every byte to its bits spread out over 16 bits (squaring over GF(2)),
+# which is its binary digits read as a base-4 number
+_SPREAD_BYTE = [int(format(byte, 'b'), 4).to_bytes(2, 'little') for byte in range(256)]
+
+
+def feedback_polynomial(size, taps):
+    """
+    Build the characteristic polynomial of a Fibonacci LFSR.
+
+    The output sequence of GeneralLFSR satisfies
+    s[i + size] = XOR of s[i + tap], so its characteristic polynomial is
+    x^size + sum(x^tap). Taps repeated an even number of times cancel out.
+
+    Parameters:
+        size (int): Bit length of the LFSR.
+        taps (list): Tap positions (0-indexed).
+
+    Returns:
+        int: The polynomial as an integer.
+    """
+    poly = 1 << size
+    for tap in taps:
+        poly ^= 1 << tap
+    return poly
+
+
+def poly_mul(a, b):
+    """
+    Multiply two polynomials over GF(2).
+
+    Parameters:
+        a (int): First polynomial.
+        b (int): Second polynomial.
+
+    Returns:
+        int: The product a * b.
+    """
+    if a.bit_length() < b.bit_length():
+        a, b = b, a
+    result = 0
+    shift = 0
+    while b:
+        if b & 1:
+            result ^= a << shift
+        b >>= 1
+        shift += 1
+    return result
+
+
+def poly_square(a):
+    """
+    Square a polynomial over GF(2).
+
+    Squaring is linear over GF(2): (sum x^k)^2 = sum x^(2k), so the result
+    is simply the bits of a spread apart with a zero between each pair.
+
+    Parameters:
+        a (int): The polynomial.
+
+    Returns:
+        int: a * a.
+    """
+    data = a.to_bytes((a.bit_length() + 7) // 8, 'little')
+    return int.from_bytes(b''.join(_SPREAD_BYTE[byte] for byte in data), 'little')
+
+
+@lru_cache(maxsize=256)
+def _reducer(m):
+    """
+    Return (degree, terms, sparse) describing how to reduce modulo m.
+
+    Writing m = x^degree + r(x), a sparse r lets a whole block of high bits
+    be folded down at once: a = h * x^degree + l is congruent to h * r + l,
+    which costs one shift per term of r and removes degree - deg(r) bits.
+    For dense moduli the bit-by-bit long division is cheaper.
+    """
+    degree = m.bit_length() - 1
+    rest = m ^ (1 << degree)
+    terms = [k for k in range(rest.bit_length()) if (rest >> k) & 1]
+    sparse = len(terms) + 2 < degree - rest.bit_length() + 1
+    return degree, terms, sparse
+
+
+def poly_mod(a, m):
+    """
+    Reduce a polynomial modulo another over GF(2).
+
+    Parameters:
+        a (int): The dividend.
+        m (int): The modulus, must be non-zero.
+
+    Returns:
+        int: The remainder of a divided by m.
+
+    Raises:
+        ZeroDivisionError: If m is zero.
+    """
+    if m == 0:
+        raise ZeroDivisionError("polynomial modulo by zero")
+    degree, terms, sparse = _reducer(m)
+    if sparse:
+        mask = (1 << degree) - 1
+        while a.bit_length() > degree:
+            high = a >> degree
+            a &= mask
+            for term in terms:
+                a ^= high << term
+        return a
+
+    degree += 1
+    while a.bit_length() >= degree:
+        a ^= m << (a.bit_length() - degree)
+    return a
+
+
+def poly_divmod(a, b):
+    """
+    Divide two polynomials over GF(2).
+
+    Parameters:
+        a (int): The dividend.
+        b (int): The divisor, must be non-zero.
+
+    Returns:
+        tuple: (quotient, remainder).
+
+    Raises:
+        ZeroDivisionError: If b is zero.
+    """
+    if b == 0:
+        raise ZeroDivisionError("polynomial division by zero")
+    quotient = 0
+    degree = b.bit_length()
+    while a.bit_length() >= degree:
+        shift = a.bit_length() - degree
+        quotient |= 1 << shift
+        a ^= b << shift
+    return quotient, a
+
+
+def poly_gcd(a, b):
+    """
+    Greatest common divisor of two polynomials over GF(2).
+
+    Parameters:
+        a (int): First polynomial.
+        b (int): Second polynomial.
+
+    Returns:
+        int: The monic greatest common divisor (0 if both are zero).
+    """
+    # Every remainder is a new modulus, so plain long division beats
+    # poly_mod(), whose reduction plan pays off only for a fixed modulus
+    while b:
+        degree = b.bit_length()
+        while a.bit_length() >= degree:
+            a ^= b << (a.bit_length() - degree)
+        a, b = b, a
+    return a
+
+
+def poly_mulmod(a, b, m):
+    """
+    Multiply two polynomials modulo m over GF(2).
+
+    Parameters:
+        a (int): First polynomial.
+        b (int): Second polynomial.
+        m (int): The modulus.
+
+    Returns:
+        int: (a * b) mod m.
+    """
+    return poly_mod(poly_mul(a, b), m)
+
+
+def poly_powmod(a, exponent, m):
+    """
+    Raise a polynomial to a power modulo m over GF(2).
+
+    Parameters:
+        a (int): The base polynomial.
+        exponent (int): Non-negative exponent.
+        m (int): The modulus.
+
+    Returns:
+        int: a^exponent mod m.
+    """
+    result = poly_mod(1, m)
+    a = poly_mod(a, m)
+    while exponent:
+        if exponent & 1:
+            result = poly_mulmod(result, a, m)
+        exponent >>= 1
+        if exponent:
+            a = poly_mod(poly_square(a), m)
+    return result
+
+
+@lru_cache(maxsize=256)
+def _doubling_powers(modulus):
+    """
+    Return the cached holder of x^(2^k) mod modulus for k = 0, 1, ...
+
+    The holder is a one-element list whose item is a tuple of the powers.
+    x_power_mod() replaces the tuple with a longer one as larger exponents
+    are requested, so every modulus only pays for each squaring once, and
+    as the tuple is never modified, threads sharing the holder always see
+    a complete one.
+    """
+    return [(poly_mod(0b10, modulus),)]
+
+
+def x_power_mod(exponent, modulus):
+    """
+    Compute x^exponent modulo a polynomial over GF(2).
+
+    The residues x^(2^k) mod modulus are cached per modulus, so repeated
+    calls only multiply together the cached powers for the set bits of the
+    exponent.
+
+    Parameters:
+        exponent (int): Non-negative exponent.
+        modulus (int): The modulus polynomial.
+
+    Returns:
+        int: x^exponent mod modulus.
+
+    Raises:
+        ValueError: If the exponent is negative.
+    """
+    if exponent < 0:
+        raise ValueError("Exponent must be non-negative")
+
+    holder = _doubling_powers(modulus)
+    powers = holder[0]
+    if len(powers) < exponent.bit_length():
+        extended = list(powers)
+        while len(extended) < exponent.bit_length():
+            extended.append(poly_mod(poly_square(extended[-1]), modulus))
+        powers = tuple(extended)
+        # Publish with a single assignment; a concurrent call may have
+        # published a longer tuple meanwhile, which is kept
+        if len(powers) > len(holder[0]):
+            holder[0] = powers
+
+    result = poly_mod(1, modulus)
+    k = 0
+    while exponent:
+        if exponent & 1:
+            result = poly_mulmod(result, powers[k], modulus)
+        exponent >>= 1
+        k += 1
+    return result
+
+
+def _derivative(a):
+    """Formal derivative over GF(2): only odd powers survive, shifted down."""
+    odd = int('10' * ((a.bit_length() + 1) // 2), 2) if a > 1 else 0
+    return (a & odd) >> 1
+
+
+def _square_root(a):
+    """Square root of a polynomial in which only even powers of x appear."""
+    root = 0
+    k = 0
+    while a:
+        if a & 1:
+            root |= 1 << k
+        a >>= 2
+        k += 1
+    return root
+
+
+def _square_free(f):
+    """
+    Split f into square-free parts.
+
+    Returns:
+        list: (polynomial, multiplicity) pairs, each polynomial square-free.
+    """
+    if f.bit_length() <= 2:
+        return [(f, 1)] if f > 1 else []
+
+    parts = []
+    c = poly_gcd(f, _derivative(f))
+    w = poly_divmod(f, c)[0]
+    multiplicity = 1
+    while w != 1:
+        y = poly_gcd(w, c)
+        z = poly_divmod(w, y)[0]
+        if z != 1:
+            parts.append((z, multiplicity))
+        multiplicity += 1
+        w = y
+        c = poly_divmod(c, y)[0]
+    if c != 1:
+        # What is left is a perfect square
+        parts.extend((part, 2 * count) for part, count in _square_free(_square_root(c)))
+    return parts
+
+
+def _distinct_degree(f):
+    """
+    Split a square-free f into products of irreducibles of equal degree.
+
+    Returns:
+        list: (product, degree) pairs.
+    """
+    parts = []
+    h = 0b10
+    degree = 1
+    while f.bit_length() - 1 >= 2 * degree:
+        h = poly_mod(poly_square(h), f)
+        g = poly_gcd(h ^ 0b10, f)
+        if g != 1:
+            parts.append((g, degree))
+            f = poly_divmod(f, g)[0]
+            h = poly_mod(h, f)
+        degree += 1
+    if f != 1:
+        parts.append((f, f.bit_length() - 1))
+    return parts
+
+
+def _equal_degree(f, degree, rng):
+    """
+    Split a product of irreducibles of the same degree (Cantor-Zassenhaus).
+
+    In characteristic 2 the trace map a + a^2 + ... + a^(2^(degree-1))
+    takes values 0 or 1 modulo each factor with equal probability, so its
+    gcd with f splits f about half of the time.
+    """
+    if f.bit_length() - 1 == degree:
+        return [f]
+    while True:
+        a = rng.getrandbits(f.bit_length() - 1)
+        trace = a
+        for _ in range(degree - 1):
+            a = poly_mod(poly_square(a), f)
+            trace ^= a
+        g = poly_gcd(trace, f)
+        if g != 1 and g != f:
+            return (_equal_degree(g, degree, rng)
+                    + _equal_degree(poly_divmod(f, g)[0], degree, rng))
+
+
+def poly_factor(f):
+    """
+    Factor a polynomial over GF(2) into irreducibles.
+
+    Parameters:
+        f (int): A non-zero polynomial.
+
+    Returns:
+        dict: Maps each irreducible factor to its multiplicity.
+
+    Raises:
+        ValueError: If f is zero.
+    """
+    if f == 0:
+        raise ValueError("Cannot factor the zero polynomial")
+
+    import random
+    rng = random.Random(f)
+    factors = {}
+    for part, multiplicity in _square_free(f):
+        for product, degree in _distinct_degree(part):
+            for factor in _equal_degree(product, degree, rng):
+                factors[factor] = factors.get(factor, 0) + multiplicity
+    return dict(sorted(factors.items()))
+
+
+# Factors up to this degree are sieved out before Rabin's test
+SIEVE_DEGREE = 10
+
+
+@lru_cache(maxsize=None)
+def _small_factor_product(degree):
+    """
+    Return the product of x^(2^k) - x for k = 1, ..., degree.
+
+    Every irreducible polynomial of degree at most `degree` divides it.
+    """
+    product = 1
+    for k in range(1, degree + 1):
+        product = poly_mul(product, (1 << (1 << k)) | 0b10)
+    return product
+
+
+def is_irreducible(f):
+    """
+    Test whether a polynomial is irreducible over GF(2) (Rabin's test).
+
+    A polynomial of degree n is irreducible exactly when x^(2^n) = x modulo
+    f and gcd(x^(2^(n/q)) - x, f) = 1 for every prime q dividing n. Most
+    reducible polynomials have a small factor, so for large n a single gcd
+    with the product of all irreducible polynomials of degree up to
+    SIEVE_DEGREE first rejects them without the n squarings.
+
+    Parameters:
+        f (int): The polynomial.
+
+    Returns:
+        bool: True if f is irreducible.
+    """
+    n = f.bit_length() - 1
+    if n < 1:
+        return False
+    if n == 1:
+        return True
+    if not f & 1:
+        return False
+
+    if n > 8 * SIEVE_DEGREE and poly_gcd(f, _small_factor_product(SIEVE_DEGREE)) != 1:
+        return False
+
+    checkpoints = {n // q for q in prime_factors(n)}
+    h = 0b10
+    for k in range(1, n + 1):
+        h = poly_mod(poly_square(h), f)
+        if k in checkpoints and poly_gcd(h ^ 0b10, f) != 1:
+            return False
+    return h == 0b10
+
+
+def is_primitive(f, max_steps=None):
+    """
+    Test whether a polynomial is primitive over GF(2).
+
+    A primitive polynomial of degree n is irreducible and x has order
+    exactly 2^n - 1 modulo it, which is checked against every prime factor
+    of 2^n - 1.
+
+    Parameters:
+        f (int): The polynomial.
+        max_steps (int, optional): Rho iterations allowed for any factor
+                                   of 2^n - 1. If None, keeps going.
+
+    Returns:
+        bool: True if f is primitive.
+
+    Raises:
+        ArithmeticError: If factoring 2^n - 1 needs more than max_steps.
+    """
+    n = f.bit_length() - 1
+    if not is_irreducible(f):
+        return False
+    if n == 1:
+        return f == 0b11
+    period = (1 << n) - 1
+    return all(x_power_mod(period // p, f) != 1 for p in mersenne_prime_factors(n, max_steps))
+
+
+def poly_order(f, max_steps=None):
+    """
+    Multiplicative order of x modulo f over GF(2).
+
+    This is the least e > 0 with f dividing x^e - 1, which is the period of
+    every nonzero sequence whose minimal polynomial is f. For f = prod(g^k)
+    the order is lcm(order(g)) * 2^t, with 2^t the least power of two not
+    below the largest multiplicity k.
+
+    The orders of the irreducible factors need the prime factors of
+    2^d - 1 for their degrees d, which can take very long for some large
+    d; max_steps bounds the work.
+
+    Parameters:
+        f (int): A polynomial with a non-zero constant term.
+        max_steps (int, optional): Rho iterations allowed for any factor
+                                   of 2^d - 1. If None, keeps going.
+
+    Returns:
+        int: The order of x modulo f.
+
+    Raises:
+        ValueError: If x divides f, so that no such order exists.
+        ArithmeticError: If factoring 2^d - 1 needs more than max_steps.
+    """
+    if not f & 1:
+        raise ValueError("Polynomial divisible by x has no order")
+    if f == 1:
+        return 1
+
+    order = 1
+    largest = 1
+    for factor, multiplicity in poly_factor(f).items():
+        degree = factor.bit_length() - 1
+        factor_order = (1 << degree) - 1
+        for p in mersenne_prime_factors(degree, max_steps):
+            while factor_order % p == 0 and x_power_mod(factor_order // p, factor) == 1:
+                factor_order //= p
+        order = order * factor_order // gcd(order, factor_order)
+        largest = max(largest, multiplicity)
+    return order << (largest - 1).bit_length()
+
+
+# Integer factorization of 2^n - 1
+
+def _sieve(limit):
+    """Return the primes below a limit, by the sieve of Eratosthenes."""
+    composite = bytearray(limit)
+    for p in range(2, int(limit ** 0.5) + 1):
+        if not composite[p]:
+            composite[p * p::p] = b'\x01' * len(range(p * p, limit, p))
+    return [p for p in range(2, limit) if not composite[p]]
+
+
+_SMALL_PRIMES = _sieve(1000)
+
+# Deterministic Miller-Rabin bases for n < 3.3 * 10^24, probabilistic above
+_WITNESSES = _SMALL_PRIMES[:16]
+
+
+def is_probable_prime(n):
+    """
+    Miller-Rabin primality test.
+
+    Parameters:
+        n (int): The number to test.
+
+    Returns:
+        bool: True if n is (very probably) prime.
+    """
+    if n < 2:
+        return False
+    for p in _SMALL_PRIMES[:25]:
+        if n % p == 0:
+            return n == p
+    d = n - 1
+    s = 0
+    while not d & 1:
+        d >>= 1
+        s += 1
+    for a in _WITNESSES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _pollard_brent(n, exponent, max_steps=None):
+    """
+    Find a non-trivial factor of the composite n with Brent's rho method.
+
+    Iterating y -> y^exponent + c instead of y^2 + c speeds the search up
+    for primes p = 1 (mod exponent), which is the case for factors of 2^d - 1.
+    Gives up with ArithmeticError after max_steps iterations, if given.
+    """
+    steps = 0
+    for c in range(1, 1000):
+        y, r, q, g = 2, 1, 1, 1
+        x = ys = y
+        while g == 1:
+            if max_steps is not None and steps > max_steps:
+                raise ArithmeticError(f"Gave up factoring {n}")
+            x = y
+            for _ in range(r):
+                y = (pow(y, exponent, n) + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(128, r - k)):
+                    y = (pow(y, exponent, n) + c) % n
+                    q = q * abs(x - y) % n
+                g = gcd(q, n)
+                k += 128
+            steps += 2 * r
+            r *= 2
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (pow(ys, exponent, n) + c) % n
+                g = gcd(abs(x - ys), n)
+        if g != n:
+            return g
+    raise ArithmeticError(f"Failed to factor {n}")
+
+
+def _collect_factors(n, exponent, primes, max_steps=None):
+    """Add the prime factors of n to the set primes."""
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            primes.add(p)
+            while n % p == 0:
+                n //= p
+    stack = [n] if n > 1 else []
+    while stack:
+        m = stack.pop()
+        if is_probable_prime(m):
+            primes.add(m)
+            continue
+        factor = _pollard_brent(m, exponent, max_steps)
+        stack.extend([factor, m // factor])
+
+
+def prime_factors(n):
+    """
+    Distinct prime factors of a positive integer.
+
+    Parameters:
+        n (int): The number to factor.
+
+    Returns:
+        list: Sorted distinct prime factors.
+    """
+    primes = set()
+    _collect_factors(n, 2, primes)
+    return sorted(primes)
+
+
+def _cyclotomic_value(d):
+    """Value of the d-th cyclotomic polynomial at 2, via Moebius inversion."""
+    numerator = denominator = 1
+    for e in range(1, d + 1):
+        if d % e:
+            continue
+        k = d // e
+        mu = 1
+        for p in prime_factors(k):
+            if k % (p * p) == 0:
+                mu = 0
+                break
+            mu = -mu
+        if mu == 1:
+            numerator *= (1 << e) - 1
+        elif mu == -1:
+            denominator *= (1 << e) - 1
+    return numerator // denominator
+
+
+# Prime factors of Phi_d(2) and of 2^n - 1 found so far, keyed by d and n
+_CYCLOTOMIC_FACTORS = {}
+_MERSENNE_FACTORS = {}
+
+# Known prime factors of the Fermat numbers F_m = 2^(2^m) + 1 = Phi_(2^(m+1))(2),
+# as in the Cunningham tables; what remains of each is a prime the rho
+# iteration could not split off. Together they factor 2^n - 1 for every
+# power of two n up to 4096
+_FERMAT_FACTORS = {
+    5: (641, 6700417),
+    6: (274177, 67280421310721),
+    7: (59649589127497217, 5704689200685129054721),
+    8: (1238926361552897,),
+    9: (2424833, 7455602825647884208337395736200454918783366342657),
+    10: (45592577, 6487031809, 4659775785220018543264560743076778192897),
+    11: (319489, 974849, 167988556341760475137, 3560841906445833920513),
+}
+
+
+def _cyclotomic_factors(d, max_steps=None):
+    """Distinct prime factors of Phi_d(2), cached."""
+    if d not in _CYCLOTOMIC_FACTORS:
+        primes = set()
+        value = _cyclotomic_value(d)
+        if d & (d - 1) == 0:
+            for p in _FERMAT_FACTORS.get(d.bit_length() - 2, ()):
+                primes.add(p)
+                value //= p
+        _collect_factors(value, d if d % 2 == 0 else 2 * d, primes, max_steps)
+        _CYCLOTOMIC_FACTORS[d] = frozenset(primes)
+    return _CYCLOTOMIC_FACTORS[d]
+
+
+def mersenne_prime_factors(n, max_steps=None):
+    """
+    Distinct prime factors of 2^n - 1.
+
+    2^n - 1 is split into cyclotomic values Phi_d(2) for d dividing n, and
+    every prime factor of Phi_d(2) not dividing d is 1 modulo d, which the
+    rho iteration exploits. Factorizations are cached, so degrees sharing
+    divisors share the work.
+
+    Parameters:
+        n (int): The exponent, at least 1.
+        max_steps (int, optional): Give up on any factor needing more rho
+                                   iterations than this. If None, keeps going.
+
+    Returns:
+        tuple: Sorted distinct prime factors.
+
+    Raises:
+        ArithmeticError: If the factorization needs more than max_steps.
+    """
+    if n not in _MERSENNE_FACTORS:
+        primes = set()
+        for d in range(2, n + 1):
+            if n % d == 0:
+                primes |= _cyclotomic_factors(d, max_steps)
+        _MERSENNE_FACTORS[n] = tuple(sorted(primes))
+    return _MERSENNE_FACTORS[n]
+
+
+def seed_mersenne_factors(n, factors):
+    """
+    Record the distinct prime factors of 2^n - 1, computed elsewhere.
+
+    Lets worker processes reuse a factorization their parent already paid
+    for; mersenne_prime_factors(n) returns the recorded factors from then on.
+
+    Parameters:
+        n (int): The exponent, at least 1.
+        factors (iterable): The distinct prime factors of 2^n - 1.
+
+    Raises:
+        ValueError: If a factor does not divide 2^n - 1.
+    """
+    factors = tuple(sorted(set(factors)))
+    mersenne = (1 << n) - 1
+    if any(p < 2 or mersenne % p for p in factors):
+        raise ValueError(f"Not a set of prime factors of 2^{n} - 1")
+    _MERSENNE_FACTORS[n] = factors
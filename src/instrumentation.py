@@ -0,0 +1,425 @@
+# src/instrumentation.py
+"""
+Opt-in instrumentation of the LFSR hot paths.
+
+enable() swaps counting and timing wrappers into GeneralLFSR, BasicLFSR,
+their subclasses and the bit packing functions of utils, and disable()
+puts the original functions back. While disabled nothing is wrapped and no
+flag is checked, so the hot paths run at full speed.
+
+Library code that steps scratch registers of its own, such as building the
+feedback tables of a TableLFSR, is not counted: the statistics describe
+the output requested from registers, not how the package computes it.
+
+Collected data is read with stats(), written in the Prometheus text
+format with write_prometheus(), or dumped periodically by a Reporter.
+"""
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# large_lfsr and table_lfsr define GeneralLFSR subclasses with overrides
+from . import large_lfsr, sequence_cache, table_lfsr, utils  # noqa: F401
+from .basic_lfsr import BasicLFSR
+from .general_lfsr import GeneralLFSR
+
+
+def _count(args, kwargs):
+    """Return the n argument of a method call."""
+    return args[1] if len(args) > 1 else kwargs['n']
+
+
+# Instrumented methods: (class, method, category, bits generated per call)
+_METHODS = [
+    (GeneralLFSR, 'next_bit', 'stepping', lambda args, kwargs: 1),
+    (GeneralLFSR, 'next_word', 'stepping', _count),
+    (GeneralLFSR, 'next_bits', 'stepping', _count),
+    (GeneralLFSR, 'next_bytes', 'stepping', lambda args, kwargs: 8 * _count(args, kwargs)),
+    (GeneralLFSR, 'skip', 'jump', None),
+    (BasicLFSR, 'next_bit', 'stepping', lambda args, kwargs: 1),
+]
+
+# Instrumented utils functions, all in the packing category
+_FUNCTIONS = ['bits_to_bytes', 'bytes_to_bits', 'pack_bits', 'unpack_bits', 'reverse_bit_order']
+
+# Internal functions stepping scratch registers: (module or class, name)
+_INTERNAL = [
+    (table_lfsr, 'feedback_tables'),
+    (sequence_cache.SequenceCache, '_build'),
+    (utils, 'find_cycle'),
+]
+
+
+def _subclasses(cls):
+    """Return the subclasses of a class, recursively, in definition order."""
+    found = []
+    for subclass in cls.__subclasses__():
+        found.append(subclass)
+        found.extend(_subclasses(subclass))
+    return found
+
+# Upper bounds of the request size histogram, in bits
+HISTOGRAM_BOUNDS = [1 << k for k in range(0, 33, 4)]
+
+_lock = threading.Lock()
+_local = threading.local()
+_originals = []
+_tracked = {}
+
+
+def _empty():
+    """Return zeroed statistics."""
+    return {
+        'calls': {},
+        'seconds': {},
+        'category_seconds': {'stepping': 0.0, 'packing': 0.0, 'jump': 0.0},
+        'bits': {},
+        'jumps': 0,
+        'skipped_steps': 0,
+        'request_bits': [0] * (len(HISTOGRAM_BOUNDS) + 1),
+        'registers': {},
+    }
+
+
+_stats = _empty()
+
+
+def _record(name, category, seconds, args, kwargs, bits, outermost):
+    """Add one finished call to the statistics."""
+    with _lock:
+        _stats['calls'][name] = _stats['calls'].get(name, 0) + 1
+        _stats['seconds'][name] = _stats['seconds'].get(name, 0.0) + seconds
+        _stats['category_seconds'][category] += seconds
+        if category == 'jump':
+            _stats['jumps'] += 1
+            _stats['skipped_steps'] += _count(args, kwargs)
+        if bits is None or not outermost:
+            return
+        count = bits(args, kwargs)
+        owner = type(args[0]).__name__
+        _stats['bits'][owner] = _stats['bits'].get(owner, 0) + count
+        bucket = 0
+        while bucket < len(HISTOGRAM_BOUNDS) and count > HISTOGRAM_BOUNDS[bucket]:
+            bucket += 1
+        _stats['request_bits'][bucket] += 1
+        label = _tracked.get(id(args[0]))
+        if label is not None:
+            _stats['registers'][label[0]] = _stats['registers'].get(label[0], 0) + count
+
+
+def _wrap(name, category, function, bits):
+    """
+    Wrap a function to count its calls and time it.
+
+    Times are exclusive: a call's time excludes that of instrumented calls
+    it makes, so next_bytes() time does not include its bit reversal.
+    Bits are counted only for the outermost stepping call outside any
+    jump, so next_bits() does not count its next_word() call again and
+    the steps skip() takes count as skipped, not as output. Calls made
+    from internal functions are passed through untouched.
+    """
+    def wrapper(*args, **kwargs):
+        if getattr(_local, 'internal', 0):
+            return function(*args, **kwargs)
+        frames = getattr(_local, 'frames', None)
+        if frames is None:
+            frames = _local.frames = []
+        outermost = not any(frame[0] in ('stepping', 'jump') for frame in frames)
+        frames.append([category, 0.0])
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = frames.pop()[1]
+            if frames:
+                frames[-1][1] += elapsed
+            _record(name, category, elapsed - children, args, kwargs, bits, outermost)
+
+    wrapper.__wrapped__ = function
+    wrapper.__name__ = function.__name__
+    wrapper.__doc__ = function.__doc__
+    return wrapper
+
+
+def _wrap_internal(function):
+    """Wrap an internal function so that the calls it makes are not recorded."""
+    def wrapper(*args, **kwargs):
+        _local.internal = getattr(_local, 'internal', 0) + 1
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _local.internal -= 1
+
+    wrapper.__wrapped__ = function
+    wrapper.__name__ = function.__name__
+    wrapper.__doc__ = function.__doc__
+    return wrapper
+
+
+def _swap_function(module, name, wrapper):
+    """Replace a function in every loaded package module that imported it."""
+    original = getattr(module, name)
+    package = utils.__name__.rpartition('.')[0]
+    for loaded in list(sys.modules.values()):
+        if (getattr(loaded, '__name__', '').startswith(package + '.')
+                and getattr(loaded, name, None) is original):
+            _originals.append((loaded, name, original))
+            setattr(loaded, name, wrapper)
+
+
+def is_enabled():
+    """
+    Report whether instrumentation is active.
+
+    Returns:
+        bool: True between enable() and disable().
+    """
+    return bool(_originals)
+
+
+def enable():
+    """
+    Swap the instrumented functions in.
+
+    Methods are replaced on the classes, so existing registers are covered,
+    and so are the overrides of every subclass defined at this point,
+    including LargeLFSR and TableLFSR. The utils functions are replaced in
+    every loaded module of this package that imported them, so modules
+    imported later still call the originals. Calling enable() twice has no
+    further effect.
+    """
+    with _lock:
+        if _originals:
+            return
+        for base, method, category, bits in _METHODS:
+            for cls in [base] + _subclasses(base):
+                original = cls.__dict__.get(method)
+                if original is None:
+                    continue
+                _originals.append((cls, method, original))
+                setattr(cls, method, _wrap(f'{cls.__name__}.{method}', category, original, bits))
+
+        for name in _FUNCTIONS:
+            _swap_function(utils, name, _wrap(f'utils.{name}', 'packing', getattr(utils, name), None))
+
+        for owner, name in _INTERNAL:
+            if isinstance(owner, type):
+                original = owner.__dict__[name]
+                _originals.append((owner, name, original))
+                setattr(owner, name, _wrap_internal(original))
+            else:
+                _swap_function(owner, name, _wrap_internal(getattr(owner, name)))
+
+
+def disable():
+    """
+    Restore the original functions. Collected statistics are kept.
+    """
+    with _lock:
+        while _originals:
+            owner, name, original = _originals.pop()
+            setattr(owner, name, original)
+
+
+@contextmanager
+def instrumented():
+    """
+    Enable instrumentation for the duration of a with block.
+
+    Yields:
+        function: stats, to read the statistics inside the block.
+    """
+    enable()
+    try:
+        yield stats
+    finally:
+        disable()
+
+
+def track(lfsr, name):
+    """
+    Count the bits generated by one register under a name.
+
+    The register is kept alive until untrack() is called.
+
+    Parameters:
+        lfsr: The register.
+        name (str): Label used in stats()['registers'] and the exports.
+    """
+    with _lock:
+        _tracked[id(lfsr)] = (name, lfsr)
+
+
+def untrack(lfsr):
+    """
+    Stop counting the bits of a register.
+
+    Parameters:
+        lfsr: A register passed to track().
+    """
+    with _lock:
+        _tracked.pop(id(lfsr), None)
+
+
+def reset_stats():
+    """
+    Zero all statistics.
+    """
+    global _stats
+    with _lock:
+        _stats = _empty()
+
+
+def stats():
+    """
+    Return a snapshot of the statistics.
+
+    Returns:
+        dict: With keys
+              calls - number of calls per function,
+              seconds - exclusive time per function,
+              category_seconds - time spent stepping, packing and jumping,
+              bits - output bits generated per register class,
+              jumps, skipped_steps - skip() calls and steps skipped,
+              request_bits - histogram of bits per stepping call, as
+                             {upper bound: count} with None for larger,
+              registers - output bits per tracked register,
+              enabled - whether instrumentation is active.
+    """
+    with _lock:
+        snapshot = json.loads(json.dumps(_stats))
+        histogram = dict(zip(HISTOGRAM_BOUNDS + [None], _stats['request_bits']))
+    snapshot['request_bits'] = histogram
+    snapshot['enabled'] = is_enabled()
+    return snapshot
+
+
+def _label(value):
+    """Escape a Prometheus label value."""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def prometheus_text(snapshot=None):
+    """
+    Format statistics in the Prometheus text exposition format.
+
+    Parameters:
+        snapshot (dict, optional): Output of stats(); taken now if None.
+
+    Returns:
+        str: The metrics.
+    """
+    snapshot = stats() if snapshot is None else snapshot
+    lines = []
+
+    def metric(name, kind, help_text, samples):
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {kind}')
+        for labels, value in samples:
+            lines.append(f'{name}{labels} {value}')
+
+    metric('lfsr_bits_generated_total', 'counter', 'Output bits generated.',
+           [(f'{{class="{_label(owner)}"}}', count) for owner, count in snapshot['bits'].items()])
+    metric('lfsr_register_bits_total', 'counter', 'Output bits generated by tracked registers.',
+           [(f'{{register="{_label(name)}"}}', count)
+            for name, count in snapshot['registers'].items()])
+    metric('lfsr_calls_total', 'counter', 'Calls of instrumented functions.',
+           [(f'{{function="{_label(name)}"}}', count) for name, count in snapshot['calls'].items()])
+    metric('lfsr_seconds_total', 'counter', 'Exclusive time spent in instrumented functions.',
+           [(f'{{function="{_label(name)}"}}', seconds)
+            for name, seconds in snapshot['seconds'].items()])
+    metric('lfsr_category_seconds_total', 'counter', 'Time spent stepping, packing and jumping.',
+           [(f'{{category="{category}"}}', seconds)
+            for category, seconds in snapshot['category_seconds'].items()])
+    metric('lfsr_jumps_total', 'counter', 'Calls of skip().', [('', snapshot['jumps'])])
+    metric('lfsr_skipped_steps_total', 'counter', 'Steps jumped over by skip().',
+           [('', snapshot['skipped_steps'])])
+
+    samples = []
+    cumulative = 0
+    for bound, count in snapshot['request_bits'].items():
+        cumulative += count
+        samples.append((f'_bucket{{le="{"+Inf" if bound is None else bound}"}}', cumulative))
+    samples.append(('_sum', sum(snapshot['bits'].values())))
+    samples.append(('_count', cumulative))
+    metric('lfsr_request_bits', 'histogram', 'Output bits per stepping call.', samples)
+    return '\n'.join(lines) + '\n'
+
+
+def write_prometheus(path):
+    """
+    Atomically write the current statistics in the Prometheus text format.
+
+    Suitable for the node exporter's textfile collector.
+
+    Parameters:
+        path (str): The output file.
+    """
+    temporary = path + '.tmp'
+    with open(temporary, 'w') as handle:
+        handle.write(prometheus_text())
+    os.replace(temporary, path)
+
+
+class Reporter(threading.Thread):
+    """
+    Background thread dumping the statistics to a file at an interval.
+
+    In 'prometheus' format the file is rewritten with the current metrics;
+    in 'log' format one JSON line with a timestamp and the statistics is
+    appended per interval. A final dump is written when stopped.
+    """
+
+    def __init__(self, path, interval=10.0, format='prometheus'):
+        """
+        Create a reporter; call start() to run it.
+
+        Parameters:
+            path (str): The output file.
+            interval (float): Seconds between dumps.
+            format (str): 'prometheus' or 'log'.
+
+        Raises:
+            ValueError: If the format or interval is invalid.
+        """
+        if format not in ('prometheus', 'log'):
+            raise ValueError("Format must be 'prometheus' or 'log'")
+        if interval <= 0:
+            raise ValueError("Interval must be positive")
+        super().__init__(daemon=True)
+        self.path = path
+        self.interval = interval
+        self.format = format
+        self._stopped = threading.Event()
+
+    def dump(self):
+        """
+        Write the current statistics once.
+        """
+        if self.format == 'prometheus':
+            write_prometheus(self.path)
+            return
+        record = {'time': time.time(), **stats()}
+        record['request_bits'] = {str(bound): count
+                                  for bound, count in record['request_bits'].items()}
+        with open(self.path, 'a') as handle:
+            handle.write(json.dumps(record) + '\n')
+
+    def run(self):
+        """
+        Dump at every interval until stopped.
+        """
+        while not self._stopped.wait(self.interval):
+            self.dump()
+        self.dump()
+
+    def stop(self):
+        """
+        Stop the thread after a final dump and wait for it.
+        """
+        self._stopped.set()
+        self.join()
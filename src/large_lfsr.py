@@ -0,0 +1,268 @@
+# src/large_lfsr.py
+"""
+Large LFSR Implementation
+
+A GeneralLFSR for registers of many thousands of bits, keeping the
+state in a circular buffer of 64-bit words so that steps do not shift
+the whole register.
+"""
+import sys
+from array import array
+from collections import namedtuple
+from functools import lru_cache
+
+from .general_lfsr import CONFIG_CACHE_SIZE, GeneralLFSR
+
+
+# Bits per buffer word
+WORD_BITS = 64
+_WORD_MASK = (1 << WORD_BITS) - 1
+
+# Byte order of the native 64-bit array words
+_NATIVE_LITTLE = sys.byteorder == 'little'
+
+# Buffer layout of a configuration: the number of buffer words, the
+# (word, bit) offset the feedback word is written to, relative to the
+# head word, the (word, bit, mask) windows of the taps and the shifts of
+# the factors solving for feedback bits that depend on earlier ones
+BufferLayout = namedtuple('BufferLayout', ['words', 'target', 'reads', 'factors'])
+
+
+@lru_cache(maxsize=CONFIG_CACHE_SIZE)
+def buffer_layout(config):
+    """
+    Return the precomputed buffer offsets of a configuration.
+
+    A word step appends the 64 feedback bits f following the state, with
+    f[j] the XOR of the sequence bits tap + j. For a tap within 64 bits of
+    size some of those bits are themselves feedback bits, f[j - (size -
+    tap)], so f = a + S(x) f over GF(2), where a collects the state bits
+    read through the masked tap windows and S(x) is the sum of x^(size -
+    tap) over those taps. Since S has no constant term, S^64 vanishes
+    modulo x^64 and
+    
+        f = a * (1 + S(x)) * (1 + S(x^2)) * ... * (1 + S(x^32))  mod x^64
+    
+    which costs a few shifts per high tap and level, whatever the taps.
+
+    Parameters:
+        config (LFSRConfig): The register configuration.
+
+    Returns:
+        BufferLayout: The layout.
+    """
+    size = config.size
+    reads = []
+    shifts = []
+    for tap in config.feedback_taps:
+        distance = size - tap
+        mask = _WORD_MASK if distance >= WORD_BITS else (1 << distance) - 1
+        reads.append((tap >> 6, tap & 63, mask))
+        if distance < WORD_BITS:
+            shifts.append(distance)
+    factors = []
+    level = 1
+    while shifts and level < WORD_BITS:
+        factors.append(tuple(shift * level for shift in shifts if shift * level < WORD_BITS))
+        level *= 2
+    # The state and the word being appended must fit without overlapping
+    return BufferLayout((size + WORD_BITS - 1) // WORD_BITS + 1, (size >> 6, size & 63),
+                        tuple(reads), tuple(factor for factor in factors if factor))
+
+
+class LargeLFSR(GeneralLFSR):
+    """
+    A GeneralLFSR whose state is a circular buffer of 64-bit words.
+
+    With the state as one Python integer, every next_bit() shifts and
+    rebuilds a size-bit integer, which costs O(size) for registers of
+    thousands of bits. Here the buffer holds the output sequence, bit i
+    of it at buffer bit i modulo the buffer length, and the register
+    steps a whole word at a time: the 64 feedback bits following the state
+    are XORs of 64-bit windows read at precomputed (word, bit) offsets of
+    the taps from the head word, and the head word, now consumed, becomes
+    the next 64 output bits. next_bit() hands those out one by one, so
+    stepping costs O(taps) per 64 bits whatever the size.
+
+    The state attribute still reads and writes the register as an integer,
+    so get_state(), reset() and the bulk next_bytes() and skip() of
+    GeneralLFSR work unchanged; they convert the buffer once per call,
+    which their O(size) start-up already dominates. Output is identical to
+    GeneralLFSR.
+    """
+
+    __slots__ = ('words', 'head', 'layout', 'out', 'left')
+
+    @property
+    def state(self):
+        """int: The register state, bit j being the j-th next output bit."""
+        words = self.words
+        if not _NATIVE_LITTLE:
+            words = array('Q', words)
+            words.byteswap()
+        raw = int.from_bytes(words.tobytes(), 'little')
+        head = WORD_BITS * self.head
+        length = WORD_BITS * len(words)
+        raw = (raw >> head) | ((raw & ((1 << head) - 1)) << (length - head))
+
+        # Output bits already stepped past but not yet handed out come first
+        left = self.left
+        return ((self.out & ((1 << left) - 1)) | (raw << left)) & self.config.max_value
+
+    @state.setter
+    def state(self, value):
+        layout = buffer_layout(self.config)
+        words = array('Q', value.to_bytes(layout.words * (WORD_BITS // 8), 'little'))
+        if not _NATIVE_LITTLE:
+            words.byteswap()
+        self.words = words
+        self.head = 0
+        self.layout = layout
+        self.out = self.left = 0
+
+    def clone(self):
+        """
+        Return an independent copy of the LFSR.
+
+        Copies the word buffer as is, without rotating it back into an
+        integer. Also used by copy.copy().
+
+        Returns:
+            LargeLFSR: A register of the same type in the same state.
+        """
+        clone = object.__new__(type(self))
+        clone.config = self.config
+        clone.words = array('Q', self.words)
+        clone.head = self.head
+        clone.layout = self.layout
+        clone.out = self.out
+        clone.left = self.left
+        return clone
+
+    __copy__ = clone
+
+    def set_taps(self, new_taps):
+        """
+        Change the feedback taps.
+
+        Output bits computed ahead with the previous taps are folded back
+        into the state first.
+
+        Parameters:
+            new_taps (list): New list of tap positions.
+
+        Returns:
+            list: The updated taps list.
+
+        Raises:
+            ValueError: If any tap position is out of range.
+        """
+        state = self.state
+        taps = super().set_taps(new_taps)
+        self.state = state
+        return taps
+
+    def _step_word(self):
+        """
+        Append the next 64 feedback bits and advance the head by a word.
+
+        Returns:
+            int: The 64 output bits stepped past, first bit lowest.
+        """
+        words = self.words
+        head = self.head
+        count = len(words)
+        layout = self.layout
+
+        # XOR the tap windows, each spanning at most two words
+        feedback = 0
+        for offset, shift, mask in layout.reads:
+            low = head + offset
+            if low >= count:
+                low -= count
+            high = low + 1 if low + 1 < count else 0
+            feedback ^= ((words[low] | (words[high] << WORD_BITS)) >> shift) & mask
+        for shifts in layout.factors:
+            product = feedback
+            for shift in shifts:
+                product ^= feedback << shift
+            feedback = product & _WORD_MASK
+
+        # Write the feedback word right after the state
+        offset, bit = layout.target
+        low = head + offset
+        if low >= count:
+            low -= count
+        if bit:
+            high = low + 1 if low + 1 < count else 0
+            words[low] = (words[low] & ((1 << bit) - 1)) | ((feedback << bit) & _WORD_MASK)
+            words[high] = ((words[high] >> bit) << bit) | (feedback >> (WORD_BITS - bit))
+        else:
+            words[low] = feedback
+
+        output = words[head]
+        head += 1
+        self.head = 0 if head == count else head
+        return output
+
+    def next_bit(self):
+        """
+        Calculate next bit, update state, and return the output bit.
+
+        Hands out the output of the last word step, stepping a new word
+        every 64 calls.
+
+        Returns:
+            int: The output bit (0 or 1).
+        """
+        left = self.left
+        if left:
+            out = self.out
+            self.left = left - 1
+        else:
+            out = self._step_word()
+            self.left = WORD_BITS - 1
+        self.out = out >> 1
+        return out & 1
+
+    def next_word(self, n):
+        """
+        Generate the next n output bits packed into a single integer.
+
+        Requests shorter than the register are served by word steps;
+        longer ones use the word-parallel path of GeneralLFSR on the state
+        as an integer.
+
+        Parameters:
+            n (int): Number of bits to generate.
+
+        Returns:
+            int: The generated bits, first bit in the lowest position.
+
+        Raises:
+            ValueError: If n is negative.
+        """
+        if n < 0:
+            raise ValueError("Number of bits must be non-negative")
+        # Word steps cost O(taps) per 64 bits against O(size) for converting
+        # the buffer, so they win while the request is shorter than the state
+        if n >= self.config.size:
+            return super().next_word(n)
+        left = self.left
+        if n <= left:
+            word = self.out & ((1 << n) - 1)
+            self.out >>= n
+            self.left = left - n
+            return word
+        word = self.out & ((1 << left) - 1)
+        filled = left
+        while True:
+            out = self._step_word()
+            wanted = n - filled
+            if wanted <= WORD_BITS:
+                word |= (out & ((1 << wanted) - 1)) << filled
+                self.out = out >> wanted
+                self.left = WORD_BITS - wanted
+                return word
+            word |= out << filled
+            filled += WORD_BITS
@@ -0,0 +1,140 @@
+# src/parallel.py
+"""
+Multi-process keystream generation.
+
+The output range is split into contiguous segments, each worker jumps its
+own copy of the register to the start of its segment with skip() and writes
+its bytes straight into a shared memory block.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .general_lfsr import GeneralLFSR
+
+
+# Bytes generated per next_bytes() call inside a worker, bounds the
+# temporary integers a worker holds at any time
+CHUNK_SIZE = 1 << 22
+
+# Below this many bytes per worker, process start-up costs more than it saves
+MIN_SEGMENT = 1 << 16
+
+
+def _generate_segment(lfsr, shm_name, offset, length):
+    """
+    Worker entry point: generate bytes [offset, offset + length) of the stream.
+
+    Parameters:
+        lfsr (GeneralLFSR): The register at the start of the whole stream,
+                            received as a pickled copy.
+        shm_name (str): Name of the shared memory block to write into.
+        offset (int): First byte of the segment.
+        length (int): Number of bytes in the segment.
+
+    Returns:
+        int: Number of bytes written.
+    """
+    lfsr.skip(8 * offset)
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        position = offset
+        end = offset + length
+        while position < end:
+            count = min(CHUNK_SIZE, end - position)
+            shm.buf[position:position + count] = lfsr.next_bytes(count)
+            position += count
+    finally:
+        shm.close()
+    return length
+
+
+def split_segments(nbytes, workers):
+    """
+    Split a byte range into contiguous segments of near-equal length.
+
+    Parameters:
+        nbytes (int): Total number of bytes.
+        workers (int): Number of segments.
+
+    Returns:
+        list: (offset, length) pairs covering [0, nbytes) in order.
+    """
+    base, extra = divmod(nbytes, workers)
+    segments = []
+    offset = 0
+    for index in range(workers):
+        length = base + (1 if index < extra else 0)
+        if length:
+            segments.append((offset, length))
+        offset += length
+    return segments
+
+
+def parallel_generate(lfsr, nbytes, workers=None, out=None):
+    """
+    Generate keystream bytes from a GeneralLFSR using several processes.
+
+    The result is byte-identical to lfsr.next_bytes(nbytes) and, like that
+    call, leaves the LFSR advanced past the generated output. Workers get a
+    pickled copy of the register, so subclasses such as LargeLFSR and
+    TableLFSR keep their own stepping code.
+
+    Without `out` the keystream is assembled in a temporary shared memory
+    block and returned as bytes, which copies it once. To avoid the copy,
+    pass a SharedMemory block of at least nbytes as `out`: the workers
+    write straight into it and the result is a memoryview of its first
+    nbytes bytes, to be released before the block is closed.
+
+    Parameters:
+        lfsr (GeneralLFSR): The register to generate from.
+        nbytes (int): Number of bytes to generate.
+        workers (int, optional): Number of worker processes. Defaults to
+                                 the number of CPUs.
+        out (SharedMemory, optional): Block to write the keystream into.
+
+    Returns:
+        bytes, or memoryview of out.buf if out is given: The keystream.
+
+    Raises:
+        TypeError: If lfsr is not a GeneralLFSR.
+        ValueError: If nbytes is negative, workers is less than 1 or out
+                    is smaller than nbytes.
+    """
+    if not isinstance(lfsr, GeneralLFSR):
+        raise TypeError(f"parallel_generate needs a GeneralLFSR, not {type(lfsr).__name__}")
+    if nbytes < 0:
+        raise ValueError("Number of bytes must be non-negative")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("Number of workers must be at least 1")
+    if out is not None and out.size < nbytes:
+        raise ValueError(f"Output block holds {out.size} bytes, {nbytes} needed")
+
+    workers = min(workers, max(nbytes // MIN_SEGMENT, 1))
+    if workers == 1:
+        data = lfsr.next_bytes(nbytes)
+        if out is None:
+            return data
+        out.buf[:nbytes] = data
+        return out.buf[:nbytes]
+
+    shm = out if out is not None else shared_memory.SharedMemory(create=True, size=nbytes)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_generate_segment, lfsr, shm.name, offset, length)
+                for offset, length in split_segments(nbytes, workers)
+            ]
+            for future in futures:
+                future.result()
+        result = shm.buf[:nbytes] if out is not None else bytes(shm.buf[:nbytes])
+    finally:
+        if out is None:
+            shm.close()
+            shm.unlink()
+
+    lfsr.skip(8 * nbytes)
+    return result
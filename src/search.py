@@ -0,0 +1,259 @@
+# src/search.py
+"""
+Parallel search for primitive polynomials.
+
+Enumerates low-weight feedback polynomials of a given degree, tests them
+for primitivity in a process pool and streams the maximum-length tap sets
+as they are found. Long searches can be cancelled and resumed from a
+checkpoint file.
+"""
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from math import comb
+
+from .gf2 import is_primitive, mersenne_prime_factors, seed_mersenne_factors
+
+
+# Candidates tested per work item
+CHUNK_SIZE = 512
+
+
+def unrank_combination(rank, k):
+    """
+    Return the combination of a given rank in colexicographic order.
+
+    Colex order lists k-subsets of {0, 1, ...} by their largest element,
+    then the next largest and so on, and the rank of c[0] < ... < c[k-1]
+    is sum(C(c[i], i + 1)).
+
+    Parameters:
+        rank (int): The rank, from 0.
+        k (int): Size of the combination.
+
+    Returns:
+        list: The elements in increasing order.
+    """
+    elements = []
+    for i in range(k, 0, -1):
+        # Largest c with C(c, i) <= rank
+        c = i - 1
+        while comb(c + 1, i) <= rank:
+            c += 1
+        rank -= comb(c, i)
+        elements.append(c)
+    return elements[::-1]
+
+
+def _next_combination(elements):
+    """Advance a combination to the next one in colex order, in place."""
+    for j in range(len(elements)):
+        if j + 1 == len(elements) or elements[j] + 1 < elements[j + 1]:
+            elements[j] += 1
+            elements[:j] = range(j)
+            return
+
+
+def _init_worker(size, factors):
+    """Share the factorization of 2^size - 1 with a worker process."""
+    seed_mersenne_factors(size, factors)
+
+
+def _search_chunk(size, weight, start, stop, constraints):
+    """
+    Worker entry point: test the candidates with ranks [start, stop).
+
+    Parameters:
+        size (int): Degree of the polynomials.
+        weight (int): Number of terms.
+        start (int): First rank.
+        stop (int): Rank after the last one.
+        constraints (tuple): Tap filters a candidate must all accept.
+
+    Returns:
+        list: Tap lists of the primitive candidates, in rank order.
+    """
+    found = []
+    middle = unrank_combination(start, weight - 2)
+    base = (1 << size) | 1
+    for _ in range(start, stop):
+        taps = [exponent + 1 for exponent in reversed(middle)] + [0]
+        if all(constraint(taps) for constraint in constraints):
+            poly = base
+            for exponent in middle:
+                poly |= 2 << exponent
+            if is_primitive(poly):
+                found.append(taps)
+        _next_combination(middle)
+    return found
+
+
+def _as_constraints(constraints):
+    """Return None, a single filter or an iterable of filters as a tuple."""
+    if constraints is None:
+        return ()
+    if callable(constraints):
+        return (constraints,)
+    constraints = tuple(constraints)
+    if not all(callable(constraint) for constraint in constraints):
+        raise TypeError("Constraints must be callables")
+    return constraints
+
+
+def _constraint_name(constraint):
+    """
+    Return the importable name of a constraint, recorded in checkpoints.
+
+    Raises:
+        ValueError: If the constraint has no module-level name, like a
+                    lambda or a nested function, so a resumed search could
+                    not tell it apart from another filter.
+    """
+    module = getattr(constraint, '__module__', None)
+    qualname = getattr(constraint, '__qualname__', None)
+    if module is None or qualname is None or '<' in qualname:
+        raise ValueError("A checkpointed search needs a module-level constraint function")
+    return f"{module}.{qualname}"
+
+
+def _load_checkpoint(path, settings):
+    """Return (completed chunks, found taps) from a checkpoint file."""
+    if path is None or not os.path.exists(path):
+        return set(), []
+    with open(path) as handle:
+        data = json.load(handle)
+    if data['settings'] != settings:
+        raise ValueError(f"Checkpoint {path} belongs to a different search")
+    done = set()
+    for first, last in data['done']:
+        done.update(range(first, last + 1))
+    return done, data['found']
+
+
+def _save_checkpoint(path, settings, done, found):
+    """Atomically write the search progress to a checkpoint file."""
+    # Chunks finish almost in order, so runs of indices stay few
+    runs = []
+    for index in sorted(done):
+        if runs and runs[-1][1] == index - 1:
+            runs[-1][1] = index
+        else:
+            runs.append([index, index])
+    temporary = path + '.tmp'
+    with open(temporary, 'w') as handle:
+        json.dump({'settings': settings, 'done': runs, 'found': found}, handle)
+    os.replace(temporary, path)
+
+
+def search_primitive(size, weight=5, constraints=None, workers=None, checkpoint=None,
+                     cancel=None, chunk_size=CHUNK_SIZE):
+    """
+    Search for primitive feedback polynomials of a given degree and weight.
+
+    Candidates x^size + x^a + ... + 1 are enumerated by their middle
+    exponents, lowest top exponent first, and split into chunks that a
+    process pool tests with the Rabin irreducibility test and the order of
+    x against the prime factors of 2^size - 1, which are computed once.
+    Every hit is a maximum-length configuration; no register is stepped.
+
+    Results are yielded as soon as their chunk finishes, so they arrive in
+    roughly but not strictly increasing order. With a checkpoint file,
+    progress is saved after every chunk and a later call with the same
+    arguments skips finished chunks and first yields the taps already found,
+    giving the same results as an uninterrupted search. The constraints are
+    recorded by their module and qualified names, so they must be
+    module-level functions when checkpointing.
+
+    Parameters:
+        size (int): Degree of the polynomials, i.e. the LFSR size.
+        weight (int): Number of terms, odd and at least 3; a polynomial with
+                      an even number of terms is divisible by x + 1.
+        constraints (callable or iterable, optional): Filters called with
+                    each candidate's taps; only candidates all of them
+                    accept are tested. Must be picklable, e.g. module-level
+                    functions, when workers > 1.
+        workers (int, optional): Number of worker processes. Defaults to
+                                 the number of CPUs; 1 searches in-process.
+        checkpoint (str, optional): Path of a checkpoint file to resume from
+                                    and save progress to.
+        cancel (threading.Event, optional): Stops the search, after saving
+                                            progress, once set.
+        chunk_size (int): Candidates per work item.
+
+    Yields:
+        list: Taps of a primitive polynomial, as for GeneralLFSR, highest
+              first and ending in 0.
+
+    Raises:
+        ValueError: If the weight, size or workers are invalid, the
+                    checkpoint belongs to a different search, or a
+                    checkpointed constraint has no module-level name.
+        TypeError: If a constraint is not callable.
+    """
+    if weight < 3 or weight % 2 == 0:
+        raise ValueError("Weight must be odd and at least 3")
+    if size < weight - 1:
+        raise ValueError(f"Size must be at least {weight - 1} for weight {weight}")
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("Number of workers must be at least 1")
+    constraints = _as_constraints(constraints)
+
+    total = comb(size - 1, weight - 2)
+    chunks = (total + chunk_size - 1) // chunk_size
+    settings = {'size': size, 'weight': weight, 'chunk_size': chunk_size}
+    if checkpoint is not None:
+        settings['constraints'] = [_constraint_name(constraint) for constraint in constraints]
+    done, found = _load_checkpoint(checkpoint, settings)
+    yield from [list(taps) for taps in found]
+
+    factors = mersenne_prime_factors(size)
+    pending = (index for index in range(chunks) if index not in done)
+
+    def finish(index, taps_found):
+        done.add(index)
+        found.extend(taps_found)
+        if checkpoint is not None:
+            _save_checkpoint(checkpoint, settings, done, found)
+
+    if workers == 1:
+        for index in pending:
+            if cancel is not None and cancel.is_set():
+                return
+            start = index * chunk_size
+            result = _search_chunk(size, weight, start, min(start + chunk_size, total), constraints)
+            finish(index, result)
+            yield from result
+        return
+
+    # Keep a bounded number of chunks in flight so memory stays flat and
+    # cancellation takes effect quickly
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                   initargs=(size, factors))
+    running = {}
+    try:
+        while True:
+            while len(running) < 2 * workers and not (cancel is not None and cancel.is_set()):
+                index = next(pending, None)
+                if index is None:
+                    break
+                start = index * chunk_size
+                future = executor.submit(_search_chunk, size, weight, start,
+                                         min(start + chunk_size, total), constraints)
+                running[future] = index
+            if not running:
+                return
+            completed, _ = wait(running, timeout=0.5, return_when=FIRST_COMPLETED)
+            for future in completed:
+                result = future.result()
+                finish(running.pop(future), result)
+                yield from result
+            if cancel is not None and cancel.is_set():
+                return
+    finally:
+        for future in running:
+            future.cancel()
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,342 @@
+# src/sequence_cache.py
+"""
+Memoized output sequences of small LFSRs.
+
+The whole period of a register of up to a few dozen bits fits in memory,
+so it can be generated once, stored as packed bits and then indexed
+directly instead of stepping the register again for every query.
+"""
+import copy
+import threading
+from collections import OrderedDict, namedtuple
+
+from .basic_lfsr import BasicLFSR
+from .general_lfsr import GeneralLFSR
+from .utils import compute_period
+
+
+# Largest register size whose sequences are cached by default
+MAX_CACHED_SIZE = 24
+
+# Default memory budget of a cache in bytes
+DEFAULT_MAX_BYTES = 64 << 20
+
+# Approximate memory of one entry of an orbit's state index in bytes
+_INDEX_ENTRY_BYTES = 100
+
+# Bits stepped per next_word() call when skipping without skip()
+_DIRECT_CHUNK = 1 << 20
+
+# Maps the ASCII digits '0' and '1' to the bit values 0 and 1
+_ASCII_TO_BIT = bytes.maketrans(b'01', b'\x00\x01')
+
+# One cached cycle of states: its period, the output sequence from the
+# state it was built from (period + size bits, packed least significant
+# bit first, so every state's window is contiguous), the sampling interval
+# of the index and the index mapping sampled states to their offsets
+Orbit = namedtuple('Orbit', ['period', 'data', 'interval', 'index'])
+
+
+def _bit_list(word, n):
+    """Return the n lowest bits of a word as a list, lowest bit first."""
+    if n == 0:
+        return []
+    return list(format(word, f'0{n}b')[::-1].encode('ascii').translate(_ASCII_TO_BIT))
+
+
+def _configuration(lfsr):
+    """
+    Return (size, tap mask) of a register whose sequence can be cached.
+
+    Returns:
+        tuple or None: The configuration, or None for register types whose
+                       state is not the window of their next output bits.
+    """
+    if isinstance(lfsr, GeneralLFSR):
+        return lfsr.size, lfsr.config.tap_mask
+    if isinstance(lfsr, BasicLFSR):
+        return lfsr.size, (1 << 3) | 1
+    return None
+
+
+class SequenceCache:
+    """
+    An LRU cache of full-period output sequences of small LFSRs.
+
+    The state of a Fibonacci LFSR is the window of its next `size` output
+    bits, so every seed on the same cycle of states reads the same periodic
+    sequence, only from a different offset. Entries are kept per cycle
+    ("orbit") of each (size, taps) configuration, and registers on a cached
+    orbit are served from it by looking up their offset: the register's
+    state is stepped until it hits one of the states sampled every
+    `interval` positions along the orbit, at most sqrt(2^size) steps.
+
+    Only configurations with tap 0 are cached, since the others lose state
+    bits and their sequences start with a transient. Those, registers larger
+    than max_size and orbits beyond the byte budget are served by stepping
+    a copy of the register instead.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, max_size=MAX_CACHED_SIZE):
+        """
+        Create an empty cache.
+
+        Parameters:
+            max_bytes (int): Memory budget for the cached orbits; the least
+                             recently used ones are evicted beyond it.
+            max_size (int): Largest register size to cache.
+
+        Raises:
+            ValueError: If the budget is negative or max_size is below 1.
+        """
+        if max_bytes < 0:
+            raise ValueError("Memory budget must be non-negative")
+        if max_size < 1:
+            raise ValueError("Maximum size must be at least 1")
+        self.max_bytes = max_bytes
+        self.max_size = max_size
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._orbits = OrderedDict()
+        self._by_config = {}
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        """
+        Return the number of cached orbits.
+
+        Returns:
+            int: Number of orbits.
+        """
+        return len(self._orbits)
+
+    def clear(self):
+        """
+        Drop every cached orbit.
+        """
+        with self._lock:
+            self._orbits.clear()
+            self._by_config.clear()
+            self.nbytes = 0
+
+    @staticmethod
+    def _cost(orbit):
+        """Return the memory charged to an orbit."""
+        return len(orbit.data) + len(orbit.index) * _INDEX_ENTRY_BYTES
+
+    def _build(self, size, tap_mask, state):
+        """Generate and index the orbit through a state."""
+        taps = [tap for tap in range(size - 1, -1, -1) if (tap_mask >> tap) & 1]
+        lfsr = GeneralLFSR(size=size, taps=taps, seed=state)
+        period = compute_period(lfsr)
+        data = lfsr.next_word(period + size).to_bytes((period + size + 7) >> 3, 'little')
+
+        # Sample states at byte-aligned positions about sqrt(period) apart
+        interval = 8
+        while interval * interval < period:
+            interval *= 2
+        nbytes = (size + 7) >> 3
+        mask = (1 << size) - 1
+        index = {int.from_bytes(data[t >> 3:(t >> 3) + nbytes], 'little') & mask: t
+                 for t in range(0, period, interval)}
+        return Orbit(period, data, interval, index)
+
+    def lookup(self, lfsr):
+        """
+        Find the cached orbit of a register, generating it if needed.
+
+        Parameters:
+            lfsr: A GeneralLFSR (or subclass) or BasicLFSR.
+
+        Returns:
+            tuple or None: (orbit, offset of the register's state in the
+                           orbit's sequence), or None if the register is not
+                           cacheable or its orbit exceeds the budget.
+        """
+        configuration = _configuration(lfsr)
+        if configuration is None:
+            return None
+        size, tap_mask = configuration
+        if size > self.max_size or not tap_mask & 1:
+            return None
+
+        with self._lock:
+            # Step the state until it reaches a sampled state of an orbit
+            keys = self._by_config.get(configuration, [])
+            start = state = lfsr.state
+            for steps in range(1 << ((size + 1) // 2 + 3) if keys else 0):
+                for key in keys:
+                    orbit = self._orbits[key]
+                    position = orbit.index.get(state)
+                    if position is not None:
+                        self._orbits.move_to_end(key)
+                        self.hits += 1
+                        return orbit, (position - steps) % orbit.period
+                state = (state >> 1) | (((state & tap_mask).bit_count() & 1) << (size - 1))
+                if state == start:
+                    break
+
+            self.misses += 1
+            orbit = self._build(size, tap_mask, start)
+            cost = self._cost(orbit)
+            if cost > self.max_bytes:
+                return None
+            while self.nbytes + cost > self.max_bytes:
+                evicted, old = self._orbits.popitem(last=False)
+                self._by_config[evicted[:2]].remove(evicted)
+                self.nbytes -= self._cost(old)
+            key = configuration + (start,)
+            self._orbits[key] = orbit
+            self._by_config.setdefault(configuration, []).append(key)
+            self.nbytes += cost
+            return orbit, 0
+
+    @staticmethod
+    def _word(orbit, start, n):
+        """Return n sequence bits from a position, wrapping around the period."""
+        if n > orbit.period:
+            # Repeat one period by doubling instead of wrapping n / period times
+            word = SequenceCache._word(orbit, start, orbit.period)
+            length = orbit.period
+            while length < n:
+                word |= word << length
+                length *= 2
+            return word & ((1 << n) - 1)
+        word = 0
+        shift = 0
+        while n > 0:
+            count = min(n, orbit.period - start)
+            chunk = int.from_bytes(orbit.data[start >> 3:((start + count + 7) >> 3) + 1], 'little')
+            word |= ((chunk >> (start & 7)) & ((1 << count) - 1)) << shift
+            shift += count
+            n -= count
+            start = 0
+        return word
+
+    def _direct(self, lfsr, i, n):
+        """Return output bits i to i+n-1 by stepping a copy of the register."""
+        # A deep copy, since a combiner's copy.copy() shares its registers
+        walker = copy.deepcopy(lfsr)
+        if hasattr(walker, 'skip'):
+            walker.skip(i)
+            return walker.next_word(n)
+        if hasattr(walker, 'next_word'):
+            while i > 0:
+                count = min(i, _DIRECT_CHUNK)
+                walker.next_word(count)
+                i -= count
+            return walker.next_word(n)
+        for _ in range(i):
+            walker.next_bit()
+        word = 0
+        for k in range(n):
+            word |= walker.next_bit() << k
+        return word
+
+    def bit_at(self, lfsr, i):
+        """
+        Return output bit i of a register without advancing it.
+
+        Parameters:
+            lfsr: The register.
+            i (int): Index of the bit, 0 being the next next_bit() output.
+
+        Returns:
+            int: The bit (0 or 1).
+
+        Raises:
+            ValueError: If i is negative.
+        """
+        if i < 0:
+            raise ValueError("Bit index must be non-negative")
+        found = self.lookup(lfsr)
+        if found is None:
+            return self._direct(lfsr, i, 1)
+        orbit, offset = found
+        position = (offset + i) % orbit.period
+        return (orbit.data[position >> 3] >> (position & 7)) & 1
+
+    def slice(self, lfsr, i, j):
+        """
+        Return output bits i to j-1 of a register without advancing it.
+
+        Parameters:
+            lfsr: The register.
+            i (int): Index of the first bit.
+            j (int): Index past the last bit.
+
+        Returns:
+            list: The j - i bits, as next_bits() would return them.
+
+        Raises:
+            ValueError: If i is negative or j is smaller than i.
+        """
+        if i < 0 or j < i:
+            raise ValueError("Slice bounds must satisfy 0 <= i <= j")
+        n = j - i
+        found = self.lookup(lfsr)
+        if found is None:
+            word = self._direct(lfsr, i, n)
+        else:
+            orbit, offset = found
+            word = self._word(orbit, (offset + i) % orbit.period, n)
+        return _bit_list(word, n)
+
+    def generate_sequence(self, lfsr, length):
+        """
+        Generate output bits and advance the register past them.
+
+        Parameters:
+            lfsr: The register.
+            length (int): Number of bits to generate.
+
+        Returns:
+            list: The generated bits.
+
+        Raises:
+            ValueError: If length is negative.
+        """
+        if length < 0:
+            raise ValueError("Length must be non-negative")
+        found = self.lookup(lfsr)
+        if found is None:
+            return [lfsr.next_bit() for _ in range(length)]
+        orbit, offset = found
+        bits = _bit_list(self._word(orbit, offset, length), length)
+        # The new state is the window of the next size bits
+        lfsr.state = self._word(orbit, (offset + length) % orbit.period, lfsr.size)
+        return bits
+
+
+# Cache shared by the module-level functions and utils.generate_sequence()
+default_cache = SequenceCache()
+
+
+def bit_at(lfsr, i):
+    """
+    Return output bit i of a register through the default cache.
+
+    Parameters:
+        lfsr: The register.
+        i (int): Index of the bit, 0 being the next next_bit() output.
+
+    Returns:
+        int: The bit (0 or 1).
+    """
+    return default_cache.bit_at(lfsr, i)
+
+
+def sequence_slice(lfsr, i, j):
+    """
+    Return output bits i to j-1 of a register through the default cache.
+
+    Parameters:
+        lfsr: The register.
+        i (int): Index of the first bit.
+        j (int): Index past the last bit.
+
+    Returns:
+        list: The j - i bits.
+    """
+    return default_cache.slice(lfsr, i, j)
@@ -0,0 +1,358 @@
+# src/stream.py
+"""
+Streaming keystream output.
+
+Lazy byte iteration, a file-like reader and an asyncio reader over an
+LFSR, so arbitrarily long keystreams can be consumed in bounded memory.
+"""
+import asyncio
+import io
+
+from .utils import bits_to_bytes
+
+
+# Default number of bytes generated per step
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def read_bytes(lfsr, n):
+    """
+    Generate the next n keystream bytes from any LFSR.
+
+    Bits are packed most significant bit first, like bits_to_bytes().
+    Uses the LFSR's bulk output when it has one and falls back to next_bit().
+
+    Parameters:
+        lfsr: An LFSR instance with at least a next_bit() method.
+        n (int): Number of bytes to generate.
+
+    Returns:
+        bytes: The generated keystream bytes.
+    """
+    if hasattr(lfsr, 'next_bytes'):
+        return lfsr.next_bytes(n)
+    if hasattr(lfsr, 'next_bits'):
+        return bits_to_bytes(lfsr.next_bits(8 * n))
+    return bits_to_bytes([lfsr.next_bit() for _ in range(8 * n)])
+
+
+def iter_bytes(lfsr, chunk_size=DEFAULT_CHUNK_SIZE, nbytes=None):
+    """
+    Lazily yield the keystream of an LFSR in chunks.
+
+    Parameters:
+        lfsr: An LFSR instance with at least a next_bit() method.
+        chunk_size (int): Number of bytes per yielded chunk.
+        nbytes (int, optional): Total number of bytes to yield. If None,
+                                the iterator never ends.
+
+    Yields:
+        bytes: Consecutive keystream chunks; the last one may be shorter.
+
+    Raises:
+        ValueError: If chunk_size is not positive.
+    """
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+
+    remaining = nbytes
+    while remaining is None or remaining > 0:
+        count = chunk_size if remaining is None else min(chunk_size, remaining)
+        yield read_bytes(lfsr, count)
+        if remaining is not None:
+            remaining -= count
+
+
+class LFSRStream(io.RawIOBase):
+    """
+    A read-only raw binary stream over an LFSR keystream.
+
+    readinto() generates exactly as many bytes as the caller's buffer
+    holds, so the stream works with shutil.copyfileobj, io.BufferedReader,
+    hashers and sockets while only ever holding one buffer of keystream.
+    The bytes are the same as repeated next_bit() calls packed by
+    bits_to_bytes(). An endless stream never reaches end of file, so
+    read() without a size needs a length.
+    """
+
+    def __init__(self, lfsr, length=None):
+        """
+        Wrap an LFSR as a stream.
+
+        Parameters:
+            lfsr: An LFSR instance with at least a next_bit() method.
+            length (int, optional): Number of bytes before end of stream.
+                                    If None, the stream is endless.
+        """
+        super().__init__()
+        self.lfsr = lfsr
+        self.length = length
+        self.position = 0
+
+    def readable(self):
+        """
+        Return True: the stream supports reading.
+
+        Returns:
+            bool: Always True.
+        """
+        return True
+
+    def readinto(self, buffer):
+        """
+        Fill a caller-supplied buffer with keystream bytes.
+
+        Parameters:
+            buffer: A writable buffer-protocol object.
+
+        Returns:
+            int: Number of bytes written, 0 at end of stream.
+        """
+        view = memoryview(buffer).cast('B')
+        count = len(view)
+        if self.length is not None:
+            count = min(count, self.length - self.position)
+        if count <= 0:
+            return 0
+
+        view[:count] = read_bytes(self.lfsr, count)
+        self.position += count
+        return count
+
+    def readall(self):
+        """
+        Read the rest of a stream with a length.
+
+        Also serves read() and read(-1).
+
+        Returns:
+            bytes: The remaining keystream bytes, b'' at end of stream.
+
+        Raises:
+            ValueError: If the stream is endless.
+        """
+        if self.length is None:
+            raise ValueError("Cannot read an endless keystream without a size")
+        count = max(self.length - self.position, 0)
+        data = read_bytes(self.lfsr, count)
+        self.position += count
+        return data
+
+    def tell(self):
+        """
+        Return the number of bytes read so far.
+
+        Returns:
+            int: The current stream position.
+        """
+        return self.position
+
+
+class AsyncLFSRStream:
+    """
+    An asyncio reader over an LFSR keystream.
+
+    Keystream is generated in large chunks by a background task that runs
+    read_bytes() in an executor, so the event loop never blocks on
+    generation. The task works at most `prefetch` chunks ahead of the
+    reader: the next chunk is produced while the current one is consumed,
+    and generation pauses while the reader falls behind, so a slow network
+    consumer holds memory for only a few chunks. Output is the same as
+    LFSRStream for the same register.
+
+    Use as an async context manager, or call aclose(), so the background
+    task is stopped.
+    """
+
+    def __init__(self, lfsr, length=None, chunk_size=DEFAULT_CHUNK_SIZE, prefetch=1,
+                 executor=None):
+        """
+        Wrap an LFSR as an asynchronous stream.
+
+        Parameters:
+            lfsr: An LFSR instance with at least a next_bit() method. It must
+                  not be used elsewhere while the stream is open.
+            length (int, optional): Number of bytes before end of stream.
+                                    If None, the stream is endless.
+            chunk_size (int): Number of bytes generated per executor call.
+            prefetch (int): Number of chunks generated ahead of the reader.
+            executor (concurrent.futures.Executor, optional): Executor to
+                generate in; defaults to the event loop's thread pool.
+
+        Raises:
+            ValueError: If chunk_size or prefetch is not positive.
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+        if prefetch <= 0:
+            raise ValueError("Prefetch must be positive")
+        self.lfsr = lfsr
+        self.length = length
+        self.chunk_size = chunk_size
+        self.prefetch = prefetch
+        self.executor = executor
+        self.position = 0
+        self._queue = asyncio.Queue(maxsize=prefetch)
+        self._producer = None
+        self._buffer = b''
+        self._offset = 0
+        self._eof = False
+
+    async def _produce(self):
+        """Generate chunks in the executor and queue them for the reader."""
+        loop = asyncio.get_running_loop()
+        remaining = self.length
+        try:
+            while remaining is None or remaining > 0:
+                count = self.chunk_size if remaining is None else min(self.chunk_size, remaining)
+                future = loop.run_in_executor(self.executor, read_bytes, self.lfsr, count)
+                try:
+                    chunk = await asyncio.shield(future)
+                except asyncio.CancelledError:
+                    # The executor call cannot be interrupted; let it finish
+                    # so the register is not stepped after aclose()
+                    await asyncio.wait([future])
+                    raise
+                # Blocks while the reader is `prefetch` chunks behind
+                await self._queue.put(chunk)
+                if remaining is not None:
+                    remaining -= count
+        except Exception as error:
+            await self._queue.put(error)
+            return
+        await self._queue.put(b'')
+
+    async def _next_chunk(self):
+        """Wait for the next generated chunk, b'' at end of stream."""
+        if self._producer is None:
+            self._producer = asyncio.ensure_future(self._produce())
+        chunk = await self._queue.get()
+        if isinstance(chunk, Exception):
+            self._eof = True
+            raise chunk
+        if not chunk:
+            self._eof = True
+        return chunk
+
+    async def read(self, n=-1):
+        """
+        Read up to n keystream bytes.
+
+        Parameters:
+            n (int): Number of bytes to read; -1 reads to the end of a
+                     stream with a length.
+
+        Returns:
+            bytes: n bytes, fewer only at end of stream, b'' after it.
+
+        Raises:
+            ValueError: If n is negative for an endless stream.
+        """
+        if n < 0:
+            if self.length is None:
+                raise ValueError("Cannot read an endless keystream without a size")
+            n = self.length - self.position
+
+        parts = []
+        wanted = n
+        while wanted > 0:
+            if self._offset == len(self._buffer):
+                if self._eof:
+                    break
+                self._buffer, self._offset = await self._next_chunk(), 0
+                continue
+            part = self._buffer[self._offset:self._offset + wanted]
+            self._offset += len(part)
+            wanted -= len(part)
+            parts.append(part)
+
+        data = b''.join(parts)
+        self.position += len(data)
+        return data
+
+    async def copy_to(self, writer, nbytes=None):
+        """
+        Write keystream to an asyncio StreamWriter, chunk by chunk.
+
+        Awaits writer.drain() after every chunk, so a slow peer slows down
+        generation instead of filling the transport buffer.
+
+        Parameters:
+            writer (asyncio.StreamWriter): The destination.
+            nbytes (int, optional): Number of bytes to write. If None, writes
+                                    to the end of a stream with a length.
+
+        Returns:
+            int: Number of bytes written.
+
+        Raises:
+            ValueError: If nbytes is None for an endless stream.
+        """
+        if nbytes is None:
+            if self.length is None:
+                raise ValueError("Cannot copy an endless keystream without a size")
+            nbytes = self.length - self.position
+        written = 0
+        while written < nbytes:
+            data = await self.read(min(self.chunk_size, nbytes - written))
+            if not data:
+                break
+            writer.write(data)
+            await writer.drain()
+            written += len(data)
+        return written
+
+    def __aiter__(self):
+        """
+        Iterate over the keystream in chunks.
+
+        Returns:
+            AsyncLFSRStream: The stream itself.
+        """
+        return self
+
+    async def __anext__(self):
+        """
+        Return the next chunk of keystream.
+
+        Returns:
+            bytes: Up to chunk_size bytes.
+
+        Raises:
+            StopAsyncIteration: At end of stream.
+        """
+        data = await self.read(self.chunk_size)
+        if not data:
+            raise StopAsyncIteration
+        return data
+
+    async def aclose(self):
+        """
+        Stop the background generation.
+
+        A chunk already being generated is waited for, so the LFSR is not
+        stepped after aclose() returns.
+        """
+        if self._producer is not None and not self._producer.done():
+            self._producer.cancel()
+            try:
+                await self._producer
+            except asyncio.CancelledError:
+                pass
+        self._eof = True
+        self._buffer, self._offset = b'', 0
+
+    async def __aenter__(self):
+        """
+        Enter the async context.
+
+        Returns:
+            AsyncLFSRStream: The stream itself.
+        """
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """
+        Stop the background generation on leaving the async context.
+        """
+        await self.aclose()
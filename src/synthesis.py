@@ -0,0 +1,286 @@
+# src/synthesis.py
+"""
+LFSR synthesis with the Berlekamp-Massey algorithm.
+
+Recovers the shortest GeneralLFSR that generates an observed bit sequence,
+either from a whole sequence at once or incrementally as bits arrive.
+"""
+from .general_lfsr import GeneralLFSR
+from .utils import _BIT_TO_ASCII, _numpy
+
+
+# Extra window bits kept beyond twice the complexity, so small jumps in
+# complexity never need the window rebuilt
+WINDOW_SLACK = 64
+
+# Linear complexity from which extend() switches from Python integers to
+# NumPy word arrays, whose per-step overhead is higher but per-bit cost lower
+ARRAY_THRESHOLD = 1 << 15
+
+
+class BerlekampMassey:
+    """
+    Incremental Berlekamp-Massey synthesizer over GF(2).
+
+    Tracks the connection polynomial C(x) = 1 + c1*x + ... + cL*x^L of the
+    shortest LFSR generating the bits seen so far, so that
+    s[i] = c1*s[i-1] + ... + cL*s[i-L] for every i >= L. The linear
+    complexity L is updated as each bit arrives.
+
+    Polynomials and the window of recent bits are kept bit-packed in Python
+    integers: each discrepancy is the parity of one AND and each correction
+    one shifted XOR, so a step costs O(L / 64) machine words rather than
+    O(L) Python operations. Once the complexity is large, extend() moves to
+    NumPy uint64 arrays and reads the window from precomputed shifted copies
+    of the sequence instead of shifting it every step, so million-bit
+    inputs finish in seconds.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty synthesizer.
+        """
+        self.complexity = 0
+        self.length = 0
+        self._connection = 1
+        self._previous = 1
+        self._last_change = -1
+        self._window = 0
+        self._mask = (1 << WINDOW_SLACK) - 1
+        self._bits = bytearray()
+
+    def update(self, bit):
+        """
+        Feed the next bit of the sequence.
+
+        Parameters:
+            bit (int): The next bit (0 or 1).
+
+        Returns:
+            int: The linear complexity of the sequence so far.
+        """
+        bit &= 1
+        self._bits.append(bit)
+        n = self.length
+        self.length += 1
+
+        # Bit i of the window is s[n-i]; only i <= complexity is ever read
+        self._window = ((self._window << 1) | bit) & self._mask
+        if (self._connection & self._window).bit_count() & 1:
+            connection = self._connection
+            self._connection ^= self._previous << (n - self._last_change)
+            if 2 * self.complexity <= n:
+                self.complexity = n + 1 - self.complexity
+                self._previous = connection
+                self._last_change = n
+                self._resize_window()
+        return self.complexity
+
+    def _resize_window(self):
+        """
+        Size the window for the current complexity.
+
+        The window keeps about twice the bits the complexity needs, so it
+        only has to be rebuilt from the stored bits when the complexity more
+        than doubles, which happens O(log n) times.
+        """
+        rebuild = self.complexity >= self._mask.bit_length()
+        self._mask = (1 << (2 * self.complexity + WINDOW_SLACK)) - 1
+        if rebuild:
+            self._rebuild_window()
+
+    def _rebuild_window(self):
+        """
+        Rebuild the window of recent bits from the stored sequence.
+        """
+        recent = self._bits[-self._mask.bit_length():]
+        self._window = int(recent.translate(_BIT_TO_ASCII), 2) if recent else 0
+
+    def extend(self, bits):
+        """
+        Feed several bits of the sequence.
+
+        Parameters:
+            bits (iterable): Bits (0 or 1), e.g. a list or the bytes returned
+                             by unpack_bits().
+
+        Returns:
+            int: The linear complexity of the sequence so far.
+        """
+        data = bytes(bits)
+        np = _numpy()
+        position = 0
+        while position < len(data) and (np is None or self.complexity < ARRAY_THRESHOLD):
+            self.update(data[position])
+            position += 1
+        if position < len(data):
+            self._extend_arrays(np, data[position:])
+        return self.complexity
+
+    def _extend_arrays(self, np, data):
+        """
+        Feed several bits using NumPy uint64 word arrays.
+
+        Bit j of the window at step n is s[n-j], which is bit N-1-n+j of the
+        reversed sequence. Keeping 64 copies of the reversed sequence, one per
+        bit offset, makes every window a word-aligned slice, so no step
+        shifts the sequence.
+
+        Parameters:
+            np: The NumPy module.
+            data (bytes): The new bits.
+        """
+        start = self.length
+        self._bits.extend(data)
+        total = len(self._bits)
+
+        # No window ever reaches further back than this
+        low = min(start - self.complexity, self.complexity)
+        reversed_bits = np.frombuffer(self._bits, dtype=np.uint8)[low:][::-1] & 1
+        words = ((total - low) >> 6) + 2
+        copies = np.zeros((64, words * 8), dtype=np.uint8)
+        for offset in range(64):
+            packed = np.packbits(reversed_bits[offset:], bitorder='little')
+            copies[offset, :len(packed)] = packed
+        copies = copies.view('<u8')
+
+        # Polynomials never exceed total bits; the slack absorbs shifted XORs
+        capacity = 2 * ((total >> 6) + 2)
+
+        def to_array(poly):
+            array = np.zeros(capacity, dtype=np.uint64)
+            packed = poly.to_bytes((poly.bit_length() + 7) >> 3, 'little')
+            array.view(np.uint8)[:len(packed)] = np.frombuffer(packed, dtype=np.uint8)
+            return array
+
+        connection = to_array(self._connection)
+        previous = to_array(self._previous)
+        spare = np.zeros(capacity, dtype=np.uint64)
+        scratch = np.empty(capacity, dtype=np.uint64)
+        complexity = self.complexity
+        last_change = self._last_change
+        previous_words = (self._previous.bit_length() >> 6) + 1
+
+        for n in range(start, total):
+            word, offset = divmod(total - 1 - n, 64)
+            width = (complexity >> 6) + 1
+            product = scratch[:width]
+            np.bitwise_and(connection[:width], copies[offset, word:word + width], out=product)
+            if not int(np.bitwise_xor.reduce(product)).bit_count() & 1:
+                continue
+
+            grow = 2 * complexity <= n
+            if grow:
+                spare[:width] = connection[:width]
+            shift_words, shift_bits = divmod(n - last_change, 64)
+            source = previous[:previous_words]
+            head = connection[shift_words:shift_words + previous_words]
+            if shift_bits:
+                shifted = scratch[:previous_words]
+                np.left_shift(source, shift_bits, out=shifted)
+                np.bitwise_xor(head, shifted, out=head)
+                np.right_shift(source, 64 - shift_bits, out=shifted)
+                tail = connection[shift_words + 1:shift_words + 1 + previous_words]
+                np.bitwise_xor(tail, shifted, out=tail)
+            else:
+                np.bitwise_xor(head, source, out=head)
+            if grow:
+                previous, spare = spare, previous
+                previous_words = width
+                complexity = n + 1 - complexity
+                last_change = n
+
+        def to_int(array):
+            return int.from_bytes(array.tobytes(), 'little')
+
+        self.length = total
+        self.complexity = complexity
+        self._last_change = last_change
+        self._connection = to_int(connection)
+        self._previous = to_int(previous[:previous_words])
+        self._mask = (1 << (2 * complexity + WINDOW_SLACK)) - 1
+        self._rebuild_window()
+
+    def connection_polynomial(self):
+        """
+        Return the current connection polynomial C(x).
+
+        Returns:
+            int: C(x), bit k holding the coefficient of x^k.
+        """
+        return self._connection
+
+    def taps(self):
+        """
+        Return the GeneralLFSR taps of the current shortest LFSR.
+
+        The coefficient of x^j in C(x) becomes tap complexity - j, since a
+        GeneralLFSR of size L computes s[i+L] as the XOR of s[i+tap].
+
+        Returns:
+            list: Tap positions, empty if no feedback is needed.
+        """
+        return [self.complexity - j for j in range(1, self.complexity + 1)
+                if (self._connection >> j) & 1]
+
+    def to_lfsr(self):
+        """
+        Build a GeneralLFSR that generates the sequence seen so far.
+
+        The register is seeded with the first L bits, so its output starts
+        at the beginning of the observed sequence.
+
+        Returns:
+            GeneralLFSR: The shortest LFSR generating the sequence. An all-zero
+                         sequence gives a 1-bit register with zero state.
+        """
+        size = max(self.complexity, 1)
+        # An empty tap list would select the default taps; a cancelling pair
+        # gives no feedback instead
+        taps = self.taps() or [0, 0]
+        head = self._bits[:self.complexity][::-1]
+        seed = int(head.translate(_BIT_TO_ASCII), 2) if head else 0
+        return GeneralLFSR(size=size, taps=taps, seed=seed)
+
+
+def berlekamp_massey(bits):
+    """
+    Find the shortest GeneralLFSR that generates a bit sequence.
+
+    Parameters:
+        bits (iterable): The observed bits (0 or 1), first bit first. Output
+                         of next_bytes() can be expanded with unpack_bits().
+
+    Returns:
+        GeneralLFSR: A register whose next_bit() calls reproduce the sequence.
+    """
+    synthesizer = BerlekampMassey()
+    synthesizer.extend(bits)
+    return synthesizer.to_lfsr()
+
+
+def linear_complexity(bits):
+    """
+    Compute the linear complexity of a bit sequence.
+
+    Parameters:
+        bits (iterable): The bits (0 or 1).
+
+    Returns:
+        int: The length of the shortest LFSR generating the sequence.
+    """
+    return BerlekampMassey().extend(bits)
+
+
+def linear_complexity_profile(bits):
+    """
+    Compute the linear complexity of every prefix of a bit sequence.
+
+    Parameters:
+        bits (iterable): The bits (0 or 1).
+
+    Returns:
+        list: Element i is the linear complexity of the first i+1 bits.
+    """
+    synthesizer = BerlekampMassey()
+    return [synthesizer.update(bit) for bit in bits]
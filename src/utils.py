@@ -2,6 +2,24 @@
 """
 Utility functions for working with LFSRs.
 """
+from functools import lru_cache
+
+from .gf2 import (feedback_polynomial, is_primitive, poly_divmod, poly_gcd,
+                  poly_order)
+
+
+# Maps every byte value to the same byte with its bit order mirrored
+_REVERSED_BYTE = bytes(int(format(i, '08b')[::-1], 2) for i in range(256))
+
+# Maps a bit value to its ASCII digit, only the lowest bit counts
+_BIT_TO_ASCII = bytes(b'01'[i & 1] for i in range(256))
+
+# Maps the ASCII digits '0' and '1' back to the bit values 0 and 1
+_ASCII_TO_BIT = bytes.maketrans(b'01', b'\x00\x01')
+
+# Rho iterations compute_period() allows for any factor of 2^d - 1; enough
+# for every d up to about 170, and a few seconds at most for larger ones
+FACTOR_STEPS = 1 << 18
 
 
 def calculate_maximum_period(size):
@@ -19,59 +37,208 @@ def calculate_maximum_period(size):
     return (1 << size) - 1
 
 
+def _fibonacci_form(lfsr):
+    """Return a GeneralLFSR with the same output as lfsr, or None if unknown."""
+    from .galois_lfsr import GaloisLFSR, galois_to_fibonacci
+    from .general_lfsr import GeneralLFSR
+    if isinstance(lfsr, GeneralLFSR):
+        return lfsr
+    if isinstance(lfsr, GaloisLFSR):
+        return galois_to_fibonacci(lfsr)
+    return None
+
+
+def minimal_polynomial(lfsr):
+    """
+    Compute the minimal polynomial of the sequence an LFSR will output.
+    
+    With characteristic polynomial P, the output sequence s has the
+    generating function sum(s[i] * x^(-i-1)) = G(x) / P(x), where the
+    coefficients of G follow from the current state. The minimal polynomial
+    is P / gcd(P, G). A GaloisLFSR is converted to its Fibonacci form first.
+    
+    Parameters:
+        lfsr (GeneralLFSR or GaloisLFSR): The register.
+    
+    Returns:
+        int: The minimal polynomial, bit k holding the coefficient of x^k.
+    
+    Raises:
+        TypeError: If lfsr is neither a GeneralLFSR nor a GaloisLFSR.
+    """
+    fibonacci = _fibonacci_form(lfsr)
+    if fibonacci is None:
+        raise TypeError(f"No feedback polynomial known for {type(lfsr).__name__}")
+    lfsr = fibonacci
+    poly = feedback_polynomial(lfsr.size, lfsr.taps)
+    numerator = 0
+    for m in range(lfsr.size):
+        if bin((poly >> (m + 1)) & lfsr.state).count('1') & 1:
+            numerator |= 1 << m
+    return poly_divmod(poly, poly_gcd(poly, numerator))[0]
+
+
+def compute_period(lfsr, max_steps=FACTOR_STEPS):
+    """
+    Compute the exact period of the sequence an LFSR will output.
+    
+    The period is derived algebraically from the order of the minimal
+    polynomial of the sequence, so it also covers reducible and
+    non-primitive feedback polynomials and depends on the current state.
+    Factors of x in the minimal polynomial only contribute a transient
+    before the sequence becomes periodic. GaloisLFSR registers are converted
+    to their Fibonacci form first; other LFSRs fall back to find_cycle().
+    
+    The order needs the prime factors of 2^d - 1 for the degrees d of the
+    irreducible factors, and some of those are out of reach, so factoring
+    gives up after max_steps iterations on any one factor.
+    
+    Parameters:
+        lfsr: An LFSR instance with next_bit() and a state attribute.
+        max_steps (int, optional): Rho iterations allowed for any factor
+                                   of 2^d - 1. If None, keeps going.
+    
+    Returns:
+        int: The period of the (eventually periodic) output sequence.
+    
+    Raises:
+        ArithmeticError: If the period needs a factorization beyond max_steps.
+    """
+    fibonacci = _fibonacci_form(lfsr)
+    if fibonacci is None:
+        return find_cycle(lfsr)[1]
+    
+    minimal = minimal_polynomial(fibonacci)
+    while minimal and not minimal & 1:
+        minimal >>= 1
+    return poly_order(minimal, max_steps)
+
+
+def find_cycle(lfsr, distinguished_bits=None, max_steps=None):
+    """
+    Find the transient and cycle length of an LFSR's state sequence.
+    
+    Uses Brent's algorithm on a clone of the LFSR, remembering a single
+    state at a time, so memory stays O(1) however long the period is. The
+    LFSR itself is not advanced. Any object with next_bit() and a
+    comparable, hashable state attribute can be analysed.
+    
+    With distinguished_bits=k the walk also records every state whose hash
+    has its low k bits clear, about one state in 2^k. A repeated
+    distinguished state closes the cycle after at most about 2^k extra
+    steps, instead of up to twice the cycle length for Brent's algorithm
+    alone, at a memory cost of period / 2^k states.
+    
+    A walk that returns to the starting state has no tail and stops there,
+    after exactly one period.
+    
+    Parameters:
+        lfsr: An LFSR instance with next_bit() and a state attribute.
+        distinguished_bits (int, optional): Enables distinguished points
+                                            with this many zero hash bits.
+        max_steps (int, optional): Maximum number of steps of the walk.
+    
+    Returns:
+        tuple: (tail, period) where tail is the number of steps before
+               the state sequence enters its cycle.
+    
+    Raises:
+        ArithmeticError: If the cycle is not found within max_steps steps.
+    """
+    import copy
+    walker = copy.deepcopy(lfsr)
+    mask = (1 << distinguished_bits) - 1 if distinguished_bits is not None else None
+    points = {}
+    
+    # Brent: compare against a saved state that moves to the walker's
+    # position whenever the distance reaches the next power of two
+    start = saved = walker.state
+    power = period = 1
+    step = 1
+    walker.next_bit()
+    while True:
+        state = walker.state
+        if state == start:
+            return 0, step
+        if state == saved:
+            break
+        if mask is not None and hash(state) & mask == 0:
+            if state in points:
+                period = step - points[state]
+                break
+            points[state] = step
+        if power == period:
+            saved = state
+            power *= 2
+            period = 0
+        if max_steps is not None and step >= max_steps:
+            raise ArithmeticError(f"No cycle found within {max_steps} steps")
+        walker.next_bit()
+        period += 1
+        step += 1
+    
+    # Run two clones `period` steps apart until they meet at the cycle start
+    leader = copy.deepcopy(lfsr)
+    follower = copy.deepcopy(lfsr)
+    for _ in range(period):
+        leader.next_bit()
+    tail = 0
+    while leader.state != follower.state:
+        leader.next_bit()
+        follower.next_bit()
+        tail += 1
+    
+    return tail, period
+
+
 def is_maximum_length(lfsr, max_checks=None):
     """
     Check if an LFSR generates a maximum-length sequence.
     
+    GeneralLFSR and GaloisLFSR registers are checked algebraically: the
+    sequence has maximum length exactly when the feedback polynomial is
+    primitive and the state is non-zero. This works for sizes far beyond what walking
+    the 2^n states allows. Other LFSRs, or an explicit max_checks, walk the
+    states of a clone with find_cycle(), leaving the LFSR untouched. The
+    walk stops after 2^n - 1 steps, or max_checks if fewer, and a register
+    whose state has not returned by then is not maximum-length.
+    
     Parameters:
-        lfsr: An LFSR instance with next_bit() and reset() methods.
+        lfsr: An LFSR instance with next_bit() and a state attribute.
         max_checks (int, optional): Maximum number of iterations to check.
-                                   If None, checks 2^n iterations.
+                                   If given, forces the state walk.
     
     Returns:
         bool: True if the LFSR generates a maximum-length sequence.
     """
-    # Store the initial state to restore it later
-    if hasattr(lfsr, 'get_state'):
-        initial_state = lfsr.get_state()
+    fibonacci = _fibonacci_form(lfsr) if max_checks is None else None
+    if fibonacci is not None:
+        return fibonacci.state != 0 and is_primitive(feedback_polynomial(fibonacci.size,
+                                                                         fibonacci.taps))
     
     # Determine the expected period
     expected_period = calculate_maximum_period(lfsr.size)
+    limit = expected_period if max_checks is None else min(max_checks, expected_period)
     
-    # If max_checks is not specified, use 2 * expected_period
-    if max_checks is None:
-        max_checks = 2 * expected_period
-    
-    # Track the sequence of states
-    seen_states = set()
-    current_period = 0
-    
-    # Generate bits and track states
-    for _ in range(max_checks):
-        # Get the current state as an integer for easy comparison
-        state_int = lfsr.state
-        
-        # If we've seen this state before, we've found a cycle
-        if state_int in seen_states:
-            break
-        
-        seen_states.add(state_int)
-        lfsr.next_bit()
-        current_period += 1
-    
-    # Restore the initial state if possible
-    if hasattr(lfsr, 'reset') and hasattr(lfsr, 'get_state'):
-        if hasattr(initial_state, 'state'):
-            lfsr.reset(int(initial_state, 2))
-    
-    # Check if the period matches the expected maximum
-    return current_period == expected_period
+    # A maximum-length register cycles through every non-zero state from
+    # the start, so its walk returns to the start after exactly 2^n - 1
+    # steps; a transient means a singular register, however many distinct
+    # states it visits
+    try:
+        tail, period = find_cycle(lfsr, max_steps=limit)
+    except ArithmeticError:
+        return False
+    return tail == 0 and period == expected_period
 
 
 def generate_sequence(lfsr, length):
     """
     Generate a sequence of bits from an LFSR.
     
+    Registers small enough for sequence_cache.default_cache are served by
+    indexing their memoized period; others are stepped bit by bit. Either
+    way the LFSR ends up advanced by `length` steps.
+    
     Parameters:
         lfsr: An LFSR instance with next_bit() method.
         length (int): Number of bits to generate.
@@ -79,7 +246,135 @@ def generate_sequence(lfsr, length):
     Returns:
         list: A list of generated bits.
     """
-    return [lfsr.next_bit() for _ in range(length)]
+    from .sequence_cache import default_cache
+    return default_cache.generate_sequence(lfsr, length)
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """Return the numpy module, or None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _check_bitorder(bitorder):
+    """Raise ValueError unless bitorder is 'big' or 'little'."""
+    if bitorder not in ('big', 'little'):
+        raise ValueError("Bit order must be 'big' or 'little'")
+
+
+def _write(out, data):
+    """Copy data into the start of a writable buffer and return its length."""
+    view = memoryview(out).cast('B')
+    if len(view) < len(data):
+        raise ValueError(f"Output buffer too small: need {len(data)} bytes")
+    view[:len(data)] = data
+    return len(data)
+
+
+def reverse_bit_order(data):
+    """
+    Mirror the bit order inside every byte.
+    
+    Parameters:
+        data (bytes-like): Input bytes.
+    
+    Returns:
+        bytes: The bytes with bit 7 and bit 0 swapped, bit 6 and bit 1, etc.
+    """
+    return bytes(data).translate(_REVERSED_BYTE)
+
+
+def pack_bits(bits, bitorder='big', out=None):
+    """
+    Pack bit values into bytes.
+    
+    Accepts a list of bits or any buffer-protocol object holding one bit
+    value per byte (bytes, bytearray, memoryview, uint8 arrays). Only the
+    lowest bit of each value counts, and the last byte is zero-padded.
+    Uses numpy.packbits when NumPy is installed and C-level conversions
+    through int otherwise.
+    
+    Parameters:
+        bits: The bit values.
+        bitorder (str): 'big' puts the first bit in the most significant
+                        position of each byte, 'little' in the least.
+        out (writable buffer, optional): Destination for the packed bytes.
+    
+    Returns:
+        bytes or int: The packed bytes, or the number of bytes written if
+                      out is given.
+    
+    Raises:
+        ValueError: If the bit order is unknown or out is too small.
+    """
+    _check_bitorder(bitorder)
+    try:
+        values = memoryview(bits).cast('B')
+    except TypeError:
+        # Lists and other iterables: bytes() converts them in C
+        values = memoryview(bytes(bits))
+    np = _numpy()
+    
+    if np is not None:
+        array = np.frombuffer(values, dtype=np.uint8)
+        packed = np.packbits(array & 1, bitorder=bitorder).tobytes()
+    else:
+        digits = bytes(values).translate(_BIT_TO_ASCII)
+        count = (len(digits) + 7) // 8
+        digits += b'0' * (8 * count - len(digits))
+        packed = int(digits, 2).to_bytes(count, 'big') if count else b''
+        if bitorder == 'little':
+            packed = packed.translate(_REVERSED_BYTE)
+    
+    if out is not None:
+        return _write(out, packed)
+    return packed
+
+
+def unpack_bits(data, bitorder='big', count=None, out=None):
+    """
+    Unpack bytes into one bit value per byte.
+    
+    Inverse of pack_bits(). Accepts any buffer-protocol object and uses
+    numpy.unpackbits when NumPy is installed.
+    
+    Parameters:
+        data (bytes-like): The packed bytes.
+        bitorder (str): 'big' or 'little', as for pack_bits().
+        count (int, optional): Number of bits to return. If None, returns
+                               8 bits per byte.
+        out (writable buffer, optional): Destination for the bit values.
+    
+    Returns:
+        bytes or int: The bit values (0 or 1) as bytes, or the number of
+                      values written if out is given.
+    
+    Raises:
+        ValueError: If the bit order is unknown or out is too small.
+    """
+    _check_bitorder(bitorder)
+    data = memoryview(data).cast('B')
+    total = 8 * len(data)
+    count = total if count is None else min(count, total)
+    np = _numpy()
+    
+    if np is not None:
+        array = np.frombuffer(data, dtype=np.uint8)
+        bits = np.unpackbits(array, count=count, bitorder=bitorder).tobytes()
+    else:
+        raw = bytes(data)
+        if bitorder == 'little':
+            raw = raw.translate(_REVERSED_BYTE)
+        digits = format(int.from_bytes(raw, 'big'), f'0{total}b') if total else ''
+        bits = digits[:count].encode('ascii').translate(_ASCII_TO_BIT)
+    
+    if out is not None:
+        return _write(out, bits)
+    return bits
 
 
 def bits_to_bytes(bits):
@@ -90,18 +385,21 @@ def bits_to_bytes(bits):
         bits (list): List of bit values (0 or 1).
     
     Returns:
-        bytes: The bits packed into bytes.
+        bytes: The bits packed into bytes, first bit in the most
+               significant position.
     """
-    # Ensure we have a multiple of 8 bits
-    padded_bits = bits + [0] * ((8 - len(bits) % 8) % 8)
+    return pack_bits(bits)
+
+
+def bytes_to_bits(data, count=None):
+    """
+    Convert bytes to a list of bits, the inverse of bits_to_bytes().
     
-    # Pack bits into bytes
-    result_bytes = bytearray()
-    for i in range(0, len(padded_bits), 8):
-        byte_bits = padded_bits[i:i+8]
-        byte_value = 0
-        for j, bit in enumerate(byte_bits):
-            byte_value |= (bit & 1) << (7 - j)
-        result_bytes.append(byte_value)
+    Parameters:
+        data (bytes-like): The packed bytes.
+        count (int, optional): Number of bits to return, to drop padding.
     
-    return bytes(result_bytes)
\ No newline at end of file
+    Returns:
+        list: List of bit values (0 or 1).
+    """
+    return list(unpack_bits(data, count=count))
@@ -0,0 +1,99 @@
+# tests/test_analysis.py
+"""
+Unit tests for the randomness test suite.
+"""
+import math
+import random
+import unittest
+import sys
+from pathlib import Path
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from src.general_lfsr import GeneralLFSR
+from src.utils import bytes_to_bits
+
+if numpy is not None:
+    from src.analysis import analyze, igamc
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestAnalysis(unittest.TestCase):
+    """Test cases for analyze() and its statistics."""
+    
+    DATA = random.Random(0).randbytes(5000)
+    
+    def test_igamc(self):
+        """Test the incomplete gamma function against closed forms."""
+        for x in [0.1, 1.0, 4.0, 30.0]:
+            self.assertAlmostEqual(igamc(1, x), math.exp(-x), places=12)
+            self.assertAlmostEqual(igamc(0.5, x), math.erfc(math.sqrt(x)), places=12)
+        self.assertEqual(igamc(3, 0), 1.0)
+    
+    def test_against_reference(self):
+        """Test the statistics against direct computations over the bits."""
+        bits = bytes_to_bits(self.DATA)
+        n = len(bits)
+        report = analyze(self.DATA, chunk_size=333, tests=['frequency', 'runs', 'autocorrelation', 'serial'],
+                         shifts=[3, 17], serial_length=3)
+        
+        ones = sum(bits)
+        self.assertAlmostEqual(report['frequency'].statistic, (2 * ones - n) / math.sqrt(n))
+        
+        runs = 1 + sum(bits[i] != bits[i + 1] for i in range(n - 1))
+        proportion = ones / n
+        expected = math.erfc(abs(runs - 2 * n * proportion * (1 - proportion))
+                             / (2 * math.sqrt(2 * n) * proportion * (1 - proportion)))
+        self.assertAlmostEqual(report['runs'].p_value, expected)
+        
+        for shift in [3, 17]:
+            differences = sum(bits[i] != bits[i + shift] for i in range(n - shift))
+            statistic = 2 * (differences - (n - shift) / 2) / math.sqrt(n - shift)
+            self.assertAlmostEqual(report[f'autocorrelation_{shift}'].statistic, statistic)
+        
+        # Serial test with wrap-around, NIST SP 800-22 section 2.11
+        extended = bits + bits[:2]
+        def psi(length):
+            if length == 0:
+                return 0.0
+            counts = {}
+            for i in range(n):
+                pattern = tuple(extended[i:i + length])
+                counts[pattern] = counts.get(pattern, 0) + 1
+            return sum(c * c for c in counts.values()) * 2 ** length / n - n
+        self.assertAlmostEqual(report['serial_1'].statistic, psi(3) - psi(2), places=6)
+        self.assertAlmostEqual(report['serial_2'].statistic, psi(3) - 2 * psi(2) + psi(1), places=6)
+    
+    def test_chunking(self):
+        """Test that results do not depend on how the input is chunked."""
+        whole = analyze(self.DATA, complexity_blocks=20, spectral_block=1024)
+        chunked = analyze([self.DATA[i:i + 97] for i in range(0, len(self.DATA), 97)],
+                          complexity_blocks=20, spectral_block=1024)
+        self.assertEqual(whole.nbits, 8 * len(self.DATA))
+        for first, second in zip(whole.results, chunked.results):
+            self.assertEqual(first.name, second.name)
+            self.assertAlmostEqual(first.statistic, second.statistic)
+        self.assertTrue(whole.passed())
+        self.assertEqual(set(whole.as_dict()['results']), {result.name for result in whole.results})
+    
+    def test_lfsr_source(self):
+        """Test an LFSR, which fails linear complexity below its block size."""
+        lfsr = GeneralLFSR(size=32, taps=[31, 21, 1, 0], seed=0xDEADBEEF)
+        report = analyze(lfsr, nbytes=20000, complexity_blocks=50)
+        self.assertEqual(report.nbits, 160000)
+        self.assertEqual([result.name for result in report.failures()], ['linear_complexity'])
+        
+        with self.assertRaises(ValueError):
+            analyze(lfsr)
+        with self.assertRaises(ValueError):
+            analyze(self.DATA, tests=['poker'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+# tests/test_bank.py
+"""
+Unit tests for the LFSRBank implementation.
+"""
+import os
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from src.general_lfsr import GeneralLFSR
+
+if numpy is not None:
+    from src.bank import LFSRBank
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestLFSRBank(unittest.TestCase):
+    """Test cases for the LFSRBank class."""
+
+    def test_matches_general_lfsr(self):
+        """Test that every register reproduces the equivalent GeneralLFSR."""
+        configs = [
+            (4, [3, 0]),
+            (16, [15, 14, 12, 3]),
+            (100, [99, 37, 37, 5]),   # wider than one machine word
+        ]
+        for size, taps in configs:
+            seeds = [(i * 0x9E3779B97F4A7C15 + 1) & ((1 << size) - 1) for i in range(70)]
+            bank = LFSRBank(seeds, size=size, taps=taps)
+            output = bank.next_bits(40)
+            self.assertEqual(output.shape, (70, 40))
+
+            states = bank.get_states()
+            for index, seed in enumerate(seeds):
+                lfsr = GeneralLFSR(size=size, taps=taps, seed=seed)
+                expected = [lfsr.next_bit() for _ in range(40)]
+                self.assertEqual(output[index].tolist(), expected)
+                self.assertEqual(int(states[index]), lfsr.state)
+
+    def test_reset(self):
+        """Test seeding from an array and resetting to new seeds."""
+        bank = LFSRBank(numpy.arange(1, 9, dtype=numpy.uint64), size=8, taps=[7, 5, 3, 0])
+        self.assertEqual(bank.get_states().tolist(), list(range(1, 9)))
+
+        bank.next_bits(5)
+        self.assertEqual(bank.reset([3, 4]).tolist(), [3, 4])
+        self.assertEqual(len(bank), 2)
+
+        # No argument keeps the current states
+        self.assertEqual(bank.reset().tolist(), [3, 4])
+
+        with self.assertRaises(ValueError):
+            bank.reset([256])
+
+    def test_save_load(self):
+        """Test snapshots, read back or memory-mapped."""
+        seeds = [(i * 0x9E3779B97F4A7C15 + 1) & ((1 << 100) - 1) for i in range(70)]
+        bank = LFSRBank(seeds, size=100, taps=[99, 37, 5])
+        bank.next_bits(13)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'bank.bin')
+            bank.save(path, position=13)
+            for mmap in [False, True]:
+                restored, position = LFSRBank.load(path, mmap=mmap, with_position=True)
+                self.assertEqual(position, 13)
+                self.assertEqual(restored.taps, [99, 37, 5])
+                self.assertEqual(restored.get_states(), bank.get_states())
+                self.assertEqual(restored.next_bits(40).tolist(),
+                                 LFSRBank.load(path).next_bits(40).tolist())
+                del restored
+
+            # Path objects are accepted as well as strings
+            bank.save(Path(path), position=14)
+            self.assertEqual(LFSRBank.load(Path(path), with_position=True)[1], 14)
+            self.assertEqual(os.listdir(directory), ['bank.bin'])
+
+            with open(path, 'r+b') as handle:
+                handle.truncate(100)
+            with self.assertRaises(ValueError):
+                LFSRBank.load(path)
+
+    def test_invalid_taps(self):
+        """Test that out-of-range taps are rejected."""
+        with self.assertRaises(ValueError):
+            LFSRBank([1], size=4, taps=[4, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -35,8 +35,9 @@ class TestBasicLFSR(unittest.TestCase):
     
     def test_state_transitions(self):
         """Test that the state transitions correctly."""
-        # Expected states after each iteration
-        expected_states = ["0011", "1001", "1100", "0110"]
+        # Expected states after each iteration: shift right, feedback
+        # bit3 XOR bit0 enters at the left (0110 -> 0011 -> 1001 -> 0100)
+        expected_states = ["0011", "1001", "0100", "0010"]
         
         for expected_state in expected_states:
             self.lfsr.next_bit()
@@ -75,6 +76,17 @@ class TestBasicLFSR(unittest.TestCase):
             self.lfsr.next_bit()
             
         self.assertTrue(found_initial)
+    
+    def test_clone(self):
+        """Test that clones are compact, independent copies."""
+        self.lfsr.next_bit()
+        clone = self.lfsr.clone()
+        self.assertFalse(hasattr(clone, '__dict__'))
+        self.assertEqual(clone.get_state(), self.lfsr.get_state())
+        self.assertEqual([clone.next_bit() for _ in range(10)],
+                         [self.lfsr.next_bit() for _ in range(10)])
+        clone.next_bit()
+        self.assertNotEqual(clone.state, self.lfsr.state)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,88 @@
+# tests/test_benchmarks.py
+"""
+Unit tests for the benchmark suite runner.
+"""
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.__main__ import main
+from benchmarks.import_time import HEAVY_MODULES, measure_import
+from benchmarks.suite import all_benchmarks, compare, load_results, run, save_results
+
+
+def results(**rates):
+    """Build a results file with the given rates and 1000-byte peaks."""
+    return {'version': 1, 'results': {name: {'unit': 'bytes/s', 'rate': rate, 'peak_bytes': 1000}
+                                      for name, rate in rates.items()}}
+
+
+class TestBenchmarks(unittest.TestCase):
+    """Test cases for measuring, storing and comparing runs."""
+
+    def test_names_are_unique(self):
+        """Test that every benchmark has its own name."""
+        names = [benchmark.name for benchmark in all_benchmarks()]
+        self.assertEqual(len(names), len(set(names)))
+
+    def test_run(self):
+        """Test that a filtered run measures positive rates."""
+        data = run('pack_bits', repeat=1, min_time=0.001)
+        self.assertEqual(sorted(data['results']), ['pack_bits', 'unpack_bits'])
+        for result in data['results'].values():
+            self.assertGreater(result['rate'], 0)
+            self.assertGreater(result['peak_bytes'], 0)
+
+    def test_compare(self):
+        """Test regression detection on rate and peak memory."""
+        baseline = results(a=100.0, b=100.0, c=100.0)
+        current = results(a=80.0, b=60.0, d=1.0)
+        current['results']['a']['peak_bytes'] = 2000
+        regressions = compare(baseline, current, threshold=0.25)
+        self.assertEqual(sorted((name, metric) for name, metric, _, _ in regressions),
+                         [('a', 'peak_bytes'), ('b', 'rate')])
+        self.assertEqual(compare(baseline, current, threshold=0.5),
+                         [('a', 'peak_bytes', 1000, 2000)])
+
+    def test_main_against_baseline(self):
+        """Test the command line: saving a baseline, then failing against it."""
+        with tempfile.TemporaryDirectory() as directory:
+            baseline = os.path.join(directory, 'baseline.json')
+            output = os.path.join(directory, 'run.json')
+            arguments = ['-k', 'unpack_bits', '--quick', '--baseline', baseline]
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(main(arguments + ['--save-baseline']), 0)
+                self.assertEqual(main(arguments + ['-o', output]), 0)
+                self.assertIn('unpack_bits', load_results(output)['results'])
+
+                # A baseline far faster than this machine is a regression
+                data = load_results(baseline)
+                data['results']['unpack_bits']['rate'] *= 1000
+                save_results(baseline, data)
+                self.assertEqual(main(arguments), 1)
+
+            with open(baseline, 'w') as handle:
+                json.dump({'version': 0, 'results': {}}, handle)
+            with self.assertRaises(ValueError):
+                load_results(baseline)
+
+    def test_import_time(self):
+        """Test that importing the package loads only the core modules."""
+        result = measure_import(runs=1)
+        self.assertGreater(result.total, 0)
+        self.assertGreater(result.own, 0)
+        self.assertIn('src.general_lfsr', result.modules)
+        for module in HEAVY_MODULES + ['src.bank', 'src.analysis', 'src.catalogue', 'src.parallel']:
+            self.assertNotIn(module, result.modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
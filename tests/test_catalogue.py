@@ -0,0 +1,66 @@
+# tests/test_catalogue.py
+"""
+Unit tests for the primitive polynomial catalogue.
+"""
+import unittest
+import sys
+from pathlib import Path
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.catalogue import (MAX_SIZE, catalogue_sizes, primitive_polynomial,
+                           primitive_taps)
+from src.general_lfsr import GeneralLFSR
+from src.gf2 import feedback_polynomial, is_primitive
+from src.utils import compute_period
+
+
+class TestCatalogue(unittest.TestCase):
+    """Test cases for the catalogue lookups."""
+    
+    def test_known_polynomials(self):
+        """Test entries against published low-weight primitive polynomials."""
+        self.assertEqual(primitive_taps(4), [1, 0])
+        self.assertEqual(primitive_taps(16), [5, 3, 2, 0])
+        self.assertEqual(primitive_taps(64), [4, 3, 1, 0])
+        self.assertEqual(primitive_taps(127), [1, 0])
+        self.assertEqual(primitive_polynomial(8), 0b100011101)
+        self.assertEqual(primitive_taps(256), [10, 5, 2, 0])
+        self.assertEqual(primitive_taps(512), [8, 5, 2, 0])
+    
+    def test_powers_of_two(self):
+        """Test that every power-of-two degree is catalogued and primitive."""
+        self.assertLessEqual({1 << k for k in range(1, 13)}, set(catalogue_sizes()))
+        for size in [256, 512]:
+            self.assertTrue(is_primitive(primitive_polynomial(size)), size)
+        self.assertEqual(GeneralLFSR.maximal(4096).taps, [27, 15, 1, 0])
+    
+    def test_entries_are_primitive(self):
+        """Test that small and Mersenne-exponent entries are primitive."""
+        sizes = catalogue_sizes()
+        self.assertEqual(sizes[:63], list(range(2, 65)))
+        self.assertLessEqual(sizes[-1], MAX_SIZE)
+        for size in list(range(2, 65)) + [521, 607]:
+            taps = primitive_taps(size)
+            self.assertIn(len(taps), (2, 4))
+            self.assertTrue(is_primitive(feedback_polynomial(size, taps)), size)
+    
+    def test_weight_limit(self):
+        """Test the weight limit and missing sizes."""
+        self.assertEqual(primitive_taps(127, max_weight=3), [1, 0])
+        with self.assertRaises(ValueError):
+            primitive_taps(8, max_weight=3)
+        with self.assertRaises(ValueError):
+            primitive_taps(MAX_SIZE + 1)
+    
+    def test_maximal(self):
+        """Test that GeneralLFSR.maximal() has the maximum period."""
+        for size in [3, 8, 12]:
+            lfsr = GeneralLFSR.maximal(size)
+            self.assertEqual(compute_period(lfsr), (1 << size) - 1)
+        self.assertEqual(GeneralLFSR.maximal(64, seed=5).taps, [4, 3, 1, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+# tests/test_checkpoint.py
+"""
+Unit tests for checkpoint files of many registers.
+"""
+import os
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.checkpoint import load_registers, record_size, save_registers
+from src.general_lfsr import GeneralLFSR
+from src.large_lfsr import LargeLFSR
+
+
+class TestCheckpoint(unittest.TestCase):
+    """Test cases for saving and restoring registers in bulk."""
+
+    def setUp(self):
+        """Create registers with mixed taps and a checkpoint directory."""
+        self.registers = [GeneralLFSR(size=70, taps=[69, 10 + i % 3, 0], seed=i + 1)
+                          for i in range(50)]
+        for lfsr in self.registers:
+            lfsr.next_bits(lfsr.state % 17)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'registers.ckpt')
+
+    def test_round_trip(self):
+        """Test that registers and positions are restored exactly."""
+        positions = list(range(100, 150))
+        self.assertEqual(save_registers(self.path, self.registers, positions), 50)
+        self.assertEqual(os.path.getsize(self.path), 20 + 50 * record_size(70))
+
+        registers, restored = load_registers(self.path)
+        self.assertEqual(restored, positions)
+        for lfsr, original in zip(registers, self.registers):
+            self.assertEqual(lfsr.taps, original.taps)
+            self.assertEqual(lfsr.next_bytes(16), original.clone().next_bytes(16))
+
+        registers, restored = load_registers(self.path, 10, 12, cls=LargeLFSR)
+        self.assertEqual(restored, [110, 111])
+        self.assertIsInstance(registers[0], LargeLFSR)
+        self.assertEqual([lfsr.state for lfsr in registers],
+                         [lfsr.state for lfsr in self.registers[10:12]])
+
+    def test_invalid(self):
+        """Test rejected inputs and damaged files."""
+        with self.assertRaises(ValueError):
+            save_registers(self.path, [])
+        with self.assertRaises(ValueError):
+            save_registers(self.path, self.registers + [GeneralLFSR()])
+        with self.assertRaises(ValueError):
+            save_registers(self.path, self.registers, positions=[0])
+
+        save_registers(self.path, self.registers)
+        with open(self.path, 'r+b') as handle:
+            handle.truncate(os.path.getsize(self.path) - 1)
+        with self.assertRaises(ValueError):
+            load_registers(self.path)
+        with open(self.path, 'r+b') as handle:
+            handle.write(b'LFSR')
+        with self.assertRaises(ValueError):
+            load_registers(self.path)
+
+    def test_failed_save_keeps_checkpoint(self):
+        """Test that a rejected save leaves the previous checkpoint intact."""
+        save_registers(self.path, self.registers, range(50))
+        with open(self.path, 'rb') as handle:
+            before = handle.read()
+        with self.assertRaises(ValueError):
+            save_registers(self.path, self.registers + [GeneralLFSR()])
+        with self.assertRaises(ValueError):
+            save_registers(self.path, self.registers, [-1] * 50)
+        with open(self.path, 'rb') as handle:
+            self.assertEqual(handle.read(), before)
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ['registers.ckpt'])
+        self.assertEqual(load_registers(self.path)[1], list(range(50)))
+
+    def test_path_objects(self):
+        """Test that pathlib paths are accepted."""
+        path = Path(self.path)
+        save_registers(path, self.registers, range(50))
+        self.assertEqual(load_registers(path, 3, 5)[1], [3, 4])
+        self.assertEqual(os.listdir(path.parent), [path.name])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+# tests/test_cipher.py
+"""
+Unit tests for the StreamCipher engine.
+"""
+import os
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import cipher as cipher_module
+from src.cipher import StreamCipher
+from src.general_lfsr import GeneralLFSR
+from src.utils import bits_to_bytes
+
+KEY = 0xACE1
+TAPS = [15, 13, 12, 10]
+
+
+def reference_encrypt(data):
+    """Encrypt the slow way: per-bit keystream and per-byte XOR."""
+    lfsr = GeneralLFSR(size=16, taps=TAPS, seed=KEY)
+    keystream = bits_to_bytes([lfsr.next_bit() for _ in range(8 * len(data))])
+    return bytes(p ^ k for p, k in zip(data, keystream))
+
+
+class TestStreamCipher(unittest.TestCase):
+    """Test cases for the StreamCipher class."""
+    
+    DATA = bytes(range(256)) * 40 + b"tail"
+    
+    def make_cipher(self, **kwargs):
+        """Create the cipher used throughout these tests."""
+        return StreamCipher(KEY, size=16, taps=TAPS, **kwargs)
+    
+    def test_matches_reference(self):
+        """Test chunked encryption against the per-byte reference."""
+        expected = reference_encrypt(self.DATA)
+        self.assertEqual(self.make_cipher(chunk_size=1000).encrypt(self.DATA), expected)
+        
+        with mock.patch.object(cipher_module, '_numpy', lambda: None):
+            self.assertEqual(self.make_cipher(chunk_size=1000).encrypt(self.DATA), expected)
+    
+    def test_round_trip_and_in_place(self):
+        """Test decryption and in-place encryption of a buffer."""
+        ciphertext = self.make_cipher().encrypt(self.DATA)
+        self.assertEqual(self.make_cipher().decrypt(ciphertext), self.DATA)
+        
+        buffer = bytearray(self.DATA)
+        self.assertEqual(self.make_cipher().encrypt_into(buffer, buffer), len(self.DATA))
+        self.assertEqual(bytes(buffer), ciphertext)
+        
+        with self.assertRaises(ValueError):
+            self.make_cipher().encrypt_into(self.DATA, bytearray(10))
+    
+    def test_seek(self):
+        """Test random-access decryption after seeking."""
+        ciphertext = self.make_cipher().encrypt(self.DATA)
+        cipher = self.make_cipher()
+        self.assertEqual(cipher.seek(5000), 5000)
+        self.assertEqual(cipher.decrypt(ciphertext[5000:5100]), self.DATA[5000:5100])
+        self.assertEqual(cipher.tell(), 5100)
+        
+        cipher.seek(0)
+        self.assertEqual(cipher.decrypt(ciphertext[:10]), self.DATA[:10])
+        with self.assertRaises(ValueError):
+            cipher.seek(-1)
+    
+    def test_files(self):
+        """Test file encryption, including empty and in-place files."""
+        expected = reference_encrypt(self.DATA)
+        with tempfile.TemporaryDirectory() as directory:
+            plain = os.path.join(directory, 'plain.bin')
+            encrypted = os.path.join(directory, 'encrypted.bin')
+            with open(plain, 'wb') as handle:
+                handle.write(self.DATA)
+            
+            self.assertEqual(self.make_cipher(chunk_size=777).encrypt_file(plain, encrypted),
+                             len(self.DATA))
+            with open(encrypted, 'rb') as handle:
+                self.assertEqual(handle.read(), expected)
+            
+            # Decrypt in place
+            self.make_cipher().decrypt_file(encrypted, encrypted)
+            with open(encrypted, 'rb') as handle:
+                self.assertEqual(handle.read(), self.DATA)
+            
+            empty = os.path.join(directory, 'empty.bin')
+            open(empty, 'wb').close()
+            self.assertEqual(self.make_cipher().encrypt_file(empty, encrypted), 0)
+            self.assertEqual(os.path.getsize(encrypted), 0)
+    
+    def test_invalid_key(self):
+        """Test that a zero key is rejected."""
+        with self.assertRaises(ValueError):
+            StreamCipher(0)
+    
+    def test_default_taps(self):
+        """Test catalogued taps by default and the fallback without them."""
+        self.assertEqual(StreamCipher(KEY, size=256).lfsr.taps, [10, 5, 2, 0])
+        with self.assertWarns(RuntimeWarning):
+            cipher = StreamCipher(KEY, size=4095)
+        self.assertEqual(cipher.lfsr.taps, [4094, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
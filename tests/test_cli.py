@@ -0,0 +1,101 @@
+# tests/test_cli.py
+"""
+Unit tests for the command-line keystream generator.
+"""
+import contextlib
+import io
+import os
+import subprocess
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.__main__ import main
+from src.general_lfsr import GeneralLFSR
+
+
+class TestCommandLine(unittest.TestCase):
+    """Test cases for generating keystream and checking registers."""
+
+    def setUp(self):
+        """Create a directory for output files."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'keystream')
+
+    def run_main(self, *arguments):
+        """Run the command line, returning its exit status and printed text."""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            status = main(list(arguments))
+        return status, output.getvalue()
+
+    def read(self):
+        """Return the contents of the output file."""
+        with open(self.path, 'rb') as handle:
+            return handle.read()
+
+    def test_generate(self):
+        """Test raw output with explicit taps, seed and jump-ahead."""
+        self.run_main('--size', '16', '--taps', '15,14,12,3', '--seed', '0xACE1',
+                      '--skip', '1k', '--bytes', '3000', '-o', self.path)
+        lfsr = GeneralLFSR(size=16, taps=[15, 14, 12, 3], seed=0xACE1)
+        lfsr.skip(1024)
+        self.assertEqual(self.read(), lfsr.next_bytes(3000))
+
+    def test_formats(self):
+        """Test hex and bits output of the catalogued register."""
+        expected = GeneralLFSR.maximal(64, seed=5).next_bytes(4)
+        self.run_main('--seed', '5', '--bytes', '4', '--format', 'hex', '-o', self.path)
+        self.assertEqual(self.read(), expected.hex().encode() + b'\n')
+        self.run_main('--seed', '5', '--bytes', '4', '--format', 'bits', '-o', self.path)
+        self.assertEqual(self.read(), ''.join(f'{byte:08b}' for byte in expected).encode() + b'\n')
+
+    def test_period_and_primitive(self):
+        """Test the algebraic period and primitivity checks."""
+        self.assertEqual(self.run_main('--size', '127', '--period'), (0, f'{(1 << 127) - 1}\n'))
+        self.assertEqual(self.run_main('--size', '4', '--taps', '3,2,1,0', '--period'), (0, '5\n'))
+        status, text = self.run_main('--size', '89', '--check-primitive')
+        self.assertEqual(status, 0)
+        self.assertTrue(text.startswith('primitive'))
+        status, text = self.run_main('--size', '4', '--taps', '3,2,1,0', '--check-primitive')
+        self.assertEqual(status, 1)
+        self.assertTrue(text.startswith('not primitive'))
+
+        # x^607 + x^605 + 1 needs the factors of 2^501 - 1
+        status, text = self.run_main('--size', '607', '--taps', '605,0', '--period',
+                                     '--factor-steps', '1k')
+        self.assertEqual(status, 2)
+        self.assertTrue(text.startswith('unknown'))
+
+    def test_invalid_arguments(self):
+        """Test that invalid arguments exit with a usage error."""
+        for arguments in [['--size', '4', '--seed', '16'], ['--taps', '64,0'], ['--bytes', '-1'],
+                          ['--workers', '0'], ['--period', '--check-primitive']]:
+            with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+                main(arguments)
+
+    def test_stdout_pipe(self):
+        """Test writing to stdout through a pipe, bounded and endless."""
+        root = Path(__file__).parent.parent
+        process = subprocess.run([sys.executable, '-m', 'src', '--size', '32', '--bytes', '100000'],
+                                 cwd=root, capture_output=True, check=True)
+        self.assertEqual(process.stdout, GeneralLFSR.maximal(32).next_bytes(100000))
+
+        # An endless stream stops quietly when the reader closes the pipe
+        process = subprocess.Popen([sys.executable, '-m', 'src'], cwd=root,
+                                   stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        head = process.stdout.read(1000)
+        process.stdout.close()
+        self.assertEqual(process.wait(timeout=30), 0)
+        self.assertEqual(process.stderr.read(), b'')
+        process.stderr.close()
+        self.assertEqual(head, GeneralLFSR.maximal(64).next_bytes(1000))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+# tests/test_combiners.py
+"""
+Unit tests for the combination generators.
+"""
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import combiners
+from src.combiners import (AlternatingStepGenerator, CombinationGenerator,
+                           FilterGenerator, GeffeGenerator, SelfShrinkingGenerator,
+                           ShrinkingGenerator, compress_bits)
+from src.general_lfsr import GeneralLFSR
+from src.stream import iter_bytes
+from src.utils import bits_to_bytes
+
+
+def registers():
+    """Three maximum-length registers of coprime periods."""
+    return (GeneralLFSR(size=5, taps=[2, 0], seed=0b10011),
+            GeneralLFSR(size=7, taps=[1, 0], seed=0b1011001),
+            GeneralLFSR(size=11, taps=[2, 0], seed=0b10110011101))
+
+
+def geffe_reference(n):
+    """Geffe output, stepping every register bit by bit."""
+    x1, x2, x3 = registers()
+    output = []
+    for _ in range(n):
+        a, b, c = x1.next_bit(), x2.next_bit(), x3.next_bit()
+        output.append(a if b else c)
+    return output
+
+
+def shrinking_reference(n):
+    """Shrinking generator output, bit by bit."""
+    data, selector, _ = registers()
+    output = []
+    while len(output) < n:
+        a, s = data.next_bit(), selector.next_bit()
+        if s:
+            output.append(a)
+    return output
+
+
+def self_shrinking_reference(n):
+    """Self-shrinking generator output, bit by bit."""
+    _, _, register = registers()
+    output = []
+    while len(output) < n:
+        first, second = register.next_bit(), register.next_bit()
+        if first:
+            output.append(second)
+    return output
+
+
+def alternating_reference(n):
+    """Alternating step generator output, bit by bit."""
+    control, first, second = registers()
+    a = b = 0
+    output = []
+    for _ in range(n):
+        if control.next_bit():
+            a = first.next_bit()
+        else:
+            b = second.next_bit()
+        output.append(a ^ b)
+    return output
+
+
+def filter_reference(n):
+    """Filter generator output, reading the state bit by bit."""
+    register = GeneralLFSR(size=11, taps=[2, 0], seed=0b10110011101)
+    output = []
+    for _ in range(n):
+        state = register.state
+        bits = [(state >> position) & 1 for position in (0, 3, 7, 10)]
+        output.append((bits[0] & bits[1]) ^ bits[2] ^ (bits[3] & (1 - bits[1])))
+        register.next_bit()
+    return output
+
+
+def make_filter():
+    """The word-level counterpart of filter_reference()."""
+    register = GeneralLFSR(size=11, taps=[2, 0], seed=0b10110011101)
+    return FilterGenerator(register, [0, 3, 7, 10], lambda a, b, c, d: (a & b) ^ c ^ (d & ~b))
+
+
+class TestCombiners(unittest.TestCase):
+    """Test the word-level generators against bit-by-bit references."""
+
+    cases = [
+        (lambda: GeffeGenerator(*registers()), geffe_reference),
+        (lambda: ShrinkingGenerator(*registers()[:2]), shrinking_reference),
+        (lambda: SelfShrinkingGenerator(registers()[2]), self_shrinking_reference),
+        (lambda: AlternatingStepGenerator(*registers()), alternating_reference),
+        (make_filter, filter_reference),
+    ]
+
+    def check_cases(self):
+        for factory, reference in self.cases:
+            expected = reference(6000)
+            generator = factory()
+            self.assertEqual(generator.next_bits(6000), expected, factory)
+
+            # Output does not depend on how it is split into calls
+            generator = factory()
+            pieces = [generator.next_bit() for _ in range(5)]
+            pieces += generator.next_bits(995)
+            word = generator.next_word(3000)
+            pieces += [(word >> i) & 1 for i in range(3000)]
+            pieces += generator.next_bits(2000)
+            self.assertEqual(pieces, expected, factory)
+
+            self.assertEqual(factory().next_bytes(750), bits_to_bytes(expected))
+
+    def test_matches_reference(self):
+        """Test every generator against its definition."""
+        self.check_cases()
+
+    def test_without_numpy(self):
+        """Test the pure Python fallbacks."""
+        with mock.patch.object(combiners, '_numpy', lambda: None):
+            self.check_cases()
+
+    def test_compress_bits(self):
+        """Test bit compaction."""
+        self.assertEqual(compress_bits(0b101101, 0b110011, 6), (0b1001, 4))
+        self.assertEqual(compress_bits(0b1111, 0, 4), (0, 0))
+
+    def test_combination_generator(self):
+        """Test a custom combining function and the streaming interface."""
+        x1, x2, x3 = registers()
+        majority = CombinationGenerator([x1, x2, x3], lambda a, b, c: (a & b) | (a & c) | (b & c))
+        chunks = list(iter_bytes(majority, chunk_size=100, nbytes=300))
+        self.assertEqual(len(b''.join(chunks)), 300)
+
+        with self.assertRaises(ValueError):
+            CombinationGenerator([], lambda: 0)
+        with self.assertRaises(ValueError):
+            FilterGenerator(GeneralLFSR(size=4), [4], lambda a: a)
+        with self.assertRaises(ValueError):
+            majority.next_word(-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
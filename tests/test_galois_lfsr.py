@@ -0,0 +1,97 @@
+# tests/test_galois_lfsr.py
+"""
+Unit tests for the GaloisLFSR implementation and form conversions.
+"""
+import unittest
+import sys
+from pathlib import Path
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.general_lfsr import GeneralLFSR
+from src.galois_lfsr import (GaloisLFSR, mirror_taps, fibonacci_to_galois,
+                             galois_to_fibonacci)
+
+
+class TestGaloisLFSR(unittest.TestCase):
+    """Test cases for the GaloisLFSR class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.lfsr = GaloisLFSR()
+    
+    def test_initialization(self):
+        """Test initialization and validation."""
+        self.assertEqual(self.lfsr.size, 4)
+        self.assertEqual(self.lfsr.taps, [3, 0])
+        self.assertEqual(self.lfsr.get_state(), "0110")
+        
+        with self.assertRaises(ValueError):
+            GaloisLFSR(size=4, seed=0b11111)
+        with self.assertRaises(ValueError):
+            GaloisLFSR(size=4, taps=[4, 0])
+    
+    def test_next_bit(self):
+        """Test the conditional XOR step."""
+        lfsr = GaloisLFSR(size=4, taps=[3, 0], seed=0b0011)
+        self.assertEqual(lfsr.next_bit(), 1)
+        # 0011 >> 1 = 0001, XOR mask 1001 gives 1000
+        self.assertEqual(lfsr.get_state(), "1000")
+        self.assertEqual(lfsr.next_bit(), 0)
+        self.assertEqual(lfsr.get_state(), "0100")
+    
+    def test_full_period(self):
+        """Test that a primitive configuration visits all 15 non-zero states."""
+        seen_states = set()
+        for _ in range(15):
+            seen_states.add(self.lfsr.state)
+            self.lfsr.next_bit()
+        self.assertEqual(len(seen_states), 15)
+        self.assertEqual(self.lfsr.state, 0b0110)
+    
+    def test_set_taps_and_reset(self):
+        """Test changing taps and seeds."""
+        self.assertEqual(self.lfsr.set_taps([3, 1, 1, 0]), [3, 1, 1, 0])
+        self.assertEqual(self.lfsr.mask, 0b1001)
+        with self.assertRaises(ValueError):
+            self.lfsr.set_taps([-1])
+        
+        self.assertEqual(self.lfsr.reset(0b1010), 0b1010)
+        self.assertEqual(self.lfsr.reset(), 0b1010)
+        with self.assertRaises(ValueError):
+            self.lfsr.reset(0b10000)
+
+
+class TestConversions(unittest.TestCase):
+    """Test cases for Fibonacci/Galois conversions."""
+    
+    def test_mirror_taps(self):
+        """Test that mirroring taps is its own inverse."""
+        self.assertEqual(mirror_taps(8, [7, 5, 3, 0]), [0, 2, 4, 7])
+        self.assertEqual(mirror_taps(8, mirror_taps(8, [6, 1])), [6, 1])
+    
+    def test_fibonacci_to_galois(self):
+        """Test that the Galois register reproduces a Fibonacci sequence."""
+        configs = [
+            (4, [3, 0], 0b0110),
+            (16, [15, 14, 12, 3], 0xACE1),
+            (64, [63, 61, 60, 0], 0x0123456789ABCDEF),
+        ]
+        for size, taps, seed in configs:
+            fibonacci = GeneralLFSR(size=size, taps=taps, seed=seed)
+            galois = fibonacci_to_galois(fibonacci)
+            for length in [1, 100, 5000]:
+                self.assertEqual(galois.next_bits(length), fibonacci.next_bits(length))
+                self.assertEqual(galois_to_fibonacci(galois).state, fibonacci.state)
+    
+    def test_galois_to_fibonacci(self):
+        """Test that the Fibonacci register reproduces a Galois sequence."""
+        galois = GaloisLFSR(size=12, taps=[11, 5, 3, 0], seed=0xABC)
+        fibonacci = galois_to_fibonacci(galois)
+        expected = [galois.next_bit() for _ in range(500)]
+        self.assertEqual([fibonacci.next_bit() for _ in range(500)], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
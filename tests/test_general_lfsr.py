@@ -0,0 +1,246 @@
+# tests/test_general_lfsr.py
+"""
+Unit tests for the GeneralLFSR implementation.
+"""
+import copy
+import pickle
+import unittest
+import sys
+from pathlib import Path
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.general_lfsr import GeneralLFSR
+from src.utils import bits_to_bytes
+
+
+class TestGeneralLFSR(unittest.TestCase):
+    """Test cases for the GeneralLFSR class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        # Create a default 4-bit LFSR
+        self.lfsr = GeneralLFSR()
+    
+    def test_initialization(self):
+        """Test initialization with various parameters."""
+        # Test default initialization
+        lfsr = GeneralLFSR()
+        self.assertEqual(lfsr.size, 4)
+        self.assertEqual(lfsr.taps, [3, 0])
+        self.assertEqual(lfsr.state, 0b0110)
+        
+        # Test custom initialization
+        lfsr = GeneralLFSR(size=8, taps=[7, 3, 2, 1], seed=0b10101010)
+        self.assertEqual(lfsr.size, 8)
+        self.assertEqual(lfsr.taps, [7, 3, 2, 1])
+        self.assertEqual(lfsr.state, 0b10101010)
+        
+        # Test invalid seed
+        with self.assertRaises(ValueError):
+            GeneralLFSR(size=4, seed=0b11111)
+            
+        # Test invalid taps
+        with self.assertRaises(ValueError):
+            GeneralLFSR(size=4, taps=[4, 0])
+    
+    def test_set_taps(self):
+        """Test setting new tap positions."""
+        # Set valid taps
+        self.lfsr.set_taps([2, 1])
+        self.assertEqual(self.lfsr.taps, [2, 1])
+        
+        # Try setting invalid taps
+        with self.assertRaises(ValueError):
+            self.lfsr.set_taps([4, 0])
+            
+        with self.assertRaises(ValueError):
+            self.lfsr.set_taps([-1, 0])
+    
+    def test_reset(self):
+        """Test resetting the LFSR state."""
+        # Advance the LFSR a few steps
+        for _ in range(3):
+            self.lfsr.next_bit()
+            
+        # Without a seed the current state is kept
+        state = self.lfsr.state
+        self.assertEqual(self.lfsr.reset(), state)
+        self.assertEqual(self.lfsr.state, state)
+        
+        # Reset to the default seed
+        self.lfsr.reset(0b0110)
+        self.assertEqual(self.lfsr.state, 0b0110)
+        
+        # Reset to custom seed
+        self.lfsr.reset(0b1001)
+        self.assertEqual(self.lfsr.state, 0b1001)
+        
+        # Try resetting with invalid seed
+        with self.assertRaises(ValueError):
+            self.lfsr.reset(0b10000)
+    
+    def test_next_bit(self):
+        """Test generating next bits with custom taps."""
+        # Initialize with custom taps [2, 1] on a 4-bit LFSR
+        lfsr = GeneralLFSR(size=4, taps=[2, 1], seed=0b1111)
+        
+        # The first four bits are the seed, then s[t+4] = s[t+2] ^ s[t+1]
+        expected_bits = [1, 1, 1, 1, 0, 0, 1]
+        
+        # Generate and check bits
+        generated_bits = [lfsr.next_bit() for _ in range(len(expected_bits))]
+        self.assertEqual(generated_bits, expected_bits)
+    
+    def test_multiple_taps(self):
+        """Test LFSR with multiple tap positions."""
+        # Create 8-bit LFSR with 4 taps
+        lfsr = GeneralLFSR(size=8, taps=[7, 5, 3, 0], seed=0b10101010)
+        
+        # Generate some bits and ensure they're 0 or 1
+        for _ in range(20):
+            bit = lfsr.next_bit()
+            self.assertIn(bit, [0, 1])
+    
+    def test_next_bits_matches_next_bit(self):
+        """Test that bulk output reproduces next_bit() and the final state."""
+        configs = [
+            (4, [3, 0], 0b0110),
+            (8, [7, 5, 3, 0], 0b10101010),
+            (16, [15, 14, 12, 3], 0xACE1),
+            (33, [32, 19, 19, 5], 0x1DEADBEEF),   # repeated tap cancels out
+            (64, [40, 7], 0xFEEDFACECAFEBEEF),    # no tap at position 0
+        ]
+        for size, taps, seed in configs:
+            for length in [0, 1, 13, 64, 1000, 20000]:
+                reference = GeneralLFSR(size=size, taps=taps, seed=seed)
+                bulk = GeneralLFSR(size=size, taps=taps, seed=seed)
+                expected = [reference.next_bit() for _ in range(length)]
+                self.assertEqual(bulk.next_bits(length), expected)
+                self.assertEqual(bulk.state, reference.state)
+    
+    def test_dense_taps(self):
+        """Test bulk output and short skips of registers with many taps."""
+        configs = [
+            (40, list(range(39, 0, -2)) + [0]),
+            (70, list(range(69, 0, -3)) + [0]),
+            (300, list(range(299, 0, -7)) + [0]),
+            (100, [99, 98, 98, 97, 1, 0]),    # repeated tap cancels out
+        ]
+        for size, taps in configs:
+            for length in [1, 63, 64, 65, 5000]:
+                reference = GeneralLFSR(size=size, taps=taps, seed=(1 << size) - 3)
+                bulk = GeneralLFSR(size=size, taps=taps, seed=(1 << size) - 3)
+                expected = [reference.next_bit() for _ in range(length)]
+                self.assertEqual(bulk.next_bits(length), expected)
+                self.assertEqual(bulk.state, reference.state)
+            
+            reference = GeneralLFSR(size=size, taps=taps, seed=12345)
+            jumped = GeneralLFSR(size=size, taps=taps, seed=12345)
+            for _ in range(size + 5):
+                reference.next_bit()
+            self.assertEqual(jumped.skip(size + 5), reference.state)
+    
+    def test_next_word(self):
+        """Test that next_word packs the first bit into the lowest position."""
+        lfsr = GeneralLFSR(size=4, taps=[3, 0], seed=0b0110)
+        # First five bits are 0, 1, 1, 0, 0
+        self.assertEqual(lfsr.next_word(5), 0b00110)
+        
+        with self.assertRaises(ValueError):
+            lfsr.next_word(-1)
+    
+    def test_next_bytes(self):
+        """Test that next_bytes matches bits_to_bytes over next_bit()."""
+        reference = GeneralLFSR(size=16, taps=[15, 14, 12, 3], seed=0xACE1)
+        bulk = GeneralLFSR(size=16, taps=[15, 14, 12, 3], seed=0xACE1)
+        
+        expected = bits_to_bytes([reference.next_bit() for _ in range(8 * 500)])
+        self.assertEqual(bulk.next_bytes(500), expected)
+        self.assertEqual(bulk.state, reference.state)
+    
+    def test_skip(self):
+        """Test that skip(n) lands on the same state as n calls to next_bit()."""
+        configs = [
+            (4, [3, 0], 0b0110),
+            (16, [15, 14, 12, 3], 0xACE1),
+            (64, [40, 7], 0xFEEDFACECAFEBEEF),    # no tap at position 0
+        ]
+        for size, taps, seed in configs:
+            for steps in [0, 1, 7, 2 * size, 1000, 12345]:
+                reference = GeneralLFSR(size=size, taps=taps, seed=seed)
+                jumped = GeneralLFSR(size=size, taps=taps, seed=seed)
+                for _ in range(steps):
+                    reference.next_bit()
+                self.assertEqual(jumped.skip(steps), reference.state)
+        
+        with self.assertRaises(ValueError):
+            self.lfsr.skip(-1)
+    
+    def test_skip_large(self):
+        """Test jumping far ahead in a 64-bit LFSR."""
+        lfsr = GeneralLFSR(size=64, taps=[63, 62, 60, 59], seed=1)
+        split = GeneralLFSR(size=64, taps=[63, 62, 60, 59], seed=1)
+        
+        lfsr.skip((1 << 40) + 5)
+        split.skip(1 << 40)
+        split.skip(5)
+        self.assertEqual(lfsr.state, split.state)
+        
+        # A maximum-length 4-bit LFSR returns to its seed after 15 steps
+        self.assertEqual(self.lfsr.skip(15 * 1000), 0b0110)
+    
+    def test_shared_config(self):
+        """Test that registers share one slotted configuration."""
+        other = GeneralLFSR(size=4, taps=[3, 0], seed=0b1001)
+        self.assertIs(self.lfsr.config, other.config)
+        self.assertFalse(hasattr(self.lfsr, '__dict__'))
+        self.assertEqual(other.max_value, 0b1111)
+        
+        # Repeated taps cancel in the mask
+        lfsr = GeneralLFSR(size=8, taps=[7, 5, 5, 0])
+        self.assertEqual(lfsr.taps, [7, 5, 5, 0])
+        self.assertEqual(lfsr.config.feedback_taps, (0, 7))
+    
+    def test_clone(self):
+        """Test that clones are independent and share the configuration."""
+        self.lfsr.next_bits(3)
+        for clone in [self.lfsr.clone(), copy.copy(self.lfsr), copy.deepcopy(self.lfsr)]:
+            self.assertIsInstance(clone, GeneralLFSR)
+            self.assertEqual(clone.state, self.lfsr.state)
+            self.assertEqual(clone.taps, self.lfsr.taps)
+            self.assertEqual(clone.next_bits(20), self.lfsr.clone().next_bits(20))
+            self.assertNotEqual(clone.state, self.lfsr.state)
+        self.assertIs(self.lfsr.clone().config, self.lfsr.config)
+        
+        clone = self.lfsr.clone()
+        clone.set_taps([2, 1])
+        self.assertEqual(self.lfsr.taps, [3, 0])
+    
+    def test_serialization(self):
+        """Test the compact record format and pickling."""
+        lfsr = GeneralLFSR(size=100, taps=[99, 37, 5], seed=(1 << 99) | 12345)
+        lfsr.next_bits(7)
+        record = lfsr.to_bytes(position=7)
+        self.assertEqual(len(record), 20 + 2 * 13)
+        self.assertEqual(record[:5], b'LFSR\x01')
+        
+        restored, position = GeneralLFSR.from_bytes(record, with_position=True)
+        self.assertEqual(position, 7)
+        self.assertEqual(restored.taps, [99, 37, 5])
+        self.assertEqual(restored.next_bytes(20), lfsr.next_bytes(20))
+        self.assertEqual(GeneralLFSR.from_bytes(GeneralLFSR(size=8, taps=[3, 3]).to_bytes()).taps, [])
+        
+        unpickled = pickle.loads(pickle.dumps(lfsr))
+        self.assertEqual((unpickled.state, unpickled.taps), (lfsr.state, lfsr.taps))
+        
+        for data in [record[:-1], b'LFSQ' + record[4:], record[:4] + b'\x02' + record[5:]]:
+            with self.assertRaises(ValueError):
+                GeneralLFSR.from_bytes(data)
+        with self.assertRaises(ValueError):
+            lfsr.to_bytes(position=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,144 @@
+# tests/test_gf2.py
+"""
+Unit tests for the GF(2) polynomial arithmetic.
+"""
+import threading
+import unittest
+import sys
+from pathlib import Path
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.gf2 import (feedback_polynomial, poly_mul, poly_square, poly_mod,
+                     poly_powmod, x_power_mod, poly_gcd, poly_factor,
+                     poly_order, is_irreducible, is_primitive,
+                     mersenne_prime_factors, seed_mersenne_factors)
+
+
+class TestGF2(unittest.TestCase):
+    """Test cases for polynomial arithmetic over GF(2)."""
+    
+    def test_feedback_polynomial(self):
+        """Test building the characteristic polynomial from taps."""
+        self.assertEqual(feedback_polynomial(4, [3, 0]), 0b11001)
+        # Repeated taps cancel out
+        self.assertEqual(feedback_polynomial(4, [3, 1, 1, 0]), 0b11001)
+    
+    def test_multiplication(self):
+        """Test multiplication and squaring."""
+        # (x + 1)^2 = x^2 + 1
+        self.assertEqual(poly_mul(0b11, 0b11), 0b101)
+        self.assertEqual(poly_mul(0b1101, 0b111), 0b100011)
+        for a in [0, 1, 0b1011, 0xDEADBEEF, (1 << 200) | 12345]:
+            self.assertEqual(poly_square(a), poly_mul(a, a))
+    
+    def test_modulo(self):
+        """Test reduction modulo a polynomial."""
+        # x^4 = x^3 + 1 modulo x^4 + x^3 + 1
+        self.assertEqual(poly_mod(0b10000, 0b11001), 0b1001)
+        self.assertEqual(poly_mod(0b101, 0b11001), 0b101)
+        with self.assertRaises(ZeroDivisionError):
+            poly_mod(0b101, 0)
+    
+    def test_x_power_mod(self):
+        """Test cached powers of x against plain exponentiation."""
+        modulus = feedback_polynomial(16, [15, 14, 12, 3])
+        for exponent in [0, 1, 15, 16, 1000, (1 << 40) + 3]:
+            self.assertEqual(x_power_mod(exponent, modulus),
+                             poly_powmod(0b10, exponent, modulus))
+        # x has order 15 modulo the primitive polynomial x^4 + x^3 + 1
+        self.assertEqual(x_power_mod(15, 0b11001), 1)
+    
+    def test_x_power_mod_threads(self):
+        """Test that threads extending the same cached powers agree."""
+        modulus = feedback_polynomial(127, [126, 0])
+        exponents = [(1 << bits) + 5 for bits in range(20, 200, 7)]
+        results = {}
+        
+        def work(index):
+            for exponent in exponents[index:] + exponents[:index]:
+                results[index, exponent] = x_power_mod(exponent, modulus)
+        
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for (_, exponent), value in results.items():
+            self.assertEqual(value, poly_powmod(0b10, exponent, modulus))
+
+    
+    def test_gcd(self):
+        """Test the polynomial gcd."""
+        # x^2 + 1 = (x + 1)^2 and x^3 + 1 = (x + 1)(x^2 + x + 1)
+        self.assertEqual(poly_gcd(0b101, 0b1001), 0b11)
+        self.assertEqual(poly_gcd(0b111, 0b1011), 1)
+    
+    def test_irreducible(self):
+        """Test irreducibility against a brute-force search for divisors."""
+        for f in range(2, 1 << 9):
+            degree = f.bit_length() - 1
+            has_divisor = any(poly_mod(f, g) == 0
+                              for g in range(2, 1 << (degree // 2 + 1)))
+            self.assertEqual(is_irreducible(f), not has_divisor, bin(f))
+        # x^1279 + x^216 + 1 is a known primitive trinomial
+        self.assertTrue(is_irreducible((1 << 1279) | (1 << 216) | 1))
+    
+    def test_primitive(self):
+        """Test primitivity on known polynomials."""
+        self.assertTrue(is_primitive(0b11001))           # x^4 + x^3 + 1
+        self.assertFalse(is_primitive(0b11111))          # irreducible, order 5
+        self.assertFalse(is_primitive(0b11011))          # reducible
+        self.assertTrue(is_primitive((1 << 127) | 0b11))  # x^127 + x + 1
+        self.assertFalse(is_primitive((1 << 64) | (1 << 63) | (1 << 62) | 1))
+    
+    def test_factor(self):
+        """Test that factors are irreducible and multiply back to f."""
+        for f in [0b11011, 0b1000000, (1 << 24) | (1 << 3) | 1, 0b110011001100]:
+            product = 1
+            for factor, multiplicity in poly_factor(f).items():
+                self.assertTrue(is_irreducible(factor))
+                for _ in range(multiplicity):
+                    product = poly_mul(product, factor)
+            self.assertEqual(product, f)
+    
+    def test_order(self):
+        """Test the order of x against a direct search."""
+        for f in range(3, 1 << 9, 2):
+            order = 1
+            while x_power_mod(order, f) != 1:
+                order += 1
+            self.assertEqual(poly_order(f), order, bin(f))
+        with self.assertRaises(ValueError):
+            poly_order(0b110)
+    
+    def test_mersenne_prime_factors(self):
+        """Test the factorization of 2^n - 1."""
+        self.assertEqual(mersenne_prime_factors(12), (3, 5, 7, 13))
+        self.assertEqual(mersenne_prime_factors(67), (193707721, 761838257287))
+        for n in [32, 60, 64, 128]:
+            remaining = (1 << n) - 1
+            for p in mersenne_prime_factors(n):
+                while remaining % p == 0:
+                    remaining //= p
+            self.assertEqual(remaining, 1)
+    
+    def test_fermat_factors(self):
+        """Test the factorizations of 2^n - 1 for large powers of two."""
+        for n in [256, 1024, 4096]:
+            product = 1
+            for p in mersenne_prime_factors(n, max_steps=1 << 10):
+                product *= p
+            self.assertEqual(product, (1 << n) - 1)
+    
+    def test_seed_mersenne_factors(self):
+        """Test recording a factorization computed elsewhere."""
+        seed_mersenne_factors(89, [(1 << 89) - 1])
+        self.assertEqual(mersenne_prime_factors(89), ((1 << 89) - 1,))
+        with self.assertRaises(ValueError):
+            seed_mersenne_factors(90, [5])
+
+
+if __name__ == '__main__':
+    unittest.main()
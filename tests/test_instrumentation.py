@@ -0,0 +1,149 @@
+# tests/test_instrumentation.py
+"""
+Unit tests for the opt-in instrumentation.
+"""
+import json
+import os
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import instrumentation, stream, utils
+from src.basic_lfsr import BasicLFSR
+from src.general_lfsr import GeneralLFSR
+from src.large_lfsr import LargeLFSR
+from src.table_lfsr import TableLFSR, feedback_tables
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test cases for enabling, counting and exporting."""
+
+    def setUp(self):
+        """Start every test disabled with zeroed statistics."""
+        instrumentation.disable()
+        instrumentation.reset_stats()
+        self.addCleanup(instrumentation.disable)
+
+    def test_disabled_is_untouched(self):
+        """Test that the original functions are in place while disabled."""
+        next_bit = GeneralLFSR.__dict__['next_bit']
+        bits_to_bytes = stream.bits_to_bytes
+        instrumentation.enable()
+        self.assertIsNot(GeneralLFSR.__dict__['next_bit'], next_bit)
+        self.assertIsNot(stream.bits_to_bytes, bits_to_bytes)
+        instrumentation.disable()
+        self.assertIs(GeneralLFSR.__dict__['next_bit'], next_bit)
+        self.assertIs(stream.bits_to_bytes, bits_to_bytes)
+        self.assertIs(stream.bits_to_bytes, utils.bits_to_bytes)
+
+        GeneralLFSR().next_bytes(4)
+        self.assertEqual(instrumentation.stats()['calls'], {})
+        self.assertFalse(instrumentation.stats()['enabled'])
+
+    def test_counts(self):
+        """Test bit, call and jump counts, without counting nested calls twice."""
+        lfsr = GeneralLFSR(size=16, taps=[15, 13, 12, 10], seed=0xACE1)
+        reference = lfsr.clone()
+        expected = reference.next_bytes(10), reference.next_bits(20), reference.next_bit()
+        with instrumentation.instrumented() as current:
+            self.assertEqual((lfsr.next_bytes(10), lfsr.next_bits(20), lfsr.next_bit()), expected)
+            lfsr.skip(n=1000)
+            BasicLFSR().next_bit()
+            snapshot = current()
+
+        self.assertTrue(snapshot['enabled'])
+        self.assertEqual(snapshot['bits'], {'GeneralLFSR': 80 + 20 + 1, 'BasicLFSR': 1})
+        self.assertEqual(snapshot['calls']['GeneralLFSR.next_bytes'], 1)
+        self.assertEqual(snapshot['calls']['GeneralLFSR.skip'], 1)
+        self.assertEqual(snapshot['jumps'], 1)
+        self.assertEqual(snapshot['skipped_steps'], 1000)
+        self.assertEqual(snapshot['request_bits'][1], 2)
+        self.assertEqual(snapshot['request_bits'][16], 0)
+        self.assertEqual(snapshot['request_bits'][256], 2)
+        self.assertEqual(sum(snapshot['request_bits'].values()), 4)
+        for category in ['stepping', 'jump']:
+            self.assertGreater(snapshot['category_seconds'][category], 0)
+
+    def test_short_skip(self):
+        """Test that the steps of a short skip are not counted as output."""
+        lfsr = GeneralLFSR(size=16, taps=[15, 13, 12, 10], seed=0xACE1)
+        with instrumentation.instrumented() as current:
+            lfsr.skip(5)
+            snapshot = current()
+        self.assertEqual(snapshot['bits'], {})
+        self.assertEqual(sum(snapshot['request_bits'].values()), 0)
+        self.assertEqual(snapshot['jumps'], 1)
+        self.assertEqual(snapshot['skipped_steps'], 5)
+
+    def test_subclasses(self):
+        """Test that subclass overrides are counted and internal work is not."""
+        next_bit = LargeLFSR.__dict__['next_bit']
+        large = LargeLFSR(size=127, taps=[126, 0], seed=5)
+        table = TableLFSR(size=32, taps=[31, 30, 28, 1], seed=0xC0FFEE)
+        feedback_tables.cache_clear()
+        with instrumentation.instrumented() as current:
+            for _ in range(100):
+                large.next_bit()
+            table.next_word(4096)
+            snapshot = current()
+        self.assertIs(LargeLFSR.__dict__['next_bit'], next_bit)
+
+        self.assertEqual(snapshot['bits'], {'LargeLFSR': 100, 'TableLFSR': 4096})
+        self.assertEqual(snapshot['calls'], {'LargeLFSR.next_bit': 100, 'TableLFSR.next_word': 1})
+        self.assertEqual(snapshot['jumps'], 0)
+
+    def test_track(self):
+        """Test per-register bit counts."""
+        first, second = GeneralLFSR(), GeneralLFSR()
+        instrumentation.track(first, 'first')
+        with instrumentation.instrumented():
+            first.next_bytes(3)
+            second.next_bytes(5)
+            instrumentation.untrack(first)
+            first.next_bytes(1)
+        self.assertEqual(instrumentation.stats()['registers'], {'first': 24})
+
+    def test_prometheus(self):
+        """Test the Prometheus text export."""
+        with instrumentation.instrumented():
+            GeneralLFSR().next_bits(100)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'lfsr.prom')
+            instrumentation.write_prometheus(path)
+            with open(path) as handle:
+                lines = handle.read().splitlines()
+            self.assertEqual(os.listdir(directory), ['lfsr.prom'])
+
+        self.assertIn('# TYPE lfsr_bits_generated_total counter', lines)
+        self.assertIn('lfsr_bits_generated_total{class="GeneralLFSR"} 100', lines)
+        self.assertIn('lfsr_calls_total{function="GeneralLFSR.next_bits"} 1', lines)
+        self.assertIn('lfsr_request_bits_bucket{le="16"} 0', lines)
+        self.assertIn('lfsr_request_bits_bucket{le="256"} 1', lines)
+        self.assertIn('lfsr_request_bits_bucket{le="+Inf"} 1', lines)
+        self.assertIn('lfsr_request_bits_sum 100', lines)
+        self.assertIn('lfsr_request_bits_count 1', lines)
+
+    def test_reporter(self):
+        """Test the periodic JSON log."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'lfsr.log')
+            reporter = instrumentation.Reporter(path, interval=60, format='log')
+            reporter.start()
+            with instrumentation.instrumented():
+                GeneralLFSR().next_bit()
+            reporter.stop()
+            with open(path) as handle:
+                records = [json.loads(line) for line in handle]
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]['bits'], {'GeneralLFSR': 1})
+
+        with self.assertRaises(ValueError):
+            instrumentation.Reporter(path, format='xml')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+# tests/test_large_lfsr.py
+"""
+Unit tests for the LargeLFSR implementation.
+"""
+import copy
+import unittest
+import sys
+from pathlib import Path
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.catalogue import primitive_taps
+from src.general_lfsr import GeneralLFSR
+from src.large_lfsr import LargeLFSR
+
+
+class TestLargeLFSR(unittest.TestCase):
+    """Test cases for the LargeLFSR class."""
+
+    def test_matches_general_lfsr(self):
+        """Test that buffer stepping reproduces GeneralLFSR exactly."""
+        configs = [
+            (4, [3, 0], 0b0110),
+            (17, [16, 16, 2], 0x1ABCD),           # repeated tap cancels out
+            (64, [63, 61, 60, 0], 0x0123456789ABCDEF),
+            (127, primitive_taps(127), (1 << 126) | 12345),
+            (1279, primitive_taps(1279), (1 << 1279) - 3),
+        ]
+        for size, taps, seed in configs:
+            reference = GeneralLFSR(size=size, taps=taps, seed=seed)
+            large = LargeLFSR(size=size, taps=taps, seed=seed)
+            self.assertEqual(large.state, seed)
+
+            # Step past a full turn of the head, then mix in bulk calls
+            bits = [large.next_bit() for _ in range(2 * size + 3)]
+            self.assertEqual(bits, reference.next_bits(2 * size + 3))
+            self.assertEqual(large.get_state(), reference.get_state())
+            self.assertEqual(large.next_bits(7), reference.next_bits(7))
+            self.assertEqual(large.next_bytes(300), reference.next_bytes(300))
+            self.assertEqual(large.skip(10 ** 6), reference.skip(10 ** 6))
+            self.assertEqual(large.next_bit(), reference.next_bit())
+            self.assertEqual(large.state, reference.state)
+
+    def test_high_taps(self):
+        """Test taps within a word of the size, whose feedback feeds back."""
+        configs = [
+            (5, [4, 2, 0]),
+            (64, [63, 0]),
+            (200, list(range(199, 0, -3)) + [0]),
+            (1024, [1023, 1000, 961, 0]),
+        ]
+        for size, taps in configs:
+            reference = GeneralLFSR(size=size, taps=taps, seed=(1 << size) - 3)
+            large = LargeLFSR(size=size, taps=taps, seed=(1 << size) - 3)
+            for n in [1, 63, 64, 65, 130, size - 1]:
+                self.assertEqual(large.next_word(n), reference.next_word(n))
+                self.assertEqual(large.state, reference.state)
+            self.assertEqual([large.next_bit() for _ in range(300)], reference.next_bits(300))
+
+    def test_set_taps(self):
+        """Test that bits computed ahead are recomputed with new taps."""
+        reference = GeneralLFSR(size=127, taps=[126, 0], seed=99)
+        large = LargeLFSR(size=127, taps=[126, 0], seed=99)
+        self.assertEqual(large.next_bits(10), reference.next_bits(10))
+        reference.set_taps([126, 62, 0])
+        large.set_taps([126, 62, 0])
+        self.assertEqual(large.next_bits(200), reference.next_bits(200))
+
+    def test_reset_and_clone(self):
+        """Test reset semantics and independent copies."""
+        large = LargeLFSR(size=1279, taps=primitive_taps(1279), seed=5)
+        with self.assertRaises(ValueError):
+            LargeLFSR(size=100, seed=1 << 100)
+        with self.assertRaises(ValueError):
+            large.reset(1 << 1279)
+
+        for _ in range(100):
+            large.next_bit()
+        state = large.state
+        self.assertEqual(large.reset(), state)
+
+        for clone in [large.clone(), copy.copy(large)]:
+            self.assertEqual(clone.state, state)
+            self.assertEqual(clone.next_bytes(10), large.clone().next_bytes(10))
+        self.assertEqual(large.state, state)
+
+        self.assertEqual(large.reset(5), 5)
+        self.assertEqual(large.head, 0)
+        self.assertEqual(large.next_bit(), 1)
+        self.assertFalse(hasattr(large, '__dict__'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+# tests/test_package.py
+"""
+Unit tests for the package namespace and its lazily loaded subsystems.
+"""
+import unittest
+import sys
+from pathlib import Path
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import src
+from src.catalogue import primitive_taps
+from src.general_lfsr import GeneralLFSR
+
+
+class TestPackage(unittest.TestCase):
+    """Test cases for the package exports."""
+
+    def test_core_exports(self):
+        """Test that the core registers come with the package."""
+        self.assertIs(src.GeneralLFSR, GeneralLFSR)
+        self.assertEqual(src.BasicLFSR().size, 4)
+
+    def test_lazy_exports(self):
+        """Test that subsystems and their names load on access."""
+        self.assertIs(src.catalogue.primitive_taps, primitive_taps)
+        self.assertIs(src.primitive_taps, primitive_taps)
+        self.assertTrue(callable(src.parallel_generate))
+        self.assertIn('LFSRBank', dir(src))
+        self.assertIn('bank', dir(src))
+        with self.assertRaises(AttributeError):
+            src.no_such_module
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+# tests/test_parallel.py
+"""
+Unit tests for multi-process keystream generation.
+"""
+import unittest
+import sys
+from multiprocessing import shared_memory
+from pathlib import Path
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.galois_lfsr import GaloisLFSR
+from src.general_lfsr import GeneralLFSR
+from src.large_lfsr import LargeLFSR
+from src.table_lfsr import TableLFSR
+from src.parallel import parallel_generate, split_segments
+
+
+class TestParallelGenerate(unittest.TestCase):
+    """Test cases for parallel_generate."""
+    
+    def test_split_segments(self):
+        """Test that segments are contiguous and cover the whole range."""
+        self.assertEqual(split_segments(10, 3), [(0, 4), (4, 3), (7, 3)])
+        self.assertEqual(split_segments(2, 4), [(0, 1), (1, 1)])
+    
+    def test_matches_serial(self):
+        """Test that parallel output is byte-identical to serial output."""
+        serial = GeneralLFSR(size=32, taps=[31, 30, 28, 1], seed=0xC0FFEE)
+        parallel = GeneralLFSR(size=32, taps=[31, 30, 28, 1], seed=0xC0FFEE)
+        
+        expected = serial.next_bytes(300001)
+        self.assertEqual(parallel_generate(parallel, 300001, workers=3), expected)
+        self.assertEqual(parallel.state, serial.state)
+    
+    def test_small_request(self):
+        """Test that small requests fall back to serial generation."""
+        serial = GeneralLFSR(size=16, taps=[15, 14, 12, 3], seed=0xACE1)
+        parallel = GeneralLFSR(size=16, taps=[15, 14, 12, 3], seed=0xACE1)
+        
+        self.assertEqual(parallel_generate(parallel, 100, workers=4), serial.next_bytes(100))
+        self.assertEqual(parallel_generate(parallel, 0, workers=4), b'')
+        
+        with self.assertRaises(ValueError):
+            parallel_generate(parallel, 10, workers=0)
+    
+    def test_shared_output(self):
+        """Test writing into a caller's shared memory block without a copy."""
+        serial = GeneralLFSR(size=32, taps=[31, 30, 28, 1], seed=0xC0FFEE)
+        parallel = GeneralLFSR(size=32, taps=[31, 30, 28, 1], seed=0xC0FFEE)
+        
+        shm = shared_memory.SharedMemory(create=True, size=200000)
+        self.addCleanup(shm.unlink)
+        self.addCleanup(shm.close)
+        with parallel_generate(parallel, 150000, workers=2, out=shm) as view:
+            self.assertEqual(view.obj, shm.buf.obj)
+            self.assertEqual(bytes(view), serial.next_bytes(150000))
+        with parallel_generate(parallel, 100, workers=2, out=shm) as view:
+            self.assertEqual(bytes(view), serial.next_bytes(100))
+        self.assertEqual(parallel.state, serial.state)
+        
+        with self.assertRaises(ValueError):
+            parallel_generate(parallel, 200001, workers=2, out=shm)
+    
+    def test_register_types(self):
+        """Test that subclasses keep their type and other registers are rejected."""
+        for parallel in [LargeLFSR(size=127, taps=[126, 0], seed=12345),
+                         TableLFSR(size=32, taps=[31, 30, 28, 1], seed=0xC0FFEE, chunk=16)]:
+            serial = GeneralLFSR(size=parallel.size, taps=list(parallel.taps), seed=parallel.state)
+            self.assertEqual(parallel_generate(parallel, 140000, workers=2), serial.next_bytes(140000))
+            self.assertEqual(parallel.state, serial.state)
+        
+        with self.assertRaises(TypeError):
+            parallel_generate(GaloisLFSR(size=8, taps=[7, 3, 2, 1], seed=1), 140000, workers=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
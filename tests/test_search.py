@@ -0,0 +1,125 @@
+# tests/test_search.py
+"""
+Unit tests for the parallel primitive polynomial search.
+"""
+import os
+import tempfile
+import threading
+import unittest
+import sys
+from itertools import combinations
+from pathlib import Path
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.gf2 import feedback_polynomial, is_primitive
+from src.search import search_primitive, unrank_combination
+
+
+def _low_taps(taps):
+    """Module-level constraint, so it can be sent to worker processes."""
+    return taps[0] <= 6
+
+
+def _odd_second_tap(taps):
+    """Second module-level constraint, combined with _low_taps."""
+    return taps[1] % 2 == 1
+
+
+class TestSearch(unittest.TestCase):
+    """Test cases for search_primitive()."""
+
+    def brute_force(self, size, weight):
+        """Return all primitive tap sets of a size and weight."""
+        found = []
+        for middle in combinations(range(1, size), weight - 2):
+            taps = sorted(middle, reverse=True) + [0]
+            if is_primitive(feedback_polynomial(size, taps)):
+                found.append(taps)
+        return sorted(found)
+
+    def test_unrank_combination(self):
+        """Test that ranks enumerate combinations in colex order."""
+        ranked = [unrank_combination(rank, 3) for rank in range(20)]
+        expected = sorted((list(c) for c in combinations(range(6), 3)),
+                          key=lambda c: c[::-1])
+        self.assertEqual(ranked, expected)
+
+    def test_matches_brute_force(self):
+        """Test serial and parallel searches against brute force."""
+        expected = self.brute_force(12, 5)
+        serial = list(search_primitive(12, workers=1, chunk_size=16))
+        self.assertEqual(sorted(serial), expected)
+        parallel = list(search_primitive(12, workers=2, chunk_size=16))
+        self.assertEqual(sorted(parallel), expected)
+        self.assertEqual(sorted(search_primitive(7, weight=3, workers=1)),
+                         self.brute_force(7, 3))
+
+    def test_constraint(self):
+        """Test that only accepted candidates are reported."""
+        expected = [taps for taps in self.brute_force(12, 5) if _low_taps(taps)]
+        found = list(search_primitive(12, constraints=_low_taps, workers=2, chunk_size=16))
+        self.assertEqual(sorted(found), expected)
+
+    def test_several_constraints(self):
+        """Test that candidates must satisfy every constraint."""
+        expected = [taps for taps in self.brute_force(12, 5)
+                    if _low_taps(taps) and _odd_second_tap(taps)]
+        found = list(search_primitive(12, constraints=[_low_taps, _odd_second_tap],
+                                      workers=1, chunk_size=16))
+        self.assertEqual(sorted(found), expected)
+        self.assertEqual(list(search_primitive(12, constraints=[], workers=1)),
+                         list(search_primitive(12, workers=1)))
+        with self.assertRaises(TypeError):
+            list(search_primitive(12, constraints=[_low_taps, 3], workers=1))
+
+    def test_checkpoint_resume(self):
+        """Test that a cancelled search resumes to the full result."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'search.json')
+            cancel = threading.Event()
+            partial = []
+            for taps in search_primitive(12, workers=1, checkpoint=path,
+                                         cancel=cancel, chunk_size=16):
+                partial.append(taps)
+                cancel.set()
+            self.assertTrue(os.path.exists(path))
+
+            resumed = list(search_primitive(12, workers=1, checkpoint=path, chunk_size=16))
+            self.assertEqual(resumed[:len(partial)], partial)
+            self.assertEqual(sorted(resumed), self.brute_force(12, 5))
+
+            with self.assertRaises(ValueError):
+                list(search_primitive(12, workers=1, checkpoint=path, chunk_size=8))
+
+    def test_checkpoint_constraint(self):
+        """Test that a checkpoint only resumes a search with the same filter."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'search.json')
+            found = list(search_primitive(12, constraints=_low_taps, workers=1,
+                                          checkpoint=path, chunk_size=16))
+            resumed = list(search_primitive(12, constraints=_low_taps, workers=1,
+                                            checkpoint=path, chunk_size=16))
+            self.assertEqual(resumed, found)
+
+            with self.assertRaises(ValueError):
+                list(search_primitive(12, workers=1, checkpoint=path, chunk_size=16))
+            with self.assertRaises(ValueError):
+                list(search_primitive(12, constraints=[_low_taps, _odd_second_tap], workers=1,
+                                      checkpoint=path, chunk_size=16))
+            with self.assertRaises(ValueError):
+                list(search_primitive(12, constraints=lambda taps: True, workers=1,
+                                      checkpoint=os.path.join(directory, 'other.json')))
+
+    def test_invalid_arguments(self):
+        """Test validation of weight, size and workers."""
+        for kwargs in [{'weight': 4}, {'weight': 1}, {'workers': 0}, {'chunk_size': 0}]:
+            with self.assertRaises(ValueError):
+                list(search_primitive(12, **kwargs))
+        with self.assertRaises(ValueError):
+            list(search_primitive(3, weight=5))
+
+
+if __name__ == '__main__':
+    unittest.main()
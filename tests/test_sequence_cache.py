@@ -0,0 +1,115 @@
+# tests/test_sequence_cache.py
+"""
+Unit tests for the memoized sequence cache.
+"""
+import copy
+import unittest
+import sys
+from pathlib import Path
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.basic_lfsr import BasicLFSR
+from src.combiners import GeffeGenerator
+from src.galois_lfsr import GaloisLFSR
+from src.general_lfsr import GeneralLFSR
+from src.sequence_cache import SequenceCache, bit_at, sequence_slice
+from src.utils import generate_sequence
+
+
+class TestSequenceCache(unittest.TestCase):
+    """Test cases for indexing cached sequences."""
+
+    def test_matches_stepping(self):
+        """Test bits, slices and sequences against a stepped register."""
+        configs = [
+            (4, [3, 0]),              # primitive
+            (6, [5, 4, 3, 0]),        # several orbits
+            (12, [11, 10, 9, 3, 0]),
+            (5, [4, 2]),              # singular: not cached
+            (30, [29, 5, 3, 0]),      # above max_size: not cached
+        ]
+        cache = SequenceCache()
+        for size, taps in configs:
+            for seed in [1, 5, (1 << size) - 1, 0]:
+                lfsr = GeneralLFSR(size=size, taps=taps, seed=seed)
+                expected = lfsr.clone().next_bits(300)
+                self.assertEqual([cache.bit_at(lfsr, i) for i in [0, 1, 17, 299]],
+                                 [expected[i] for i in [0, 1, 17, 299]])
+                self.assertEqual(cache.slice(lfsr, 3, 250), expected[3:250])
+                self.assertEqual(cache.slice(lfsr, 7, 7), [])
+
+                reference = lfsr.clone()
+                self.assertEqual(cache.generate_sequence(lfsr, 123), reference.next_bits(123))
+                self.assertEqual(lfsr.state, reference.state)
+
+        # Only the first three configurations were cached
+        count = len(cache)
+        for size, taps in configs[3:]:
+            cache.bit_at(GeneralLFSR(size=size, taps=taps, seed=1), 0)
+        self.assertEqual(len(cache), count)
+
+    def test_orbits_are_shared(self):
+        """Test that seeds on one orbit share an entry at their offsets."""
+        cache = SequenceCache()
+        lfsr = GeneralLFSR.maximal(16, seed=0xACE1)
+        cache.bit_at(lfsr, 0)
+        nbytes = cache.nbytes
+        for steps in [1, 100, 50000]:
+            other = lfsr.clone()
+            other.skip(steps)
+            self.assertEqual(cache.slice(other, 0, 64), other.clone().next_bits(64))
+            self.assertEqual(cache.bit_at(lfsr, steps + 5), other.clone().next_bits(6)[5])
+        self.assertEqual((len(cache), cache.nbytes, cache.misses), (1, nbytes, 1))
+
+    def test_budget(self):
+        """Test LRU eviction and orbits larger than the budget."""
+        cache = SequenceCache(max_bytes=8000)
+        first = GeneralLFSR(size=12, taps=[11, 10, 9, 3, 0], seed=1)
+        second = GeneralLFSR(size=12, taps=[11, 5, 3, 0], seed=1)
+        cache.bit_at(first, 0)
+        cache.bit_at(second, 0)
+        self.assertEqual(len(cache), 1)
+        self.assertLessEqual(cache.nbytes, 8000)
+
+        # The first orbit was evicted, the second is still cached
+        cache.bit_at(second, 1)
+        self.assertEqual(cache.misses, 2)
+        cache.bit_at(first, 1)
+        self.assertEqual(cache.misses, 3)
+
+        large = GeneralLFSR.maximal(16)
+        self.assertEqual(cache.slice(large, 10, 20), large.clone().next_bits(20)[10:])
+        self.assertEqual(len(cache), 1)
+
+    def test_other_registers(self):
+        """Test Galois registers and combiners, which are never cached."""
+        galois = GaloisLFSR(size=8, taps=[7, 3, 2, 1], seed=1)
+        geffe = GeffeGenerator(GeneralLFSR(size=5, taps=[4, 2, 0], seed=3),
+                               GeneralLFSR(size=7, taps=[6, 5, 0], seed=9),
+                               GeneralLFSR(size=9, taps=[8, 4, 0], seed=17))
+        for register in [galois, geffe]:
+            expected = copy.deepcopy(register).next_bits(100)
+            self.assertEqual(bit_at(register, 5), expected[5])
+            self.assertEqual(sequence_slice(register, 40, 100), expected[40:])
+            self.assertEqual(register.next_bits(100), expected)
+
+    def test_basic_lfsr(self):
+        """Test BasicLFSR and the module-level functions."""
+        lfsr = BasicLFSR()
+        walker = lfsr.clone()
+        expected = [walker.next_bit() for _ in range(40)]
+        self.assertEqual(bit_at(lfsr, 33), expected[33])
+        self.assertEqual(sequence_slice(lfsr, 2, 40), expected[2:])
+        self.assertEqual(generate_sequence(lfsr, 40), expected)
+        self.assertEqual(lfsr.state, walker.state)
+
+        with self.assertRaises(ValueError):
+            bit_at(lfsr, -1)
+        with self.assertRaises(ValueError):
+            sequence_slice(lfsr, 5, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
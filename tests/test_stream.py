@@ -0,0 +1,184 @@
+# tests/test_stream.py
+"""
+Unit tests for streaming keystream output.
+"""
+import asyncio
+import hashlib
+import io
+import shutil
+import unittest
+import sys
+from pathlib import Path
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.basic_lfsr import BasicLFSR
+from src.general_lfsr import GeneralLFSR
+from src.stream import AsyncLFSRStream, LFSRStream, iter_bytes
+from src.utils import bits_to_bytes, generate_sequence
+
+
+def make_lfsr():
+    """Create the 16-bit LFSR used throughout these tests."""
+    return GeneralLFSR(size=16, taps=[15, 14, 12, 3], seed=0xACE1)
+
+
+class TestIterBytes(unittest.TestCase):
+    """Test cases for iter_bytes."""
+    
+    def test_matches_next_bit(self):
+        """Test that chunks concatenate to the per-bit keystream."""
+        expected = bits_to_bytes(generate_sequence(make_lfsr(), 8 * 1000))
+        chunks = list(iter_bytes(make_lfsr(), chunk_size=300, nbytes=1000))
+        self.assertEqual([len(chunk) for chunk in chunks], [300, 300, 300, 100])
+        self.assertEqual(b''.join(chunks), expected)
+    
+    def test_endless(self):
+        """Test that the iterator is lazy and endless without nbytes."""
+        iterator = iter_bytes(BasicLFSR(), chunk_size=2)
+        first = next(iterator)
+        second = next(iterator)
+        self.assertEqual(first + second, bits_to_bytes(generate_sequence(BasicLFSR(), 32)))
+    
+    def test_invalid_chunk_size(self):
+        """Test that a non-positive chunk size is rejected."""
+        with self.assertRaises(ValueError):
+            next(iter_bytes(make_lfsr(), chunk_size=0))
+
+
+class TestLFSRStream(unittest.TestCase):
+    """Test cases for LFSRStream."""
+    
+    def test_readinto(self):
+        """Test that readinto fills the caller's buffer."""
+        expected = make_lfsr().next_bytes(64)
+        stream = LFSRStream(make_lfsr())
+        buffer = bytearray(40)
+        self.assertEqual(stream.readinto(buffer), 40)
+        self.assertEqual(bytes(buffer), expected[:40])
+        self.assertEqual(stream.read(24), expected[40:])
+        self.assertEqual(stream.tell(), 64)
+    
+    def test_length_and_copy(self):
+        """Test end of stream and use with file-oriented standard library calls."""
+        expected = make_lfsr().next_bytes(100000)
+        
+        output = io.BytesIO()
+        shutil.copyfileobj(LFSRStream(make_lfsr(), length=100000), output, 4096)
+        self.assertEqual(output.getvalue(), expected)
+        
+        stream = io.BufferedReader(LFSRStream(make_lfsr(), length=100000))
+        digest = hashlib.sha256()
+        for block in iter(lambda: stream.read(8192), b''):
+            digest.update(block)
+        self.assertEqual(digest.hexdigest(), hashlib.sha256(expected).hexdigest())
+        
+        self.assertEqual(LFSRStream(make_lfsr(), length=10).read(), expected[:10])
+    
+    def test_read_to_end(self):
+        """Test reading without a size, which an endless stream refuses."""
+        expected = make_lfsr().next_bytes(30)
+        stream = LFSRStream(make_lfsr(), length=30)
+        self.assertEqual(stream.read(10), expected[:10])
+        self.assertEqual(stream.read(-1), expected[10:])
+        self.assertEqual(stream.readall(), b'')
+        
+        endless = LFSRStream(make_lfsr())
+        for read in (endless.read, lambda: endless.read(-1), endless.readall):
+            with self.assertRaises(ValueError):
+                read()
+        self.assertEqual(endless.read(5), expected[:5])
+
+
+
+class CountingLFSR(GeneralLFSR):
+    """A GeneralLFSR that records the size of every next_bytes() call."""
+    
+    def __init__(self):
+        super().__init__(size=16, taps=[15, 14, 12, 3], seed=0xACE1)
+        self.requests = []
+    
+    def next_bytes(self, n):
+        self.requests.append(n)
+        return super().next_bytes(n)
+
+
+class MemoryWriter:
+    """Collects what an asyncio StreamWriter would send."""
+    
+    def __init__(self):
+        self.data = bytearray()
+        self.drains = 0
+    
+    def write(self, data):
+        self.data += data
+    
+    async def drain(self):
+        self.drains += 1
+
+
+class TestAsyncLFSRStream(unittest.TestCase):
+    """Test cases for AsyncLFSRStream."""
+    
+    def test_read(self):
+        """Test that reads of any size follow the synchronous keystream."""
+        expected = LFSRStream(make_lfsr(), length=10000).read()
+        
+        async def read_all():
+            async with AsyncLFSRStream(make_lfsr(), length=10000, chunk_size=1000) as stream:
+                parts = [await stream.read(n) for n in (1, 999, 2500, 0, 6000, 1000)]
+                parts.append(await stream.read(10))
+                return parts, stream.position
+        
+        parts, position = asyncio.run(read_all())
+        self.assertEqual(b''.join(parts), expected)
+        self.assertEqual(parts[-2], expected[9500:])
+        self.assertEqual(parts[-1], b'')
+        self.assertEqual(position, 10000)
+    
+    def test_back_pressure(self):
+        """Test that generation stays a bounded number of chunks ahead."""
+        lfsr = CountingLFSR()
+        
+        async def read_slowly():
+            async with AsyncLFSRStream(lfsr, chunk_size=500, prefetch=2) as stream:
+                await stream.read(10)
+                await asyncio.sleep(0.2)
+                return len(lfsr.requests)
+        
+        # One chunk being read, two queued and one waiting to be queued
+        self.assertLessEqual(asyncio.run(read_slowly()), 4)
+    
+    def test_iteration_and_copy(self):
+        """Test async iteration and copying to a stream writer."""
+        expected = LFSRStream(make_lfsr(), length=3000).read()
+        
+        async def run():
+            chunks = [chunk async for chunk in AsyncLFSRStream(make_lfsr(), length=3000,
+                                                               chunk_size=700)]
+            writer = MemoryWriter()
+            stream = AsyncLFSRStream(make_lfsr(), length=3000, chunk_size=700)
+            written = await stream.copy_to(writer)
+            await stream.aclose()
+            return chunks, writer, written
+        
+        chunks, writer, written = asyncio.run(run())
+        self.assertEqual([len(chunk) for chunk in chunks], [700, 700, 700, 700, 200])
+        self.assertEqual(b''.join(chunks), expected)
+        self.assertEqual(bytes(writer.data), expected)
+        self.assertEqual(written, 3000)
+        self.assertEqual(writer.drains, 5)
+    
+    def test_invalid_arguments(self):
+        """Test argument validation."""
+        with self.assertRaises(ValueError):
+            AsyncLFSRStream(make_lfsr(), chunk_size=0)
+        with self.assertRaises(ValueError):
+            AsyncLFSRStream(make_lfsr(), prefetch=0)
+        with self.assertRaises(ValueError):
+            asyncio.run(AsyncLFSRStream(make_lfsr()).read())
+
+
+if __name__ == '__main__':
+    unittest.main()
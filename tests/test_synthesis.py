@@ -0,0 +1,95 @@
+# tests/test_synthesis.py
+"""
+Unit tests for Berlekamp-Massey LFSR synthesis.
+"""
+import random
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import synthesis
+from src.general_lfsr import GeneralLFSR
+from src.synthesis import (BerlekampMassey, berlekamp_massey, linear_complexity,
+                           linear_complexity_profile)
+from src.utils import _numpy, generate_sequence, unpack_bits
+
+
+def brute_force_complexity(bits):
+    """Find the linear complexity by trying every register from the smallest."""
+    for size in range(len(bits) + 1):
+        for mask in range(1 << size):
+            if all(bits[i] == sum(bits[i - size + t] for t in range(size) if (mask >> t) & 1) % 2
+                   for i in range(size, len(bits))):
+                return size
+
+
+class TestBerlekampMassey(unittest.TestCase):
+    """Test cases for the Berlekamp-Massey synthesizer."""
+    
+    def test_recovers_register(self):
+        """Test recovering size, taps and seed from a register's output."""
+        lfsr = GeneralLFSR(size=16, taps=[15, 14, 12, 3], seed=0xACE1)
+        recovered = berlekamp_massey(generate_sequence(lfsr, 100))
+        self.assertEqual(recovered.size, 16)
+        self.assertEqual(sorted(recovered.taps), [3, 12, 14, 15])
+        self.assertEqual(recovered.state, 0xACE1)
+    
+    def test_against_brute_force(self):
+        """Test the complexity and the reproduced sequence on short inputs."""
+        rng = random.Random(1)
+        sequences = [[], [0, 0, 0], [0, 0, 0, 1], [1, 0, 0, 0, 0]]
+        sequences += [[rng.getrandbits(1) for _ in range(rng.randint(1, 10))] for _ in range(50)]
+        for bits in sequences:
+            self.assertEqual(linear_complexity(bits), brute_force_complexity(bits), bits)
+            lfsr = berlekamp_massey(bits)
+            self.assertEqual(generate_sequence(lfsr, len(bits)), bits, bits)
+    
+    def test_incremental(self):
+        """Test that bit-by-bit updates give the complexity profile."""
+        bits = [0, 1, 1, 0, 1, 0, 1, 1, 1, 0, 0, 0, 1]
+        synthesizer = BerlekampMassey()
+        profile = [synthesizer.update(bit) for bit in bits]
+        self.assertEqual(profile, linear_complexity_profile(bits))
+        self.assertEqual(profile, [brute_force_complexity(bits[:i + 1]) for i in range(len(bits))])
+        self.assertEqual(synthesizer.length, len(bits))
+    
+    def test_packed_output(self):
+        """Test synthesis from a long packed keystream."""
+        lfsr = GeneralLFSR(size=64, taps=[4, 3, 1, 0], seed=0x0123456789ABCDEF)
+        bits = unpack_bits(lfsr.next_bytes(4096))
+        recovered = berlekamp_massey(bits)
+        self.assertEqual((recovered.size, recovered.state), (64, 0x0123456789ABCDEF))
+    
+    @unittest.skipIf(_numpy() is None, "NumPy is not installed")
+    def test_array_kernel(self):
+        """Test that the NumPy kernel agrees with the integer path."""
+        rng = random.Random(2)
+        for _ in range(20):
+            bits = [rng.getrandbits(1) for _ in range(rng.randint(0, 300))]
+            bits += [0] * rng.randint(0, 300) + [1]
+            expected = BerlekampMassey()
+            for bit in bits:
+                expected.update(bit)
+            
+            with mock.patch.object(synthesis, 'ARRAY_THRESHOLD', 8):
+                synthesizer = BerlekampMassey()
+                split = rng.randint(0, len(bits))
+                synthesizer.extend(bits[:split])
+                synthesizer.extend(bits[split:])
+            self.assertEqual(synthesizer.complexity, expected.complexity)
+            self.assertEqual(synthesizer.connection_polynomial(),
+                             expected.connection_polynomial())
+            
+            # Bit-by-bit updates carry on where the arrays stopped
+            for bit in [1, 0, 1, 1]:
+                self.assertEqual(synthesizer.update(bit), expected.update(bit))
+            self.assertEqual(synthesizer.connection_polynomial(),
+                             expected.connection_polynomial())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+# tests/test_table_lfsr.py
+"""
+Unit tests for the TableLFSR implementation.
+"""
+import unittest
+import sys
+from pathlib import Path
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.general_lfsr import GeneralLFSR
+from src.table_lfsr import TableLFSR, feedback_tables
+
+
+class TestTableLFSR(unittest.TestCase):
+    """Test cases for the TableLFSR class."""
+    
+    def test_matches_general_lfsr(self):
+        """Test that table stepping reproduces GeneralLFSR exactly."""
+        configs = [
+            (8, [7, 5, 3, 0], 0b10101010),
+            (16, [15, 14, 12, 3], 0xACE1),
+            (17, [16, 16, 2], 0x1ABCD),           # repeated tap cancels out
+            (64, [63, 61, 60, 0], 0x0123456789ABCDEF),
+        ]
+        for size, taps, seed in configs:
+            for chunk in [c for c in (8, 16) if c <= size]:
+                for length in [0, 5, 8, 123, 1000, 20000]:
+                    reference = GeneralLFSR(size=size, taps=taps, seed=seed)
+                    table = TableLFSR(size=size, taps=taps, seed=seed, chunk=chunk)
+                    self.assertEqual(table.next_bits(length), reference.next_bits(length))
+                    self.assertEqual(table.state, reference.state)
+    
+    def test_set_taps(self):
+        """Test that changing taps switches to the matching tables."""
+        table = TableLFSR(size=16, taps=[15, 14, 12, 3], seed=0xACE1)
+        table.next_bytes(10)
+        table.set_taps([15, 0])
+        
+        reference = GeneralLFSR(size=16, taps=[15, 0], seed=table.state)
+        self.assertEqual(table.next_bytes(50), reference.next_bytes(50))
+    
+    def test_tables_are_cached(self):
+        """Test that equal configurations share one set of tables."""
+        first = TableLFSR(size=32, taps=[31, 21, 1, 0], seed=1)
+        second = TableLFSR(size=32, taps=[0, 1, 21, 31], seed=2)
+        self.assertIs(first._tables(), second._tables())
+        self.assertLessEqual(feedback_tables.cache_info().currsize,
+                             feedback_tables.cache_info().maxsize)
+    
+    def test_invalid_chunk(self):
+        """Test that unsupported chunk widths and sizes are rejected."""
+        with self.assertRaises(ValueError):
+            TableLFSR(size=16, chunk=4)
+        with self.assertRaises(ValueError):
+            TableLFSR(size=12, chunk=16)
+
+
+if __name__ == '__main__':
+    unittest.main()
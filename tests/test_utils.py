@@ -0,0 +1,214 @@
+# tests/test_utils.py
+"""
+Unit tests for the LFSR utility functions.
+"""
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.basic_lfsr import BasicLFSR
+from src.galois_lfsr import GaloisLFSR
+from src.general_lfsr import GeneralLFSR
+from src import utils
+from src.utils import (compute_period, find_cycle, is_maximum_length,
+                       bits_to_bytes, bytes_to_bits, pack_bits, unpack_bits)
+
+
+def walk_period(lfsr):
+    """Reference period: step a copy until a state repeats."""
+    copy = GeneralLFSR(size=lfsr.size, taps=lfsr.taps, seed=lfsr.state)
+    first_seen = {}
+    step = 0
+    while copy.state not in first_seen:
+        first_seen[copy.state] = step
+        copy.next_bit()
+        step += 1
+    return step - first_seen[copy.state]
+
+
+class TestPeriod(unittest.TestCase):
+    """Test cases for the algebraic period computations."""
+    
+    def test_compute_period_matches_walk(self):
+        """Test exact periods for primitive, reducible and singular taps."""
+        configs = [
+            (4, [3, 0]),          # primitive
+            (4, [3, 1]),          # reducible
+            (6, [5, 4, 3, 0]),
+            (8, [7, 5, 3, 0]),
+            (8, [6, 2]),          # divisible by x, sequence has a transient
+            (9, [4, 4]),          # taps cancel out entirely
+        ]
+        for size, taps in configs:
+            for seed in [0, 1, 0b101, (1 << size) - 1]:
+                lfsr = GeneralLFSR(size=size, taps=taps, seed=seed)
+                self.assertEqual(compute_period(lfsr), walk_period(lfsr), (size, taps, seed))
+                self.assertEqual(lfsr.state, seed)
+    
+    def test_compute_period_large(self):
+        """Test periods far beyond what a state walk can reach."""
+        lfsr = GeneralLFSR(size=127, taps=[1, 0], seed=5)
+        self.assertEqual(compute_period(lfsr), (1 << 127) - 1)
+        
+        # x^64 + x^4 + x^3 + x + 1 is primitive
+        lfsr = GeneralLFSR(size=64, taps=[4, 3, 1, 0], seed=1)
+        self.assertEqual(compute_period(lfsr), (1 << 64) - 1)
+    
+    def test_compute_period_basic(self):
+        """Test the state-walk fallback for LFSRs without taps."""
+        self.assertEqual(compute_period(BasicLFSR()), 15)
+    
+    def test_galois_lfsr(self):
+        """Test that Galois registers are analysed in their own form."""
+        self.assertEqual(compute_period(GaloisLFSR(size=8, taps=[7, 3, 2, 1], seed=0b10101010)), 255)
+        self.assertTrue(is_maximum_length(GaloisLFSR(size=8, taps=[7, 3, 2, 1], seed=1)))
+        self.assertFalse(is_maximum_length(GaloisLFSR(size=8, taps=[7, 3, 2, 1], seed=0)))
+        
+        for size, taps in [(4, [3, 2]), (4, [3, 1]), (6, [5, 4, 1]), (8, [7, 6, 5, 4])]:
+            for seed in [1, 0b101, (1 << size) - 1]:
+                lfsr = GaloisLFSR(size=size, taps=taps, seed=seed)
+                period = find_cycle(lfsr)[1]
+                self.assertEqual(compute_period(lfsr), period, (size, taps, seed))
+                self.assertEqual(is_maximum_length(lfsr), period == (1 << size) - 1, (size, taps))
+                self.assertEqual(lfsr.state, seed)
+    
+    def test_compute_period_budget(self):
+        """Test that factoring out of reach gives up instead of running on."""
+        # x^607 + x^605 + 1 has irreducible factors of degree 35, 69 and 501
+        lfsr = GeneralLFSR(size=607, taps=[605, 0], seed=1)
+        with self.assertRaises(ArithmeticError):
+            compute_period(lfsr, max_steps=1 << 10)
+    
+    def test_is_maximum_length(self):
+        """Test the algebraic maximum-length check."""
+        self.assertTrue(is_maximum_length(GeneralLFSR(size=4, taps=[3, 0], seed=0b0110)))
+        self.assertFalse(is_maximum_length(GeneralLFSR(size=4, taps=[3, 1], seed=0b0110)))
+        self.assertFalse(is_maximum_length(GeneralLFSR(size=4, taps=[3, 0], seed=0)))
+        self.assertTrue(is_maximum_length(GeneralLFSR(size=96, taps=[10, 9, 6, 0], seed=1)))
+        
+        # The state walk agrees for small sizes
+        for taps in ([3, 0], [3, 1], [2, 0], [3, 2, 1, 0]):
+            algebraic = is_maximum_length(GeneralLFSR(size=4, taps=taps, seed=1))
+            walked = is_maximum_length(GeneralLFSR(size=4, taps=taps, seed=1), max_checks=32)
+            self.assertEqual(algebraic, walked, taps)
+        
+        # Three distinct states, but the walk ends in the all-zero state
+        lfsr = GeneralLFSR(size=2, taps=[1, 1], seed=2)
+        self.assertEqual(find_cycle(lfsr), (2, 1))
+        self.assertFalse(is_maximum_length(lfsr))
+        self.assertFalse(is_maximum_length(lfsr, max_checks=8))
+    
+    def test_max_checks(self):
+        """Test that the state walk gives up after max_checks steps."""
+        lfsr = BasicLFSR()
+        self.assertTrue(is_maximum_length(lfsr, max_checks=15))
+        self.assertFalse(is_maximum_length(lfsr, max_checks=14))
+        self.assertEqual(find_cycle(lfsr, max_steps=15), (0, 15))
+        with self.assertRaises(ArithmeticError):
+            find_cycle(lfsr, max_steps=14)
+        
+        # The singular register of test_transient needs more than its
+        # period to close the cycle
+        lfsr = GeneralLFSR(size=8, taps=[6, 2], seed=0b10110011)
+        with self.assertRaises(ArithmeticError):
+            find_cycle(lfsr, max_steps=2)
+        self.assertFalse(is_maximum_length(lfsr, max_checks=1000))
+
+
+
+class TestFindCycle(unittest.TestCase):
+    """Test cases for constant-memory cycle detection."""
+    
+    def test_basic_lfsr(self):
+        """Test a duck-typed LFSR without taps."""
+        lfsr = BasicLFSR()
+        self.assertEqual(find_cycle(lfsr), (0, 15))
+        self.assertEqual(lfsr.get_state(), "0110")
+    
+    def test_transient(self):
+        """Test a singular LFSR whose states run into a cycle after a tail."""
+        # Feedback polynomial x^8 + x^6 + x^2, divisible by x^2
+        lfsr = GeneralLFSR(size=8, taps=[6, 2], seed=0b10110011)
+        tail, period = find_cycle(lfsr)
+        self.assertEqual(period, walk_period(lfsr))
+        self.assertEqual(tail, 2)
+        self.assertEqual(lfsr.state, 0b10110011)
+    
+    def test_distinguished_points(self):
+        """Test that distinguished points give the same answer."""
+        for seed in [1, 0b1011, 0b111111]:
+            lfsr = GeneralLFSR(size=6, taps=[5, 3, 3, 1], seed=seed)
+            expected = find_cycle(lfsr)
+            for bits in [0, 1, 3, 8]:
+                self.assertEqual(find_cycle(lfsr, distinguished_bits=bits), expected)
+    
+    def test_walk_restores_state(self):
+        """Test that the walking maximum-length check leaves the LFSR untouched."""
+        basic = BasicLFSR()
+        basic.next_bit()
+        self.assertTrue(is_maximum_length(basic))
+        self.assertEqual(basic.get_state(), "0011")
+        
+        general = GeneralLFSR(size=4, taps=[3, 0], seed=0b1001)
+        self.assertTrue(is_maximum_length(general, max_checks=30))
+        self.assertEqual(general.state, 0b1001)
+        self.assertFalse(is_maximum_length(general, max_checks=10))
+
+
+
+class TestPacking(unittest.TestCase):
+    """Test cases for bit packing and unpacking."""
+    
+    BITS = [1, 0, 1, 1, 0, 0, 0, 1, 1, 1, 0]
+    
+    def check_packing(self):
+        """Run the packing checks with whichever backend is active."""
+        self.assertEqual(bits_to_bytes(self.BITS), bytes([0b10110001, 0b11000000]))
+        self.assertEqual(bits_to_bytes([]), b'')
+        self.assertEqual(bytes_to_bits(b'\xb1\xc0', count=11), self.BITS)
+        self.assertEqual(bytes_to_bits(b'\x01'), [0, 0, 0, 0, 0, 0, 0, 1])
+        
+        # Any buffer of bit values, in either bit order
+        for source in [bytes(self.BITS), bytearray(self.BITS), memoryview(bytes(self.BITS))]:
+            self.assertEqual(pack_bits(source, bitorder='little'),
+                             bytes([0b10001101, 0b00000011]))
+        packed = pack_bits(self.BITS, bitorder='little')
+        self.assertEqual(unpack_bits(packed, bitorder='little', count=11), bytes(self.BITS))
+        
+        # Only the lowest bit of each value counts
+        self.assertEqual(bits_to_bytes([3, 2, 1]), bytes([0b10100000]))
+        
+        # Preallocated output buffers
+        out = bytearray(4)
+        self.assertEqual(pack_bits(self.BITS, out=out), 2)
+        self.assertEqual(out, bytearray([0b10110001, 0b11000000, 0, 0]))
+        bits_out = bytearray(16)
+        self.assertEqual(unpack_bits(b'\xb1\xc0', out=bits_out), 16)
+        self.assertEqual(list(bits_out[:11]), self.BITS)
+        with self.assertRaises(ValueError):
+            pack_bits(self.BITS, out=bytearray(1))
+        with self.assertRaises(ValueError):
+            pack_bits(self.BITS, bitorder='middle')
+    
+    def test_packing(self):
+        """Test packing with the default backend."""
+        self.check_packing()
+    
+    def test_packing_without_numpy(self):
+        """Test the pure Python fallback."""
+        with mock.patch.object(utils, '_numpy', lambda: None):
+            self.check_packing()
+    
+    def test_matches_next_bit(self):
+        """Test a long round trip against generated keystream."""
+        lfsr = GeneralLFSR(size=16, taps=[15, 14, 12, 3], seed=0xACE1)
+        bits = [lfsr.next_bit() for _ in range(10001)]
+        self.assertEqual(bytes_to_bits(bits_to_bytes(bits), count=10001), bits)
+
+
+if __name__ == '__main__':
+    unittest.main()